@@ -17,10 +17,16 @@ from collections import OrderedDict
 from logging import getLogger
 
 from PyIRC.signal import SignalStorage
-from PyIRC.casemapping import IRCString
+from PyIRC.casemapping import IRCString, casefolder
 from PyIRC.line import Line
 from PyIRC.extensions import get_extension
 
+try:
+    from sys import getrefcount
+except ImportError:
+    # Not CPython; events are never pooled
+    getrefcount = None  # pylint: disable=invalid-name
+
 
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -30,22 +36,44 @@ _logger = getLogger(__name__)  # pylint: disable=invalid-name
 class Event:
     """A basic event passed around extensions, wherein state can be set.
 
+    If event pooling is turned on (see :py:attr:`IRCBase.event_pool_size`),
+    events passed to handlers by :py:meth:`IRCBase.fire_event` may be reused
+    once the event is over, so handlers must not keep references to them.
+
     :ivar cancelled:
         The present event is "soft cancelled". Other events may undo this.
     """
 
+    __slots__ = ["eventname", "caller", "cancelled"]
+
     def __init__(self, eventname, caller, cancelled=False):
         self.eventname = eventname
         self.caller = caller
         self.cancelled = cancelled
 
 
+def _event_refs():
+    """Count the references getrefcount sees to an unshared local Event."""
+    event = Event(None, None)
+    return getrefcount(event)
+
+
+_EVENT_REFS = _event_refs() if getrefcount is not None else None
+
+
 # pylint: disable=too-many-instance-attributes
 class IRCBase(metaclass=ABCMeta):
 
     """The base IRC class meant to be used as a base for more concrete
     implementations.
 
+    :cvar event_pool_size:
+        Maximum number of spare events :py:meth:`fire_event` keeps for reuse.
+        This is 0 by default, so events are never reused. Pooling relies on
+        :py:func:`sys.getrefcount` to tell whether a handler kept an event,
+        which is a CPython implementation detail, so only turn it on where
+        that is known to work.
+
     :ivar connected:
         If True, we have connected to the server successfully.
 
@@ -54,6 +82,8 @@ class IRCBase(metaclass=ABCMeta):
         to send commands.
     """
 
+    event_pool_size = 0
+
     # pylint: disable=too-many-arguments
     def __init__(self, serverport, username, nick, gecos, extensions,
                  **kwargs):
@@ -85,6 +115,31 @@ class IRCBase(metaclass=ABCMeta):
         :key bindport:
             (address, port) to bind to.
 
+        :key encoding:
+            Encoding used to decode lines from the server (default UTF-8).
+
+        :key fallback_encoding:
+            Encoding used to decode lines that are invalid in ``encoding``,
+            such as latin-1 on older networks. If not set, invalid characters
+            are dropped.
+
+        :key max_line_length:
+            Maximum length of lines from the server in bytes. Longer lines
+            are discarded. Defaults to
+            :py:attr:`~PyIRC.io.framing.LineFramer.MAX_LENGTH`.
+
+        :key event_pool_size:
+            Number of spare events to keep for reuse by :py:meth:`fire_event`
+            (default :py:attr:`event_pool_size`, so no pooling).
+
+        :key event_pool_debug:
+            If True, log a warning whenever a handler keeps a reference to a
+            pooled event passed to it by :py:meth:`fire_event`.
+
+        :key handler_stats:
+            A :py:class:`~PyIRC.signal.HandlerStats` instance to time event
+            handlers with. Handlers are not timed by default.
+
         .. note::
             Keyword arguments may be used by extensions. kwargs is passed
             as-is to all extensions.
@@ -98,6 +153,8 @@ class IRCBase(metaclass=ABCMeta):
         self.ssl = kwargs.get("ssl", False)
         self.server_password = kwargs.get("server_password")
         self.bindport = kwargs.get("bindport")
+        self.encoding = kwargs.get("encoding", "utf-8")
+        self.fallback_encoding = kwargs.get("fallback_encoding")
 
         self.kwargs = kwargs
 
@@ -106,7 +163,12 @@ class IRCBase(metaclass=ABCMeta):
         self.registered = False
         self.case = IRCString.RFC1459
 
-        self.signals = SignalStorage()
+        self.signals = SignalStorage(kwargs.get("handler_stats"))
+        self.signals.casefold = self._str_casefold
+        self.event_pool_size = kwargs.get("event_pool_size",
+                                          self.event_pool_size)
+        self._event_pool = []
+        self._event_pool_debug = kwargs.get("event_pool_debug", False)
 
         # Extension manager system
         if not extensions:
@@ -218,6 +280,7 @@ class IRCBase(metaclass=ABCMeta):
             return
 
         self.case = case
+        self.signals.recompile()
         self.call_event("protocol", "case_change")
 
     def casefold(self, string):
@@ -226,7 +289,11 @@ class IRCBase(metaclass=ABCMeta):
         :param string:
             The string to casefold according to the IRC server semantics.
         """
-        return IRCString(self.case, string).casefold()
+        return IRCString(self.case, casefolder(self.case)(string))
+
+    def _str_casefold(self, string):
+        """Like :py:meth:`casefold`, but return a plain str."""
+        return casefolder(self.case)(string)
 
     def casecmp(self, string, other):
         """Do a caseless comparison of two strings.
@@ -238,7 +305,8 @@ class IRCBase(metaclass=ABCMeta):
         :param other:
             String to compare
         """
-        return self.casefold(string) == self.casefold(other)
+        fold = casefolder(self.case)
+        return fold(string) == fold(other)
 
     def get_extension(self, extension):
         """Get the instance of a given extension.
@@ -256,20 +324,59 @@ class IRCBase(metaclass=ABCMeta):
 
         :returns:
             An (:py:class:`~PyIRC.base.Event`, return values from events)
-            tuple.
+            tuple. If nothing is bound to the signal, the return values are
+            an empty list.
 
         .. warning::
             This does not preserve the Event instance for deferred calls.
         """
 
         signal_name = (hclass, event)
-        signal = self.signals.get_signal(signal_name)
+        signal = self.signals.dispatch.get(signal_name)
+        if signal is None:
+            # Don't create a signal for nothing
+            return (Event(signal_name, self), [])
+
         event = Event(signal_name, self)
+        return (event, signal.dispatch(event, *args, **kwargs))
+
+    def fire_event(self, hclass, event, *args, **kwargs):
+        """Call an (hclass, event) signal, for callers that don't need the
+        :py:class:`~PyIRC.base.Event` afterwards.
+
+        This is like :py:meth:`call_event`, but if :py:attr:`event_pool_size`
+        is set, once the signal has been called the Event is put back in a
+        small pool to be reused, unless a handler kept a reference to it.
 
-        if not signal.slots:
-            return (event, [])
+        :returns:
+            Return values from events.
+        """
+        signal_name = (hclass, event)
+        signal = self.signals.dispatch.get(signal_name)
+        if signal is None:
+            return []
+
+        if not self.event_pool_size or getrefcount is None:
+            return signal.dispatch(Event(signal_name, self), *args, **kwargs)
+
+        pool = self._event_pool
+        if pool:
+            event = pool.pop()
+            event.eventname = signal_name
+            event.cancelled = False
+        else:
+            event = Event(signal_name, self)
+
+        ret = signal.dispatch(event, *args, **kwargs)
 
-        return (event, signal.call(event, *args, **kwargs))
+        if getrefcount(event) > _EVENT_REFS:
+            if self._event_pool_debug:
+                _logger.warning("A handler kept a reference to the event for "
+                                "%r, which must not be reused", signal_name)
+        elif len(pool) < self.event_pool_size:
+            pool.append(event)
+
+        return ret
 
     # pylint: disable=inconsistent-return-statements
     def resume_event(self, hclass, event):
@@ -306,10 +413,10 @@ class IRCBase(metaclass=ABCMeta):
         """
         command = line.command
 
-        self.call_event("commands", command, line)
+        self.fire_event("commands", command, line)
 
     @abstractmethod
-    def send(self, command, params):
+    def send(self, command, params, tags=None):
         """Send a line out onto the wire.
 
         :param command:
@@ -319,14 +426,59 @@ class IRCBase(metaclass=ABCMeta):
             A Sequence of parameters to send with the command. Only the last
             parameter may contain spaces due to IRC framing format
             limitations.
+
+        :param tags:
+            An optional dict of IRCv3 message tags to send with the command.
+            The server must support the ``message-tags`` capability.
         """
-        line = Line(command=command, params=params)
-        event, results = self.call_event("commands_out", command, line)
-        if event.cancelled:
-            return None
+        line = Line(tags=tags, command=command, params=params)
+
+        # Most commands have nothing hooked, so don't bother with an Event
+        if self.signals.has_slots(("commands_out", command)):
+            event, _ = self.call_event("commands_out", command, line)
+            if event.cancelled:
+                return None
 
         return line
 
+    def send_template(self, template, param):
+        """Send a line built from a :py:class:`~PyIRC.line.LineTemplate`.
+
+        If nothing is bound to the command in ``commands_out``, the line is
+        written out without building a :py:class:`~PyIRC.line.Line` at all.
+        Otherwise, this is the same as :py:meth:`send`. Lines sent with
+        :py:meth:`send` are always built as a :py:class:`~PyIRC.line.Line`
+        first, so use a template for lines sent often.
+
+        :param template:
+            The :py:class:`~PyIRC.line.LineTemplate` to use.
+
+        :param param:
+            The last parameter of the line.
+        """
+        command = template.command
+        if self.signals.has_slots(("commands_out", command)):
+            self.send(command, template.params + [param], template.tags)
+        else:
+            self.send_bytes(template.format(param))
+
+    def send_bytes(self, data):
+        """Write raw lines out onto the wire.
+
+        This should only be used for data that has already been through
+        ``commands_out``, or is known not to need it.
+
+        Backends should override this to write the data as it is. By default,
+        each line is parsed and passed to :py:meth:`send`, so backends which
+        only implement :py:meth:`send` still work.
+
+        :param data:
+            Encoded lines to send, including their line endings.
+        """
+        for raw in data.splitlines():
+            line = Line.parse_bytes(raw)
+            self.send(line.command, line.params, line.tags)
+
     @abstractmethod
     def schedule(self, time, callback):
         """Schedule a callback for a specific time.
@@ -13,12 +13,19 @@ ASCII is simply casemapped as "abc..." <-> "ABC...".
 RFC1459 is the same as ASCII in terms of casefolding semantics, except that
 the characters {}|- are the lowercase equivalents of []\^. This is due to an
 historical wart in the protocol.
+
+The :py:class:`FoldedDict` and :py:class:`FoldedSet` containers store their
+keys casefolded once, as plain strings, alongside the keys as first given.
+:py:class:`IRCDict`, :py:class:`IRCDefaultDict` and :py:class:`IRCSet` are
+built on them, and hand out their keys as :py:class:`IRCString` instances.
 """
 
 
 from string import ascii_lowercase, ascii_uppercase
-from collections import UserString, UserDict
-from collections.abc import MutableSet
+from collections import UserString
+from functools import lru_cache
+from collections.abc import (ItemsView, Mapping, MutableMapping, MutableSet,
+                             ValuesView)
 
 
 # Translation tables
@@ -209,145 +216,436 @@ class IRCString(UserString):
         return "IRCString({})".format(super().__repr__())
 
 
-# This warning isn't really our fault.
-# pylint: disable=too-many-ancestors
-class IRCDict(UserDict):
+def _translator(upper, lower):
+    """Create a function folding strings by translating upper to lower.
+
+    Names are nearly always ASCII, so they are translated as bytes, which is
+    much faster than :py:meth:`str.translate`.
+    """
+    table = str.maketrans(upper, lower)
+    byte_table = bytes.maketrans(upper.encode(), lower.encode())
+
+    def fold(string):
+        try:
+            return string.encode("ascii").translate(byte_table).decode()
+        except UnicodeEncodeError:
+            return string.translate(table)
+
+    return fold
+
+
+FOLD_CACHE_SIZE = 16384
+"""Number of strings whose folded form is remembered for each casemapping."""
+
+
+def _memoize(fold):
+    """Wrap a fold function taking only str with a bounded cache.
+
+    Other strings, such as :py:class:`IRCString`, are converted to str first,
+    so their caseless comparisons never confuse the cache.
+    """
+    cached = lru_cache(maxsize=FOLD_CACHE_SIZE)(fold)
+
+    def memoized(string):
+        if string.__class__ is not str:
+            string = str(string)
+
+        return cached(string)
+
+    memoized.cache_info = cached.cache_info
+    memoized.cache_clear = cached.cache_clear
+    return memoized
+
+
+_FOLDERS = {
+    IRCString.ASCII: _memoize(_translator(ascii_uppercase, ascii_lowercase)),
+    IRCString.RFC1459: _memoize(_translator(RFC1459_UPPER, RFC1459_LOWER)),
+    IRCString.UNICODE: _memoize(str.casefold),
+}
 
-    """An IRC dictionary class, with caseless key lookup."""
+
+def casefolder(case):
+    r"""Return the function casefolding strings for a casemapping.
+
+    The function returns a plain :py:class:`str`, and is created only once for
+    each casemapping. It remembers the folded form of the last
+    :py:data:`FOLD_CACHE_SIZE` strings it was given, as the same nicks and
+    channels are folded over and over; ``cache_info()`` on the function gives
+    its statistics, as for :py:func:`functools.lru_cache`.
+
+    >>> fold = casefolder(IRCString.RFC1459)
+    >>> fold('Têst[]\^')
+    'têst{}|~'
+    >>> fold is casefolder(IRCString.RFC1459)
+    True
+    """
+    return _FOLDERS.get(case, _FOLDERS[IRCString.UNICODE])
+
+
+def rekey(containers, case, budget=None):
+    """Switch casemapped containers to a new casemapping, in place.
+
+    Each container is switched as a whole, in a single pass over its keys, and
+    keeps working with its old casemapping until then. Names are folded with
+    the memoized function from :py:func:`casefolder`, so a name found in many
+    containers is only folded once.
+
+    >>> users = IRCDict(IRCString.ASCII, {'Nick[a]': 1})
+    >>> seen = IRCSet(IRCString.ASCII, ['Nick[b]'])
+    >>> left = rekey([users, seen], IRCString.RFC1459, budget=1)
+    >>> left == [seen], users['nick{a}']
+    (True, 1)
+    >>> rekey(left, IRCString.RFC1459)
+    []
+    >>> 'NICK{B}' in seen
+    True
+
+    :param containers:
+        An iterable of containers with a ``rekey`` method, such as
+        :py:class:`FoldedDict`, :py:class:`FoldedSet`, and their subclasses.
+
+    :param case:
+        The new casemapping.
+
+    :param budget:
+        If given, stop once this many keys have been re-keyed, so a large
+        migration may be spread over several calls.
+
+    :returns:
+        A list of the containers not yet switched, to pass to the next call.
+    """
+    containers = list(containers)
+    done = 0
+    for i, container in enumerate(containers):
+        if budget is not None and done >= budget:
+            return containers[i:]
+
+        container.rekey(case)
+        done += len(container)
+
+    return []
+
+
+def _get_state(container):
+    """Get the state of a casemapped container for pickling.
+
+    The fold function is left out, as it can't be pickled; it is looked up
+    again from the casemapping by :py:func:`_set_state`.
+    """
+    state = {}
+    for cls in type(container).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "fold" and hasattr(container, name):
+                state[name] = getattr(container, name)
+
+    return state
+
+
+def _set_state(container, state):
+    """Restore the state of a casemapped container when unpickling."""
+    for name, value in state.items():
+        setattr(container, name, value)
+
+    container.fold = casefolder(container.case)
+
+
+class _FoldedItems(ItemsView):
+
+    """Items of a :py:class:`FoldedDict`, without refolding each key."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        mapping = self._mapping
+        names = mapping.names
+        for folded, value in mapping.data.items():
+            yield (mapping.key(names[folded]), value)
+
+
+class _FoldedValues(ValuesView):
+
+    """Values of a :py:class:`FoldedDict`, without refolding each key."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self._mapping.data.values())
+
+
+class FoldedDict(MutableMapping):
+
+    """A dictionary with caseless keys, stored casefolded.
+
+    Each key is folded once per operation, and stored as a plain string
+    alongside the key as it was first given (its display name). Iterating
+    yields the display names as plain strings.
+
+    >>> users = FoldedDict(IRCString.RFC1459)
+    >>> users['Nick[away]'] = 1
+    >>> users['nick{AWAY}']
+    1
+    >>> list(users)
+    ['Nick[away]']
+    >>> users.data
+    {'nick{away}': 1}
+
+    :ivar data:
+        The dictionary of casefolded keys to values.
+
+    :ivar names:
+        The dictionary of casefolded keys to display names.
+    """
+
+    __slots__ = ["case", "fold", "data", "names"]
 
     def __init__(self, case, *args, **kwargs):
         self.case = case
-        super().__init__(*args, **kwargs)
+        self.fold = casefolder(case)
+        self.data = {}
+        self.names = {}
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    @staticmethod
+    def key(name):
+        """Return the key handed out for a display name."""
+        return name
 
     def __getitem__(self, key):
-        if isinstance(key, str):
-            key = IRCString(self.case, key)
-        elif hasattr(key, 'convert'):
-            key = IRCString(self.case, key.convert(self.case))
+        try:
+            return self.data[self.fold(key)]
+        except KeyError:
+            return self.__missing__(key)
 
-        return super().__getitem__(key)
+    # pylint: disable=no-self-use
+    def __missing__(self, key):
+        raise KeyError(key)
 
     def __setitem__(self, key, value):
-        if isinstance(key, str):
-            key = IRCString(self.case, key)
-        elif hasattr(key, 'convert'):
-            key = IRCString(self.case, key.convert(self.case))
+        folded = self.fold(key)
+        data = self.data
+        if folded not in data:
+            self.names[folded] = str(key)
 
-        return super().__setitem__(key, value)
+        data[folded] = value
 
     def __delitem__(self, key):
-        if isinstance(key, str):
-            key = IRCString(self.case, key)
-        elif hasattr(key, 'convert'):
-            key = IRCString(self.case, key.convert(self.case))
-
-        return super().__delitem__(key)
+        folded = self.fold(key)
+        del self.data[folded]
+        del self.names[folded]
 
     def __contains__(self, key):
-        if isinstance(key, str):
-            key = IRCString(self.case, key)
-        elif hasattr(key, 'convert'):
-            key = IRCString(self.case, key.convert(self.case))
+        return self.fold(key) in self.data
 
-        return super().__contains__(key)
+    def __iter__(self):
+        return map(self.key, self.names.values())
 
-    def convert(self, case):
-        """Convert dictionary to new casemapping."""
-        new = IRCDict(case)
-        for key, value in self.items():
-            if isinstance(key, str):
-                key = IRCString(self.case, key)
-            elif hasattr(key, 'convert'):
-                key = IRCString(self.case, key.convert(self.case))
+    def __len__(self):
+        return len(self.data)
 
-            new[key] = value
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
 
-        return new
+        if len(self) != len(other):
+            return False
 
-    def __repr__(self):
-        return "IRCDict({}, {})".format(self.case, super().__repr__())
+        data = self.data
+        fold = self.fold
+        sentinel = object()
+        return all(data.get(fold(key), sentinel) == value for key, value in
+                   other.items())
 
+    def get(self, key, default=None):
+        return self.data.get(self.fold(key), default)
 
-# This warning isn't really our fault.
-# pylint: disable=too-many-ancestors
-class IRCDefaultDict(IRCDict):
+    def pop(self, key, *default):
+        folded = self.fold(key)
+        self.names.pop(folded, None)
+        try:
+            return self.data.pop(folded, *default)
+        except KeyError:
+            raise KeyError(key) from None
 
-    """Similar to the built in :py:class:`defaultdict`, but with the semantics
-    of :py:class:`~PyIRC.casemapping.IRCDict`."""
+    def clear(self):
+        self.data.clear()
+        self.names.clear()
 
-    def __init__(self, case, default, *args, **kwargs):
-        self.default = default
-        super().__init__(case, *args, **kwargs)
+    def items(self):
+        return _FoldedItems(self)
 
-    def __missing__(self, key):
-        if isinstance(key, str):
-            key = IRCString(self.case, key)
-        elif hasattr(key, 'convert'):
-            key = IRCString(self.case, key.convert(self.case))
+    def values(self):
+        return _FoldedValues(self)
 
-        ret = self.default()
-        self[key] = ret
-        return ret
+    def copy(self):
+        """Return a shallow copy of the dictionary."""
+        return self.convert(self.case)
+
+    def _empty(self, case):
+        """Return a new, empty dictionary of this kind."""
+        return type(self)(case)
+
+    def convert(self, case):
+        """Convert dictionary to new casemapping."""
+        new = self._empty(case)
+        names = self.names
+        for folded, value in self.data.items():
+            new[names[folded]] = value
+
+        return new
+
+    def rekey(self, case, remap=None):
+        """Switch the dictionary to a new casemapping, in place.
+
+        :param remap:
+            A mapping of every folded key to its new folded form, so keys
+            shared by several containers need only be folded once.
+        """
+        fold = casefolder(case)
+        names = self.names
+        if remap is None:
+            remap = {folded: fold(name) for folded, name in names.items()}
+
+        data = {remap[folded]: value for folded, value in self.data.items()}
+        self.names = {remap[folded]: name for folded, name in names.items()}
+        self.data = data
+        self.case = case
+        self.fold = fold
+
+    __getstate__ = _get_state
+    __setstate__ = _set_state
 
     def __repr__(self):
-        return "IRCDefaultDict({}, {}, {})".format(self.case, self.default,
-                                                   UserDict.__repr__(self))
+        return "{}({}, {!r})".format(type(self).__name__, self.case,
+                                     dict(self.items()))
+
 
+class FoldedSet(MutableSet):
 
-class IRCSet(MutableSet):
+    """A set with caseless members, stored casefolded.
 
-    """An IRC set class, with caseless members."""
+    Like :py:class:`FoldedDict`, each member is folded once per operation,
+    and iterating yields the members as first given.
+
+    >>> seen = FoldedSet(IRCString.ASCII, ['Nick'])
+    >>> 'NICK' in seen
+    True
+    >>> list(seen)
+    ['Nick']
+    """
+
+    __slots__ = ["case", "fold", "names"]
 
     def __init__(self, case, iterable=None):
         self.case = case
-        self.store = set()
-        if iterable is None:
-            iterable = set()
-        for item in iterable:
-            self.add(item)
+        self.fold = casefolder(case)
+        self.names = {}
+        if iterable is not None:
+            for item in iterable:
+                self.add(item)
 
-    def add(self, value):
-        if isinstance(value, str):
-            value = IRCString(self.case, value)
-        elif hasattr(value, 'convert'):
-            value = IRCString(self.case, value.convert(self.case))
+    @staticmethod
+    def key(name):
+        """Return the member handed out for a display name."""
+        return name
 
-        self.store.add(value)
+    def add(self, value):
+        folded = self.fold(value)
+        names = self.names
+        if folded not in names:
+            names[folded] = str(value)
 
     def discard(self, value):
-        if isinstance(value, str):
-            value = IRCString(self.case, value)
-        elif hasattr(value, 'convert'):
-            value = IRCString(self.case, value.convert(self.case))
+        self.names.pop(self.fold(value), None)
 
-        self.store.discard(value)
+    def clear(self):
+        self.names.clear()
 
     def convert(self, case):
         """Convert all members of this set to the specified case."""
-        new = IRCSet(case)
-        for item in self:
-            if isinstance(item, str):
-                item = IRCString(case, item)
-            elif hasattr(item, 'convert'):
-                item = item.convert(case)
+        return type(self)(case, self.names.values())
 
-            new.add(item)
+    def rekey(self, case, remap=None):
+        """Switch the set to a new casemapping, in place.
 
-        return new
+        :param remap:
+            A mapping of every folded member to its new folded form, as for
+            :py:meth:`FoldedDict.rekey`.
+        """
+        fold = casefolder(case)
+        names = self.names
+        if remap is None:
+            self.names = {fold(name): name for name in names.values()}
+        else:
+            self.names = {remap[folded]: name for folded, name in
+                          names.items()}
 
-    def __contains__(self, item):
-        if isinstance(item, str):
-            item = IRCString(self.case, item)
-        elif hasattr(item, 'convert'):
-            item = IRCString(self.case, item.convert(self.case))
+        self.case = case
+        self.fold = fold
 
-        return item in self.store
+    __getstate__ = _get_state
+    __setstate__ = _set_state
+
+    def __contains__(self, item):
+        return self.fold(item) in self.names
 
     def __iter__(self):
-        return iter(self.store)
+        return map(self.key, self.names.values())
 
     def __len__(self):
-        return len(self.store)
+        return len(self.names)
 
     def __repr__(self):
-        return "IRCSet({}, {})".format(self.case, super().__repr__())
+        return "{}({}, {!r})".format(type(self).__name__, self.case,
+                                     set(self))
+
+
+class IRCDict(FoldedDict):
+
+    """An IRC dictionary class, with caseless key lookup.
+
+    Keys are handed out as :py:class:`IRCString` instances, so they compare
+    casefolded.
+    """
+
+    __slots__ = ()
+
+    def key(self, name):
+        """Return the key handed out for a display name."""
+        return IRCString(self.case, name)
+
+
+class IRCDefaultDict(IRCDict):
+
+    """Similar to the built in :py:class:`defaultdict`, but with the semantics
+    of :py:class:`~PyIRC.casemapping.IRCDict`."""
+
+    __slots__ = ["default"]
+
+    def __init__(self, case, default, *args, **kwargs):
+        self.default = default
+        super().__init__(case, *args, **kwargs)
+
+    def __missing__(self, key):
+        ret = self.default()
+        self[key] = ret
+        return ret
+
+    def _empty(self, case):
+        return type(self)(case, self.default)
+
+    def __repr__(self):
+        return "IRCDefaultDict({}, {}, {!r})".format(self.case, self.default,
+                                                     dict(self.items()))
+
+
+class IRCSet(FoldedSet):
+
+    """An IRC set class, with caseless members.
+
+    Members are handed out as :py:class:`IRCString` instances.
+    """
+
+    __slots__ = ()
+
+    key = IRCDict.key
@@ -9,15 +9,24 @@
 
 In order to be taught about new types, this extension must know the
 numerics used for ban listing.
+
+It can also tell whether a user matches a channel's bans; see
+:py:meth:`BanTrack.is_banned`.
 """
 
 
+import re
+
 from collections import namedtuple
+from functools import lru_cache
 from logging import getLogger
 
 
+from PyIRC.casemapping import FoldedDict, casefolder, rekey
 from PyIRC.signal import event
 from PyIRC.extensions import BaseExtension
+from PyIRC.extensions.ircd.base import BaseServer
+from PyIRC.line import Hostmask, MaskSet
 from PyIRC.numerics import Numerics
 
 
@@ -27,17 +36,138 @@ _logger = getLogger(__name__)  # pylint: disable=invalid-name
 BanEntry = namedtuple("BanEntry", "string setter timestamp")
 
 
+@lru_cache(maxsize=256)
+def _glob_match(pattern):
+    """Create a function testing a casefolded string against an IRC glob."""
+    pattern = re.escape(pattern).replace('\\*', '.*').replace('\\?', '.')
+    return re.compile(pattern, re.DOTALL).fullmatch
+
+
+class BanMatcher:
+
+    """The masks of a list mode, compiled for matching.
+
+    Plain masks are kept in a :py:class:`~PyIRC.line.MaskSet`, so only the
+    few that could match a hostmask are checked. Extbans are parsed once,
+    when added.
+    """
+
+    __slots__ = ["masks", "extbans", "parse"]
+
+    def __init__(self, masks, casefold, parse):
+        """Compile the masks.
+
+        :param casefold:
+            Function used to casefold masks and hostmasks.
+
+        :param parse:
+            Function parsing an extban into a list of
+            :py:class:`~PyIRC.extensions.ircd.Extban`, or None if it cannot.
+        """
+        self.masks = MaskSet(casefold=casefold)
+        self.extbans = dict()
+        self.parse = parse
+        for mask in masks:
+            self.add(mask)
+
+    def add(self, mask):
+        """Add a mask or extban."""
+        try:
+            self.masks.add(mask)
+        except ValueError:
+            self.extbans[mask] = self.parse(mask)
+
+    def discard(self, mask):
+        """Remove a mask or extban, if present."""
+        self.masks.discard(mask)
+        self.extbans.pop(mask, None)
+
+
+# pylint: disable=too-many-ancestors
+class BanList(FoldedDict):
+
+    """The entries of a list mode, keyed by mask.
+
+    Masks are compared caselessly, and entries are kept in the order they
+    were first added, so adding, replacing, or removing an entry takes
+    constant time however long the list is.
+
+    :ivar matcher:
+        The :py:class:`BanMatcher` for the list, kept up to date once
+        :py:class:`BanTrack` has compiled it, or None.
+    """
+
+    __slots__ = ["matcher"]
+
+    def __init__(self, case, *args, **kwargs):
+        self.matcher = None
+        super().__init__(case, *args, **kwargs)
+
+    def entries(self):
+        """Iterate over the :py:class:`BanEntry` tuples, oldest first."""
+        return iter(self.data.values())
+
+    def add(self, entry):
+        """Add an entry, replacing any with the same mask in place.
+
+        :returns:
+            The replaced entry, or None if the mask is new.
+        """
+        folded = self.fold(entry.string)
+        data = self.data
+        old = data.get(folded)
+        if old is None:
+            self.names[folded] = entry.string
+
+        data[folded] = entry
+
+        matcher = self.matcher
+        if matcher is not None:
+            if old is not None:
+                matcher.discard(old.string)
+
+            matcher.add(entry.string)
+
+        return old
+
+    def discard(self, mask):
+        """Remove the entry for a mask.
+
+        :returns:
+            The removed entry, or None if there was none.
+        """
+        old = self.pop(mask, None)
+        if old is not None and self.matcher is not None:
+            self.matcher.discard(old.string)
+
+        return old
+
+    def rekey(self, case, remap=None):
+        super().rekey(case, remap)
+
+        # Compiled with the old casemapping
+        self.matcher = None
+
+
 class BanTrack(BaseExtension):
 
     """Track bans and other "list" modes.
 
     This augments the :py:class:`~PyIRC.extensions.channeltrack.ChannelTrack`
-    extension.
+    extension, and adds ``base.ban_track`` as itself as an alias for
+    ``get_extension("BanTrack").``. Each list mode in ``channel.modes`` is a
+    :py:class:`BanList`, and ``channel.list_generation`` is bumped whenever
+    any of them changes, so consumers can tell cheaply whether to look again.
 
     Although the actual reporting is done by
     :py:class:`~PyIRC.extensions.basetrack.BaseTrack`, this helps with
     the actual retrieval of the modes, and setting synched states.
 
+    Whether users match the lists can be checked with :py:meth:`is_banned`
+    and :py:meth:`list_match`. Each list is compiled the first time it is
+    checked, and then kept up to date as it changes. Extbans are parsed by
+    the loaded :py:mod:`~PyIRC.extensions.ircd` server extension, if any.
+
     .. note::
         Unless you are opped, your view of modes such as +eI may be limited
         and incomplete.
@@ -54,6 +184,12 @@ class BanTrack(BaseExtension):
                   Numerics.RPL_ENDOFREOPLIST.value: 'R',
                   Numerics.RPL_ENDOFAUTOOPLIST.value: 'w'}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Convenience method
+        self.base.ban_track = self
+
     @event("channel", "channel_create")
     def join(self, _, channel):
         """Initialise tracking for a new channel."""
@@ -66,48 +202,73 @@ class BanTrack(BaseExtension):
         modes = isupport.get("CHANMODES")[0]
 
         for mode in modes:
-            channel.modes[mode] = list()
+            channel.modes[mode] = BanList(self.case)
             channel.synced_list[mode] = False
 
         self.send("MODE", [channel.name, modes])
 
-    @event("modes", "mode_list")
-    def mode_list(self, _, setter, target, mode):
-        """Update a ban (or other list mode) entry."""
-        if mode.param is None:
+    @event("protocol", "case_change")
+    def case_change(self, _):
+        """Re-key the list modes of every channel."""
+        for channel in self.base.channel_track.channels.values():
+            lists = [modes for modes in channel.modes.values()
+                     if isinstance(modes, BanList)]
+            rekey(lists, self.case)
+            channel.list_generation += 1
+
+    @event("modes", "mode_change")
+    def mode_change(self, _, change):
+        """Update list mode entries, and check the list modes are synced
+        when we are opped."""
+        if not (change.list or change.prefix):
             return
 
         channeltrack = self.base.channel_track
-        channel = channeltrack.get_channel(target)
+        channel = channeltrack.get_channel(change.target)
         if not channel:
             # Not a channel or we don't know about it.
             return
 
-        modes = channel.modes[mode.mode]
+        for mode in change.list:
+            self.mode_list(channel, change.setter, mode)
 
-        entry = BanEntry(mode.param, setter, mode.timestamp)
+        if change.list and self.signals.has_slots(("channel",
+                                                   "members_banned")):
+            self.fire_event("channel", "members_banned", channel,
+                            self.banned_members(channel))
 
-        # Check for existing ban
-        for i, (string, _, _) in enumerate(list(modes)):
-            if self.casecmp(mode.param, string):
-                if mode.adding:
-                    # Update timestamp and setter
-                    _logger.debug("Replacing entry: %r -> %r",
-                                  modes[i], entry)
-                    modes[i] = entry
-                else:
-                    # Delete ban
-                    _logger.debug("Removing ban: %r", modes[i])
-                    del modes[i]
+        for mode in change.prefix:
+            self.mode_prefix(channel, mode)
 
+    def mode_list(self, channel, setter, mode):
+        """Update a ban (or other list mode) entry."""
+        if mode.param is None:
+            return
+
+        modes = channel.modes.get(mode.mode)
+        if not isinstance(modes, BanList):
+            # A list mode we were not told of in CHANMODES when we joined
+            modes = channel.modes[mode.mode] = BanList(self.case)
+
+        if mode.adding:
+            entry = BanEntry(mode.param, setter, mode.timestamp)
+            old = modes.add(entry)
+            if old is None:
+                _logger.debug("Adding entry: %r", entry)
+            else:
+                # Update timestamp and setter
+                _logger.debug("Replacing entry: %r -> %r", old, entry)
+        else:
+            old = modes.discard(mode.param)
+            if old is None:
                 return
 
-        _logger.debug("Adding entry: %r", entry)
-        modes.append(entry)
+            _logger.debug("Removing ban: %r", old)
+
+        channel.list_generation += 1
 
-    # pylint: disable=unused-argument
-    @event("modes", "mode_prefix")
-    def mode_prefix(self, _, setter, target, mode):
+    def mode_prefix(self, channel, mode):
+        """Request unsynced list modes if we are opped."""
         if mode.mode == 'v':
             # Voice, don't care
             return
@@ -117,12 +278,6 @@ class BanTrack(BaseExtension):
             # Not us, don't care
             return
 
-        channeltrack = self.base.channel_track
-        channel = channeltrack.get_channel(target)
-        if not channel:
-            # Not a channel or we don't know about it.
-            return
-
         if mode.adding:
             check = ''
             for sync, value in channel.synced_list.items():
@@ -130,7 +285,7 @@ class BanTrack(BaseExtension):
                     check += sync
 
             if check:
-                self.send("MODE", [target, check])
+                self.send("MODE", [channel.name, check])
 
     @event("commands", Numerics.RPL_ENDOFBANLIST)
     @event("commands", Numerics.RPL_ENDOFEXCEPTLIST)
@@ -156,3 +311,186 @@ class BanTrack(BaseExtension):
             return
 
         channel.synced_list[mode] = True
+
+    def extban_parse(self, mask):
+        """Parse an extban with the server extension.
+
+        :returns:
+            A list of :py:class:`~PyIRC.extensions.ircd.Extban`, or None if
+            the extban cannot be parsed.
+        """
+        for _, server in self.get_extension_subclasses(BaseServer):
+            try:
+                return server.extban_parse(mask)
+            except (NotImplementedError, AttributeError, IndexError,
+                    TypeError):
+                _logger.debug("Cannot parse extban: %s", mask)
+                return None
+
+        return None
+
+    def _matcher(self, modes):
+        """Get the compiled matcher of a list, compiling it if need be."""
+        matcher = modes.matcher
+        if matcher is None:
+            matcher = modes.matcher = BanMatcher(
+                (entry.string for entry in modes.entries()), modes.fold,
+                self.extban_parse)
+
+        return matcher
+
+    def _subject(self, user):
+        """Get the user record (if any) and the hostmask to match."""
+        if isinstance(user, str):
+            user_track = self.base.extensions.get("UserTrack")
+            found = user_track.get_user(user) if user_track else None
+            user = found if found is not None else Hostmask(nick=user)
+
+        if isinstance(user, Hostmask):
+            return None, user
+
+        return user, Hostmask(nick=user.nick, username=user.username,
+                              host=user.host)
+
+    # pylint: disable=too-many-return-statements
+    def extban_match(self, extban, channel, user, hostmask):
+        """Check an extban against a user.
+
+        Only the common extban types are understood: account (``a``),
+        channel (``c``), ban in another channel (``j``), operator (``o``),
+        realname (``r``), server (``s``), full mask (``x``), and TLS
+        (``z``).
+
+        :returns:
+            True or False, or None if it cannot be told.
+        """
+        ban = extban.ban
+        target = extban.target
+        if target is not None:
+            target = target[1:] if target.startswith(':') else target
+
+        fold = casefolder(self.case)
+
+        def glob(string):
+            if string is None:
+                return False
+
+            if not target:
+                return True
+
+            return _glob_match(fold(target))(fold(string)) is not None
+
+        if ban == 'a':
+            result = glob(getattr(user, "account", None))
+        elif ban == 'r':
+            result = glob(getattr(user, "gecos", None))
+        elif ban == 's':
+            result = glob(getattr(user, "server", None))
+        elif ban == 'x':
+            gecos = getattr(user, "gecos", None)
+            result = glob("{}#{}".format(hostmask, gecos) if gecos else None)
+        elif ban == 'o':
+            result = bool(getattr(user, "operator", None))
+        elif ban == 'z':
+            result = bool(getattr(user, "secure", None))
+        elif ban in 'cj' and target:
+            status = {'@': 'o', '+': 'v'}.get(target[0])
+            other = self.base.channel_track.get_channel(
+                target[1:] if status else target)
+            if other is None or other is channel:
+                return None
+
+            if ban == 'j':
+                # Extbans are not followed any further, as servers do.
+                result = self.list_match(other, 'b', hostmask, extbans=False)
+            else:
+                modes = other.users.get(hostmask.nick)
+                result = modes is not None and (status is None or
+                                                status in modes)
+        else:
+            return None
+
+        return result != extban.negative
+
+    def list_match(self, channel, mode, user, extbans=True):
+        """Check if a user matches any entry of a list mode.
+
+        :param channel:
+            A :py:class:`~PyIRC.extensions.channeltrack.Channel`, or the name
+            of a tracked channel.
+
+        :param mode:
+            The list mode to check, such as ``'b'`` or ``'I'``.
+
+        :param user:
+            A :py:class:`~PyIRC.extensions.usertrack.User`, a
+            :py:class:`~PyIRC.line.Hostmask`, or a nick looked up with
+            :py:class:`~PyIRC.extensions.usertrack.UserTrack` if loaded.
+
+        :param extbans:
+            Whether to check extbans. Ones that cannot be evaluated never
+            match.
+
+        Parts of the user's hostmask that aren't known, such as the username
+        and host of a user only seen in NAMES, only match mask parts that are
+        just ``*``. So ``nick!*@*`` matches such a user, but ``*!*@host``
+        does not.
+        """
+        if isinstance(channel, str):
+            channel = self.base.channel_track.get_channel(channel)
+            if channel is None:
+                return False
+
+        modes = channel.modes.get(mode)
+        if not modes or not isinstance(modes, BanList):
+            return False
+
+        user, hostmask = self._subject(user)
+        matcher = self._matcher(modes)
+        if matcher.masks.match_any(hostmask):
+            return True
+
+        if not extbans:
+            return False
+
+        for parsed in matcher.extbans.values():
+            if parsed and all(self.extban_match(extban, channel, user,
+                                                hostmask)
+                              for extban in parsed):
+                return True
+
+        return False
+
+    def is_banned(self, channel, user, mode='b'):
+        """Check if a user is banned from a channel.
+
+        A user is banned if they match a ban and no ban exception (+e).
+
+        :param mode:
+            The list mode holding the bans, such as ``'q'`` for quiets.
+
+        Other parameters are as for :py:meth:`list_match`.
+        """
+        return (self.list_match(channel, mode, user) and
+                not self.list_match(channel, 'e', user))
+
+    def banned_members(self, channel, mode='b'):
+        """Check every member of a channel against its bans at once.
+
+        When any list mode changes, this is done for the ``(channel,
+        members_banned)`` event if anything is bound to it.
+
+        :returns:
+            A list of the nicks of the members who are banned.
+        """
+        if isinstance(channel, str):
+            channel = self.base.channel_track.get_channel(channel)
+            if channel is None:
+                return []
+
+        modes = channel.modes.get(mode)
+        if not modes or not isinstance(modes, BanList):
+            return []
+
+        return [nick for nick in channel.users
+                if self.is_banned(channel, nick, mode)]
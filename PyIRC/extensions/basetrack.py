@@ -13,11 +13,13 @@ events for ingestion into the other tracking components.
 
 
 from collections import namedtuple
+from itertools import chain
 from logging import getLogger
 
 
 from PyIRC.signal import event
 from PyIRC.auxparse import mode_parse, prefix_parse, status_prefix_parse
+from PyIRC.casemapping import FoldedDict, casefolder
 from PyIRC.extensions import BaseExtension
 from PyIRC.line import Hostmask
 from PyIRC.numerics import Numerics
@@ -79,12 +81,408 @@ class Scope:
         self.cause = cause
 
 
+# This is a data class
+# pylint: disable=too-few-public-methods
+class ModeChange:
+
+    """All the channel modes changed by one line, grouped by class, passed to
+    receivers of ``(modes, mode_change)`` events.
+
+    Each group is a list of :py:class:`Mode` tuples, in the order the modes
+    were changed.
+
+    :param setter:
+        The :py:class:`~PyIRC.line.Hostmask` of whoever changed the modes.
+
+    :param target:
+        The channel whose modes changed.
+
+    :ivar prefix:
+        Status modes (anything in PREFIX), whose parameter is a nick.
+
+    :ivar list:
+        List modes, such as bans (the first group in CHANMODES).
+
+    :ivar key:
+        Modes taking a parameter only when set, such as ``+k``.
+
+    :ivar param:
+        Other modes taking a parameter, such as ``+l``.
+
+    :ivar normal:
+        Modes taking no parameter.
+    """
+
+    __slots__ = ["setter", "target", "prefix", "list", "key", "param",
+                 "normal"]
+
+    groups = ("prefix", "list", "key", "param", "normal")
+    """Names of the groups, in CHANMODES order after the status modes."""
+
+    def __init__(self, setter, target):
+        self.setter = setter
+        self.target = target
+        self.prefix = []
+        self.list = []
+        self.key = []
+        self.param = []
+        self.normal = []
+
+    def __bool__(self):
+        return bool(self.prefix or self.list or self.key or self.param or
+                    self.normal)
+
+
+# This is a data class
+# pylint: disable=too-few-public-methods
+class ScopeBurst:
+
+    """A batch of users entering a scope at once, passed to receivers of
+    ``(scope, user_burst_batch)`` events.
+
+    :param scope:
+        The channel the users are in.
+
+    :param targets:
+        A list of ``(hostmask, modes)`` tuples, one for each user, where
+        ``hostmask`` is the user's :py:class:`~PyIRC.line.Hostmask` and
+        ``modes`` is a set of the user's status modes on the channel.
+
+    :param cause:
+        The server that sent the burst.
+    """
+
+    __slots__ = ["scope", "targets", "cause"]
+
+    def __init__(self, scope, targets, cause=None):
+        self.scope = scope
+        self.targets = targets
+        self.cause = cause
+
+    def scopes(self):
+        """Yield a :py:class:`Scope` for each user, as sent with
+        ``(scope, user_burst)`` events."""
+        for hostmask, modes in self.targets:
+            modes = [(m, hostmask, True, None) for m in modes]
+            yield Scope(hostmask, self.scope, False, cause=self.cause,
+                        modes=modes)
+
+
+# This warning isn't really our fault.
+# pylint: disable=too-many-ancestors
+class _MemberMap(FoldedDict):
+
+    """One side of a :py:class:`Membership`: either the members of a channel,
+    or the channels of a user, mapped to status mode sets.
+
+    Changes are mirrored to the other side of the index. The map is only
+    entered into the index once something is added to it, and leaves it again
+    when it becomes empty.
+
+    Like the ``defaultdict`` it replaces, looking up a name that isn't present
+    gives an empty set of modes, though nothing is added. The mode sets are
+    frozen and shared, so to change someone's modes, assign a new set.
+    """
+
+    __slots__ = ["index", "name", "folded", "forward", "registered"]
+
+    def __init__(self, index, name, forward):
+        super().__init__(index.case)
+        self.index = index
+        self.name = name
+        self.folded = self.fold(name)
+        self.forward = forward
+        self.registered = False
+
+    def _put(self, folded, name, value):
+        """Set a value by its folded key."""
+        if folded not in self.data:
+            self.names[folded] = name
+
+        self.data[folded] = value
+
+    def _drop(self, folded):
+        """Remove a value by its folded key."""
+        del self.data[folded]
+        del self.names[folded]
+
+    def __setitem__(self, key, value):
+        index = self.index
+        if not self.registered:
+            index._register(self)
+
+        value = index.modeset(value)
+        key = str(key)
+        folded = self.fold(key)
+        self._put(folded, key, value)
+        index._side(not self.forward, folded, key)._put(self.folded,
+                                                         self.name, value)
+
+    def __missing__(self, key):
+        return self.index.modesets[frozenset()]
+
+    def __delitem__(self, key):
+        folded = self.fold(key)
+        self._drop(folded)
+
+        index = self.index
+        other = index._lookup(not self.forward, folded)
+        if other is not None:
+            other._drop(self.folded)
+            if not other.data:
+                index._unregister(other)
+
+        if not self.data:
+            index._unregister(self)
+
+    def pop(self, key, *default):
+        value = self.data.get(self.fold(key))
+        if value is None:
+            if default:
+                return default[0]
+
+            raise KeyError(key)
+
+        del self[key]
+        return value
+
+    def setdefault(self, key, default=frozenset()):
+        if key not in self:
+            self[key] = default
+
+        return self.data[self.fold(key)]
+
+    def _empty(self, case):
+        return FoldedDict(case)
+
+    def rekey(self, case, remap=None):
+        super().rekey(case, remap)
+        self.folded = self.fold(self.name)
+
+    def __repr__(self):
+        return "{}({!r}, {!r})".format(type(self).__name__, self.name,
+                                       dict(self.items()))
+
+
+class Membership:
+
+    """An index of who is in which channel, and their status modes there.
+
+    Each ``(channel, user)`` pair maps to a frozen set of status modes, with
+    both directions indexed, so changes affecting one channel or one user
+    take time proportional to that channel's members or that user's channels,
+    rather than to everything tracked.
+
+    Mode sets are replaced rather than modified. Equal sets are shared, so
+    the handful of status mode combinations in use are only stored once.
+
+    :param case:
+        The casemapping of the connection.
+
+    :ivar channels:
+        Mapping of channel names to mappings of members to their modes.
+
+    :ivar users:
+        Mapping of nicks to mappings of channels to their modes.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.channels = FoldedDict(case)
+        self.users = FoldedDict(case)
+        self.modesets = {frozenset(): frozenset()}
+
+    def modeset(self, modes):
+        """Return the shared frozen set equal to modes."""
+        modes = frozenset(modes)
+        return self.modesets.setdefault(modes, modes)
+
+    def _lookup(self, forward, folded):
+        """Return the registered map for a folded name, or None."""
+        return (self.channels if forward else self.users).data.get(folded)
+
+    def _side(self, forward, folded, name):
+        """Return the registered map for a folded name, creating it if
+        needed."""
+        side = self._lookup(forward, folded)
+        if side is None:
+            side = _MemberMap(self, name, forward)
+            self._register(side)
+
+        return side
+
+    def _register(self, side):
+        """Enter a map into the index."""
+        index = self.channels if side.forward else self.users
+        existing = index.data.get(side.folded)
+        if existing is not None:
+            # Another view got there first, so share its storage
+            existing.data.update(side.data)
+            existing.names.update(side.names)
+            side.data = existing.data
+            side.names = existing.names
+        else:
+            index.data[side.folded] = side
+            index.names[side.folded] = side.name
+
+        side.registered = True
+
+    def _unregister(self, side):
+        """Remove a map from the index."""
+        index = self.channels if side.forward else self.users
+        existing = index.data.get(side.folded)
+        if existing is not None and existing.data is side.data:
+            existing.registered = False
+            del index.data[side.folded]
+            del index.names[side.folded]
+
+        side.registered = False
+
+    def members(self, channel):
+        """Return a mapping of a channel's members to their modes.
+
+        The mapping stays valid for the life of the channel, and changes to it
+        are reflected in :py:meth:`channels_of`.
+        """
+        side = self.channels.get(channel)
+        if side is None:
+            side = _MemberMap(self, str(channel), True)
+
+        return side
+
+    def channels_of(self, nick):
+        """Return a mapping of a user's channels to their modes there.
+
+        The mapping stays valid until the user leaves their last channel, and
+        changes to it are reflected in :py:meth:`members`.
+        """
+        side = self.users.get(nick)
+        if side is None:
+            side = _MemberMap(self, str(nick), False)
+
+        return side
+
+    def get(self, channel, nick):
+        """Return a user's frozen mode set on a channel, or None if they are
+        not on it."""
+        side = self.channels.get(channel)
+        if side is None:
+            return None
+
+        return side.get(nick)
+
+    def add(self, channel, nick, modes=()):
+        """Add a user to a channel, replacing any modes they had."""
+        channel = str(channel)
+        self._side(True, self.channels.fold(channel), channel)[nick] = modes
+
+    def discard(self, channel, nick):
+        """Remove a user from a channel, if they are on it."""
+        side = self.channels.get(channel)
+        if side is not None and nick in side:
+            del side[nick]
+
+    def _remove(self, side):
+        """Remove a map and everything in it from the index."""
+        self._unregister(side)
+
+        folded = side.folded
+        index = self.users if side.forward else self.channels
+        for other in side.data:
+            other = index.data.get(other)
+            if other is None:
+                continue
+
+            other._drop(folded)
+            if not other.data:
+                self._unregister(other)
+
+        side.data.clear()
+        side.names.clear()
+
+    def remove_channel(self, channel):
+        """Remove a channel and all of its members."""
+        side = self.channels.get(channel)
+        if side is not None:
+            self._remove(side)
+
+    def remove_user(self, nick):
+        """Remove a user from all of their channels."""
+        side = self.users.get(nick)
+        if side is not None:
+            self._remove(side)
+
+    def rename(self, oldnick, newnick):
+        """Move a user's memberships to a new nick."""
+        users = self.users
+        side = users.get(oldnick)
+        if side is None:
+            return
+
+        oldfold = side.folded
+        del users.data[oldfold]
+        del users.names[oldfold]
+
+        side.name = newnick = str(newnick)
+        side.folded = newfold = side.fold(newnick)
+        users.data[newfold] = side
+        users.names[newfold] = newnick
+
+        channels = self.channels.data
+        for channel in side.data:
+            other = channels[channel]
+            modes = other.data.pop(oldfold)
+            del other.names[oldfold]
+            other.data[newfold] = modes
+            other.names[newfold] = newnick
+
+    def clear(self):
+        """Forget all memberships."""
+        for side in chain(self.channels.values(), self.users.values()):
+            side.registered = False
+
+        self.channels.clear()
+        self.users.clear()
+
+    def rekey(self, case):
+        """Switch the index to a new casemapping, in place.
+
+        Each channel and nick is folded once, and every map is then re-keyed
+        from the old folded forms to the new ones.
+        """
+        fold = casefolder(case)
+        channels = {folded: fold(name) for folded, name in
+                    self.channels.names.items()}
+        users = {folded: fold(name) for folded, name in
+                 self.users.names.items()}
+
+        for side in self.channels.values():
+            FoldedDict.rekey(side, case, users)
+            side.folded = channels[side.folded]
+
+        for side in self.users.values():
+            FoldedDict.rekey(side, case, channels)
+            side.folded = users[side.folded]
+
+        self.channels.rekey(case, channels)
+        self.users.rekey(case, users)
+        self.case = case
+
+    def __repr__(self):
+        return "Membership({!r})".format(self.channels)
+
+
 class BaseTrack(BaseExtension):
 
     """Base tracking extension, providing events for other tracking extensions.
 
     This extension adds ``base.base_track`` as itself as an alias for
     ``get_extension("BaseTrack").``.
+
+    :ivar membership:
+        The :py:class:`Membership` index of the channels we are in, shared by
+        the tracking extensions. It is updated before events for users joining
+        or changing status are fired, and after events for users leaving.
     """
 
     caps = {
@@ -103,15 +501,31 @@ class BaseTrack(BaseExtension):
                   Numerics.RPL_REOPLIST.value: 'R'}
     """List numeric to mode char mapping."""
 
-    requires = ["ISupport"]
+    requires = ["BasicRFC", "ISupport"]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.base.base_track = self
 
+        self.membership = Membership(self.case)
+
         self.sent_protoctl = False
 
+    def is_us(self, hostmask):
+        """Return whether hostmask is ourselves."""
+        return self.casecmp(hostmask.nick, self.base.basic_rfc.nick)
+
+    @event("protocol", "case_change")
+    def case_change(self, _):
+        """Convert the membership index to the new casemapping."""
+        self.membership.rekey(self.case)
+
+    @event("link", "disconnected")
+    def close(self, _):
+        """Forget all memberships since we are disconnected."""
+        self.membership.clear()
+
     @event("commands", "JOIN")
     def join(self, _, line):
         """Fire a (scope, user_join) event for users joining channels."""
@@ -128,12 +542,19 @@ class BaseTrack(BaseExtension):
             if len(params) > 2:
                 gecos = params[2]
 
+        self.membership.add(channel, hostmask.nick)
+
         scope = Scope(hostmask, channel, False, gecos=gecos, account=account)
-        self.call_event("scope", "user_join", scope)
+        self.fire_event("scope", "user_join", scope)
 
     @event("commands", Numerics.RPL_NAMREPLY)
     def names(self, _, line):
-        """Handle bursting of new users from NAMES."""
+        """Handle bursting of new users from NAMES.
+
+        A ``(scope, user_burst_batch)`` event is fired for the whole line, and
+        then, only if anything is bound to it, a ``(scope, user_burst)`` event
+        for each user.
+        """
         params = line.params
 
         channel = params[2]
@@ -141,18 +562,26 @@ class BaseTrack(BaseExtension):
         isupport = self.base.isupport
         prefix = prefix_parse(isupport.get("PREFIX"))
 
+        targets = []
         for hostmask in params[3].split(' '):
             if not hostmask:
                 continue
 
             modes, hostmask = status_prefix_parse(hostmask, prefix)
-            hostmask = Hostmask.parse(hostmask)
+            targets.append((Hostmask.parse(hostmask), modes))
 
-            modes = [(m, hostmask, True, None) for m in modes]
+        membership = self.membership
+        if channel in membership.channels:
+            add = membership.members(channel).__setitem__
+            for target, modes in targets:
+                add(target.nick, modes)
 
-            scope = Scope(
-                hostmask, channel, False, cause=line.hostmask, modes=modes)
-            self.call_event("scope", "user_burst", scope)
+        burst = ScopeBurst(channel, targets, line.hostmask)
+        self.fire_event("scope", "user_burst_batch", burst)
+
+        if self.signals.has_slots(("scope", "user_burst")):
+            for scope in burst.scopes():
+                self.fire_event("scope", "user_burst", scope)
 
     @event("commands", "PART")
     def part(self, _, line):
@@ -164,7 +593,8 @@ class BaseTrack(BaseExtension):
 
         scope = Scope(line.hostmask, channel, True, reason=reason,
                       cause=line.hostmask)
-        self.call_event("scope", "user_part", scope)
+        self.fire_event("scope", "user_part", scope)
+        self.leave(scope)
 
     @event("commands", "KICK")
     def kick(self, _, line):
@@ -177,7 +607,16 @@ class BaseTrack(BaseExtension):
 
         scope = Scope(target, channel, True, reason=reason,
                       cause=line.hostmask)
-        self.call_event("scope", "user_kick", scope)
+        self.fire_event("scope", "user_kick", scope)
+        self.leave(scope)
+
+    def leave(self, scope):
+        """Remove a user who left a channel from the membership index,
+        along with the whole channel if it was us."""
+        if self.is_us(scope.target):
+            self.membership.remove_channel(scope.scope)
+        else:
+            self.membership.discard(scope.scope, scope.target.nick)
 
     @event("commands", "QUIT")
     def quit(self, _, line):
@@ -189,12 +628,24 @@ class BaseTrack(BaseExtension):
         # TODO - KILL events
         scope = Scope(line.hostmask, None, True, reason=reason,
                       cause=line.hostmask)
-        self.call_event("scope", "user_quit", scope)
+        self.fire_event("scope", "user_quit", scope)
+        self.membership.remove_user(line.hostmask.nick)
+
+    @event("commands", "NICK", priority=-1000)
+    def nick(self, _, line):
+        """Move a user's memberships to their new nick, before anything else
+        sees the change."""
+        self.membership.rename(line.hostmask.nick, line.params[0])
 
     @event("commands", Numerics.RPL_CHANNELMODEIS)
     @event("commands", "MODE")
     def mode(self, _, line):
-        """Offer an easy to use interface for mode."""
+        """Offer an easy to use interface for mode.
+
+        A ``(modes, mode_change)`` event is fired for the whole line, and
+        then, for each mode, a ``(modes, mode_*)`` event if anything is bound
+        to it.
+        """
         isupport = self.base.isupport
         modegroups = isupport.get("CHANMODES")
         prefix = prefix_parse(isupport.get("PREFIX"))
@@ -212,21 +663,56 @@ class BaseTrack(BaseExtension):
 
         gen = mode_parse(modes, params, modegroups, prefix)
         prefix = prefix.mode_to_prefix
+
+        change = ModeChange(line.hostmask, target)
+        ordered = []
         for mode, param, adding in gen:
             if mode in prefix:
+                group = change.prefix
                 mode_call = "mode_prefix"
             elif mode in modegroups[0]:
+                group = change.list
                 mode_call = "mode_list"
             elif mode in modegroups[1]:
+                group = change.key
                 mode_call = "mode_key"
             elif mode in modegroups[2]:
+                group = change.param
                 mode_call = "mode_param"
             else:
+                group = change.normal
                 mode_call = "mode_normal"
 
-            # TODO - aggregation
             mode = Mode(mode, param, adding, None)
-            self.call_event("modes", mode_call, line.hostmask, target, mode)
+            group.append(mode)
+            ordered.append((mode_call, mode))
+
+        if not ordered:
+            return
+
+        membership = self.membership
+        if change.prefix and target in membership.channels:
+            members = membership.members(target)
+            for mode in change.prefix:
+                # Parse into hostmask in case of usernames-in-host
+                nick = Hostmask.parse(mode.param).nick
+
+                # Missing users can happen from override or ChanServ guard off
+                modes = set(members.get(nick, ()))
+                if mode.adding:
+                    modes.add(mode.mode)
+                else:
+                    modes.discard(mode.mode)
+
+                members[nick] = modes
+
+        self.fire_event("modes", "mode_change", change)
+
+        has_slots = self.signals.has_slots
+        for mode_call, mode in ordered:
+            if has_slots(("modes", mode_call)):
+                self.fire_event("modes", mode_call, line.hostmask, target,
+                                mode)
 
     # pylint: disable=unused-argument
     @event("commands", Numerics.RPL_ENDOFMOTD)
@@ -275,6 +761,7 @@ class BaseTrack(BaseExtension):
         modechar = self.mode_chars[caller.eventname[1]]
         params = line.params
 
+        timestamp = None
         try:
             target = params[1]
             mask = params[2]
@@ -287,11 +774,15 @@ class BaseTrack(BaseExtension):
                     timestamp = int(params[4])
             else:
                 setter = line.hostmask
-                timestamp = None
         except ValueError as exc:
             _logger.warning("Bogus list mode received: %s (exception: %s)",
                             modechar, exc)
             return
 
         mode = Mode(modechar, mask, True, timestamp)
-        self.call_event("modes", "mode_list", setter, target, mode)
+        change = ModeChange(setter, target)
+        change.list.append(mode)
+        self.fire_event("modes", "mode_change", change)
+
+        if self.signals.has_slots(("modes", "mode_list")):
+            self.fire_event("modes", "mode_list", setter, target, mode)
@@ -16,8 +16,9 @@ from logging import getLogger
 
 
 from PyIRC.signal import event
-from PyIRC.casemapping import IRCDict, IRCDefaultDict
+from PyIRC.casemapping import IRCDict, rekey
 from PyIRC.extensions import BaseExtension
+from PyIRC.extensions.basetrack import Membership
 from PyIRC.line import Hostmask
 from PyIRC.numerics import Numerics
 
@@ -29,17 +30,30 @@ _logger = getLogger(__name__)  # pylint: disable=invalid-name
 # pylint: disable=too-many-instance-attributes,too-few-public-methods
 class Channel:
 
-    """A channel entity."""
+    """A channel entity.
 
-    def __init__(self, case, name, **kwargs):
+    Channels are slotted to keep memory use down. Other attributes may still
+    be set on them, as before, at the cost of a ``__dict__`` for each channel
+    they are set on.
+    """
+
+    __slots__ = ["name", "modes", "topic", "topictime", "topicwho",
+                 "timestamp", "url", "synced_list", "list_generation",
+                 "membership", "__dict__", "__weakref__"]
+
+    def __init__(self, case, name, membership=None, **kwargs):
         """Store the data for a channel.
 
         Unknown values are stored as None, whereas empty ones are stored as
         '' or 0, so take care in comparisons involving values from this class.
 
-        :key name:
+        :param name:
             Name of the channel, not casemapped.
 
+        :param membership:
+            The :py:class:`~PyIRC.extensions.basetrack.Membership` index
+            holding the channel's users. A private one is used if not given.
+
         :key topic:
             The channel topic.
 
@@ -50,13 +64,22 @@ class Channel:
             Who set the topic, as a freeform string.
 
         :key users:
-            A mapping containing user to their channel status modes.
+            A mapping of users to their channel status modes, added to the
+            membership index.
 
         :key timestamp:
             Timestamp of the channel (channel creation), in Unix time.
 
         :key url:
             URL of the channel, sent on some IRC servers.
+
+        :key synced_list:
+            Mapping of list modes to whether they have been fully received,
+            set by :py:class:`~PyIRC.extensions.bantrack.BanTrack`.
+
+        :key list_generation:
+            Counter bumped by :py:class:`~PyIRC.extensions.bantrack.BanTrack`
+            whenever a list mode changes.
         """
         if name is None:
             raise ValueError("name must not be None")
@@ -68,7 +91,27 @@ class Channel:
         self.topicwho = kwargs.get("topicwho", None)
         self.timestamp = kwargs.get("timestamp", None)
         self.url = kwargs.get("url", None)
-        self.users = kwargs.get("users", IRCDefaultDict(case, set))
+        self.synced_list = kwargs.get("synced_list", None)
+        self.list_generation = kwargs.get("list_generation", 0)
+
+        if membership is None:
+            membership = Membership(case)
+        self.membership = membership
+
+        users = kwargs.get("users")
+        if users:
+            self.users.update(users)
+
+    @property
+    def users(self):
+        """Mapping of the channel's users to frozen sets of their status
+        modes, as held by the membership index.
+
+        The mode sets are read-only and shared between users; assign a new
+        set to change a user's modes. Users not in the channel have an empty
+        set, as when this was a ``defaultdict``.
+        """
+        return self.membership.members(self.name)
 
     def __repr__(self):
         keys = ("name", "modes", "topic", "topictime", "topicwho", "timestamp",
@@ -141,10 +184,12 @@ class ChannelTrack(BaseExtension):
         if channel is None:
             _logger.debug("Adding channel: %s", name)
 
-            channel = Channel(self.case, name, **kwargs)
+            channel = Channel(self.case, name,
+                              membership=self.base.base_track.membership,
+                              **kwargs)
             self.channels[name] = channel
 
-        self.call_event("channel", "channel_create", channel)
+        self.fire_event("channel", "channel_create", channel)
 
         return channel
 
@@ -159,14 +204,13 @@ class ChannelTrack(BaseExtension):
         if channel is None:
             return
 
-        self.call_event("channel", "channel_delete", channel)
+        self.fire_event("channel", "channel_delete", channel)
 
         del self.channels[name]
 
     @event("protocol", "case_change")
     def case_change(self, _):
-        self.channels = self.channels.convert(self.case)
-        self.mode_timers = self.mode_timers.convert(self.case)
+        rekey((self.channels, self.mode_timers), self.case)
 
     @event("link", "disconnected")
     def close(self, _):
@@ -177,74 +221,53 @@ class ChannelTrack(BaseExtension):
             except ValueError:
                 pass
 
-    # pylint: disable=unused-argument
-    @event("modes", "mode_prefix")
-    def prefix(self, _, setter, target, mode):
-        # Parse into hostmask in case of usernames-in-host
-        channel = self.get_channel(target)
-        if channel is None:
-            _logger.warning("Got a PREFIX event for an unknown channel: %s",
-                            target)
+    @event("modes", "mode_change")
+    def mode_change(self, _, change):
+        """Update a channel's modes.
+
+        The status of its users is kept in the membership index by
+        :py:class:`~PyIRC.extensions.basetrack.BaseTrack`.
+        """
+        if not (change.prefix or change.key or change.param or change.normal):
             return
 
-        hostmask = Hostmask.parse(mode.param)
-        if mode.adding:
-            channel.users[hostmask.nick].add(mode.mode)
-        else:
-            channel.users[hostmask.nick].discard(mode.mode)
-
-    @event("modes", "mode_key")
-    @event("modes", "mode_param")
-    @event("modes", "mode_normal")
-    def modes(self, _, setter, target, mode):
-        """Update a channel's modes."""
-        channel = self.get_channel(target)
+        channel = self.get_channel(change.target)
         if channel is None:
+            if change.prefix:
+                _logger.warning("Got a PREFIX event for an unknown channel: "
+                                "%s", change.target)
             return
 
-        if mode.adding:
-            channel.modes[mode.mode] = mode.param
-        else:
-            channel.modes.pop(mode.mode, None)
+        modes = channel.modes
+        for group in (change.key, change.param, change.normal):
+            for mode in group:
+                if mode.adding:
+                    modes[mode.mode] = mode.param
+                else:
+                    modes.pop(mode.mode, None)
 
     @event("scope", "user_join")
-    def join(self, caller, scope):
-        """Handle a user (possibly us) joining a channel."""
+    def join(self, _, scope):
+        """Handle us joining a channel."""
         # JOIN event
         basicrfc = self.base.basic_rfc
         if self.casecmp(scope.target.nick, basicrfc.nick):
             # We're joining
             self.add_channel(scope.scope)
 
-        self.burst(caller, scope)
-
-    @event("scope", "user_burst")
-    def burst(self, _, scope):
-        """Add the users being bursted to the channel."""
-        # NAMES event
-        channel = self.get_channel(scope.scope)
-        if channel is None:
-            return
-
-        user = scope.target.nick
-
-        if user not in channel.users:
-            channel.users[user] = set()
-
-        modes = {m[0] for m in scope.modes} if scope.modes else set()
-        channel.users[user] = modes
-
     @event("scope", "user_part")
     @event("scope", "user_kick")
     def part(self, _, scope):
-        """Remove a user from a channel."""
+        """Remove a channel when we leave it.
+
+        Users leaving are removed from the channel by
+        :py:class:`~PyIRC.extensions.basetrack.BaseTrack`.
+        """
         channel = self.get_channel(scope.scope)
         assert channel
 
-        user = scope.target.nick
-
         basicrfc = self.base.basic_rfc
-        if self.casecmp(user, basicrfc.nick):
+        if self.casecmp(scope.target.nick, basicrfc.nick):
             # We are leaving
             self.remove_channel(channel.name)
             timer = self.mode_timers.pop(channel.name, None)
@@ -253,19 +276,6 @@ class ChannelTrack(BaseExtension):
                     self.unschedule(timer)
                 except ValueError:
                     pass
-            return
-
-        _logger.debug("users before deletion: %r", channel.users)
-
-        del channel.users[user]
-
-    @event("scope", "user_quit")
-    def quit(self, _, scope):
-        """Remove a user from all the channels which they were joined."""
-        user = scope.target.nick
-
-        for channel in self.channels.values():
-            channel.users.pop(user, None)
 
     @event("commands", Numerics.RPL_TOPIC)
     @event("commands", "TOPIC")
@@ -352,17 +362,3 @@ class ChannelTrack(BaseExtension):
         timer = self.schedule(5, partial(self.send, "MODE",
                                          [line.params[1]]))
         self.mode_timers[channel.name] = timer
-
-    @event("commands", "NICK")
-    def nick(self, _, line):
-        """Rename a user in all channels."""
-        oldnick = line.hostmask.nick
-        newnick = line.params[-1]
-
-        # Change the nick in all channels
-        for channel in self.channels.values():
-            if oldnick not in channel.users:
-                continue
-
-            # Change the nick
-            channel.users[newnick] = channel.users.pop(oldnick)
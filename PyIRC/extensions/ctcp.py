@@ -62,7 +62,7 @@ class CTCP(BaseExtension):
             return
 
         command = ctcp.command
-        self.call_event("commands_ctcp", command, ctcp, line)
+        self.fire_event("commands_ctcp", command, ctcp, line)
 
     @event("commands", "NOTICE")
     def nctcp_in(self, _, line):
@@ -72,7 +72,7 @@ class CTCP(BaseExtension):
             return
 
         command = ctcp.command
-        self.call_event("commands_ctcp", command, ctcp, line)
+        self.fire_event("commands_ctcp", command, ctcp, line)
 
     # pylint: disable=unused-argument
     @event("commands_ctcp", "PING")
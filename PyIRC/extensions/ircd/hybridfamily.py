@@ -642,8 +642,9 @@ class CharybdisServer(RatboxServer):
             ban = string[1]
             target = string[2:] if len(string) > 2 else None
 
-        isupport = self.base.isupport
-        _, _, bans = isupport.get("EXTBAN").partition(",")
+        # Parsed as (prefix, types)
+        extban = self.base.isupport.get("EXTBAN")
+        bans = extban[1] if extban else ''
 
         if not ban in bans:
             _logger.warning("Unknown extban received: %s", string[1])
@@ -43,7 +43,7 @@ class ISupport(BaseExtension):
     """
 
     defaults = {
-        "PREFIX": ['o', 'v', '@', '+'],
+        "PREFIX": "(ov)@+",
         "CHANTYPES": '#&!+',  # Old channel types
         "NICKLEN": "8",  # Old servers
         "CASEMAPPING": "RFC1459",  # The (Shipped) Gold Standard
@@ -101,9 +101,10 @@ class ISupport(BaseExtension):
             return
 
         values = isupport_parse(line.params[1:-1])
-        if 'CASEMAPPING' in values:
-            self.case_change()
-
         self.supported.update(values)
 
         self.get.cache_clear()
+
+        if 'CASEMAPPING' in values:
+            # Only once the new value can be seen
+            self.case_change()
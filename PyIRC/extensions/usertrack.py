@@ -12,8 +12,12 @@ status, and the like.
 """
 
 
-from itertools import chain
+from abc import ABCMeta, abstractmethod
+from collections import deque, namedtuple
+from math import ceil
 from random import randint
+from sys import intern
+from time import monotonic
 from functools import partial
 from logging import getLogger
 
@@ -21,8 +25,9 @@ from logging import getLogger
 from PyIRC.signal import event
 from PyIRC.auxparse import (prefix_parse, who_flag_parse, status_prefix_parse,
                             userhost_parse)
-from PyIRC.casemapping import IRCDict, IRCDefaultDict, IRCSet
+from PyIRC.casemapping import IRCDict, IRCDefaultDict, IRCSet, rekey
 from PyIRC.extensions import BaseExtension
+from PyIRC.extensions.basetrack import Membership
 from PyIRC.line import Hostmask
 from PyIRC.numerics import Numerics
 
@@ -30,21 +35,647 @@ from PyIRC.numerics import Numerics
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
 
 
+def _intern(string):
+    """Intern a string shared by many users, such as a server name."""
+    return intern(string) if string else string
+
+
+WhoSyncProgress = namedtuple("WhoSyncProgress",
+                             "synced queued outstanding eta")
+"""Progress of syncing channels with WHO.
+
+:attr synced:
+    Number of channels synced so far.
+
+:attr queued:
+    Number of channels waiting to be sent.
+
+:attr outstanding:
+    Number of channels sent, but not yet answered.
+
+:attr eta:
+    Estimated seconds until every channel is synced.
+"""
+
+
+WhoisQueueStats = namedtuple("WhoisQueueStats",
+                             "depth oldest sent dropped merged")
+"""Statistics of the WHOIS queue.
+
+:attr depth:
+    Number of users waiting to be looked up.
+
+:attr oldest:
+    Seconds the longest waiting user has been queued, or 0 if none are.
+
+:attr sent:
+    Number of users looked up so far.
+
+:attr dropped:
+    Number of users removed from the queue because they were gone by the
+    time their turn came.
+
+:attr merged:
+    Number of requests not queued, because the user was already queued, being
+    looked up, or about to be covered by a channel WHO.
+"""
+
+
+class _Pacer(metaclass=ABCMeta):
+
+    """Pace requests with a token bucket: up to ``burst`` are sent at once,
+    then one every ``1 / rate`` seconds."""
+
+    def __init__(self, track, rate, burst, clock):
+        self.track = track
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+
+        self.tokens = burst
+        self.stamp = clock()
+        self.send_timer = None
+
+    def _refill(self):
+        """Add the tokens earned since last time."""
+        now = self.clock()
+        self.tokens = min(self.burst,
+                          self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def _allowed(self):
+        """Check if a request may be sent now, and if not, schedule
+        :py:meth:`pump` for when one may."""
+        self._refill()
+        if self.tokens >= 1:
+            return True
+
+        delay = (1 - self.tokens) / self.rate
+        self.send_timer = self.track.schedule(delay, self._send_due)
+        return False
+
+    def _send_due(self):
+        """Send requests after waiting for a token."""
+        self.send_timer = None
+
+        # The wait earned a token, though rounding may leave it just short
+        self._refill()
+        self.tokens = max(self.tokens, 1)
+        self.pump()
+
+    def _unschedule(self, timer):
+        """Unschedule a timer if it is set."""
+        if timer is not None:
+            try:
+                self.track.unschedule(timer)
+            except ValueError:
+                pass
+
+    @abstractmethod
+    def pump(self):
+        """Send the next requests, if due and allowed."""
+        raise NotImplementedError()
+
+
+# pylint: disable=too-many-instance-attributes
+class WhoSync(_Pacer):
+
+    """Sync the users of the channels we join with WHO, without flooding.
+
+    Channels are queued once their NAMES have been received, and sent in as
+    few WHO requests as the server allows, as advertised by ``TARGMAX`` in
+    ISUPPORT. Only one request is outstanding at a time. Requests are also
+    paced with a token bucket: up to ``burst`` are sent at once, then one
+    every ``1 / rate`` seconds.
+
+    Channels marked as hot with :py:meth:`mark_hot` are sent first.
+
+    A ``(channel, who_synced)`` event is fired for each channel as it is
+    synced, if anything is bound to it, and a ``(user, who_sync_done)``
+    event once the queue is empty.
+    """
+
+    max_batch = 25
+    """Most channels to send in one WHO, when the server sets no limit."""
+
+    max_length = 400
+    """Longest comma-joined list of channels to send in one WHO."""
+
+    def __init__(self, track, rate=0.5, burst=3, timeout=30,
+                 clock=monotonic):
+        """Initialise the scheduler.
+
+        :param track:
+            The :py:class:`UserTrack` sending the requests.
+
+        :param rate:
+            Requests allowed per second, once the burst is used up.
+
+        :param burst:
+            Requests that may be sent at once.
+
+        :param timeout:
+            Seconds to wait for a request to be answered before giving up
+            on it and moving on.
+        """
+        super().__init__(track, rate, burst, clock)
+        self.timeout = timeout
+
+        # Channels joined, awaiting the end of NAMES
+        self.joining = IRCSet(track.case)
+
+        # Queued channels, in the order to send them
+        self.queued = IRCSet(track.case)
+        self.hot = IRCSet(track.case)
+        self.order = deque()
+        self.hot_order = deque()
+
+        # The outstanding request
+        self.batch = IRCSet(track.case)
+        self.token = None
+        self.sent_at = None
+
+        self.expire_timer = None
+
+        self.synced = 0
+
+        # Running estimate of the time to answer a request
+        self.rtt = 1.0
+
+    def joined(self, channel):
+        """Note that we joined a channel, to sync once its NAMES are in."""
+        self.joining.add(channel)
+
+    def names_end(self, channel):
+        """Queue a joined channel once its NAMES are in."""
+        if channel in self.joining:
+            self.joining.discard(channel)
+            self.add(channel)
+
+    def add(self, channel):
+        """Queue a channel to be synced, if not already queued or sent."""
+        if channel in self.queued or channel in self.batch:
+            return
+
+        self.queued.add(channel)
+        if channel in self.hot:
+            self.hot_order.append(channel)
+        else:
+            self.order.append(channel)
+
+        self.pump()
+
+    def mark_hot(self, channel):
+        """Sync a channel before those not marked as hot.
+
+        A channel may be marked before it is joined.
+        """
+        if channel in self.hot:
+            return
+
+        self.hot.add(channel)
+        if channel in self.queued:
+            # Its place in the normal order is skipped once sent
+            self.hot_order.append(channel)
+
+    def discard(self, channel):
+        """Stop syncing a channel, such as one we left."""
+        self.joining.discard(channel)
+        self.queued.discard(channel)
+        self.hot.discard(channel)
+        if channel in self.batch:
+            self.batch.discard(channel)
+            if not self.batch:
+                self._finish()
+
+    def clear(self):
+        """Forget everything, such as when disconnected."""
+        self._unschedule(self.send_timer)
+        self._unschedule(self.expire_timer)
+        self.send_timer = self.expire_timer = None
+        for channels in (self.joining, self.queued, self.hot, self.batch):
+            channels.clear()
+
+        self.order.clear()
+        self.hot_order.clear()
+        self.token = self.sent_at = None
+        self.tokens = self.burst
+        self.synced = 0
+
+    def rekey(self, case):
+        """Switch to a new casemapping."""
+        rekey((self.joining, self.queued, self.hot, self.batch), case)
+
+    def max_targets(self):
+        """Get the most channels the server allows in one WHO."""
+        targmax = self.track.base.isupport.get("TARGMAX")
+        if not targmax or "WHO" not in targmax:
+            return 1
+
+        limit = targmax["WHO"]
+        return min(int(limit), self.max_batch) if limit else self.max_batch
+
+    def covers(self, channel):
+        """Check if a channel is about to be synced."""
+        return (channel in self.joining or channel in self.queued or
+                channel in self.batch)
+
+    def pump(self):
+        """Send the next request, if one is due and allowed."""
+        if self.batch or self.send_timer is not None or not self.queued:
+            return
+
+        if self._allowed():
+            self._send()
+
+    def _next(self):
+        """Take the next queued channel, or None if there are none."""
+        for order in (self.hot_order, self.order):
+            while order:
+                channel = order.popleft()
+                if channel in self.queued:
+                    return channel
+
+        return None
+
+    def _send(self):
+        """Send a WHO for as many queued channels as allowed."""
+        limit = self.max_targets()
+        targets = []
+        length = 0
+        while len(targets) < limit:
+            channel = self._next()
+            if channel is None:
+                break
+
+            length += len(channel) + 1
+            if targets and length > self.max_length:
+                # Keep its place for the next request
+                order = self.hot_order if channel in self.hot else self.order
+                order.appendleft(channel)
+                break
+
+            targets.append(channel)
+            self.queued.discard(channel)
+            self.hot.discard(channel)
+            self.batch.add(channel)
+
+        if not targets:
+            return
+
+        track = self.track
+        params = [",".join(targets)]
+        if track.base.isupport.get("WHOX"):
+            # Use WHOX if possible
+            self.token = ''.join(str(randint(0, 9))
+                                 for _ in range(randint(1, 3)))
+            params.append("%tcuihsnflar," + self.token)
+            track.whox_send.append(self.token)
+
+        self.tokens -= 1
+        self.sent_at = self.clock()
+        self.expire_timer = track.schedule(self.timeout, self._expire)
+        track.send("WHO", params)
+
+    def end(self, mask):
+        """Handle the end of a WHO reply.
+
+        :returns:
+            True if it answered the outstanding request.
+        """
+        batch = self.batch
+        channels = [channel for channel in mask.split(',')
+                    if channel in batch]
+        if not channels:
+            return False
+
+        track = self.track
+        notify = track.signals.has_slots(("channel", "who_synced"))
+        for channel in channels:
+            batch.discard(channel)
+            self.synced += 1
+            if notify:
+                track.fire_event("channel", "who_synced", channel)
+
+        if not batch:
+            # Weight recent requests more
+            self.rtt = (self.rtt + self.clock() - self.sent_at) / 2
+            self._finish()
+
+        return True
+
+    def _expire(self):
+        """Give up on a request the server did not answer."""
+        self.expire_timer = None
+        _logger.warning("No end of WHO for %s, giving up on it",
+                        ", ".join(self.batch))
+        self.batch.clear()
+        self._finish()
+
+    def _finish(self):
+        """Clean up after a request, and send the next."""
+        track = self.track
+        self._unschedule(self.expire_timer)
+        self.expire_timer = None
+
+        if self.token is not None:
+            if self.token in track.whox_send:
+                track.whox_send.remove(self.token)
+
+            self.token = None
+
+        if self.queued:
+            self.pump()
+        else:
+            track.fire_event("user", "who_sync_done")
+
+    def progress(self):
+        """Get how far syncing has come.
+
+        :returns:
+            A :py:class:`WhoSyncProgress`.
+        """
+        queued = len(self.queued)
+        requests = ceil(queued / self.max_targets())
+        eta = requests * max(1 / self.rate, self.rtt)
+        if self.batch:
+            eta += max(self.rtt - (self.clock() - self.sent_at), 0)
+
+        return WhoSyncProgress(self.synced, queued, len(self.batch), eta)
+
+
+class WhoisQueue(_Pacer):
+
+    """Look up users we know little about, without flooding.
+
+    Users are queued once, and looked up in the order they were queued,
+    paced with a token bucket as for :py:class:`WhoSync`. Users who will be
+    covered by a channel WHO are not queued, and users gone by the time
+    their turn comes are dropped.
+
+    If the server supports WHOX, users are looked up with WHOX, as many in
+    one request as ``TARGMAX`` allows. Otherwise, WHOIS is used. A WHOX
+    request is done once the end of WHO has been seen for each of its
+    users, however the server echoes them, and is given up on if that takes
+    longer than the timeout.
+    """
+
+    def __init__(self, track, rate=1, burst=4, timeout=30, clock=monotonic):
+        """Initialise the queue.
+
+        :param track:
+            The :py:class:`UserTrack` sending the requests.
+
+        :param rate:
+            Requests allowed per second, once the burst is used up.
+
+        :param burst:
+            Requests that may be sent at once.
+
+        :param timeout:
+            Seconds to wait for a WHOX request to be answered before giving
+            up on it, so its users may be looked up again.
+        """
+        super().__init__(track, rate, burst, clock)
+        self.timeout = timeout
+
+        # Queued nicks, mapped to when they were queued
+        self.queued = IRCDict(track.case)
+        self.order = deque()
+
+        # Nicks in outstanding WHOX requests, mapped to the mask sent, and
+        # each request's token and when it was sent, oldest first
+        self.pending = IRCDict(track.case)
+        self.requests = dict()
+
+        self.expire_timer = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.merged = 0
+
+    def add(self, nick, channel=None):
+        """Queue a user to be looked up.
+
+        :param channel:
+            A channel the user was seen on, if any.
+
+        :returns:
+            True if the user was queued.
+        """
+        track = self.track
+        if (nick in self.queued or nick in self.pending or
+                nick in track.whois_send or self.covered(nick, channel)):
+            self.merged += 1
+            return False
+
+        self.queued[nick] = self.clock()
+        self.order.append(nick)
+        self.pump()
+        return True
+
+    def covered(self, nick, channel=None):
+        """Check if a user is about to be covered by a channel WHO."""
+        who_sync = self.track.who_sync
+        if channel is not None and who_sync.covers(channel):
+            return True
+
+        membership = self.track.base.base_track.membership
+        return any(who_sync.covers(name)
+                   for name in membership.channels_of(nick))
+
+    def discard(self, nick):
+        """Stop looking up a user who is gone."""
+        if self.queued.pop(nick, None) is not None:
+            self.dropped += 1
+
+    def clear(self):
+        """Forget everything, such as when disconnected."""
+        self._unschedule(self.send_timer)
+        self._unschedule(self.expire_timer)
+        self.send_timer = self.expire_timer = None
+        self.queued.clear()
+        self.order.clear()
+        self.pending.clear()
+        self.requests.clear()
+        self.tokens = self.burst
+
+    def rekey(self, case):
+        """Switch to a new casemapping."""
+        rekey((self.queued, self.pending), case)
+
+    def pump(self):
+        """Send requests while any are due and allowed."""
+        while self.queued and self.send_timer is None and self._allowed():
+            self._send()
+
+    def _next(self):
+        """Take the next queued user still around, or None."""
+        queued = self.queued
+        while self.order:
+            nick = self.order.popleft()
+            if nick not in queued:
+                continue
+
+            del queued[nick]
+            if self.track.get_user(nick) is None:
+                self.dropped += 1
+                continue
+
+            if nick in self.track.whois_send:
+                # Looked up since it was queued
+                self.merged += 1
+                continue
+
+            return nick
+
+        return None
+
+    def _send(self):
+        """Look up as many queued users as allowed in one request."""
+        track = self.track
+        whox = track.base.isupport.get("WHOX")
+        limit = track.who_sync.max_targets() if whox else 1
+        nicks = []
+        while len(nicks) < limit:
+            nick = self._next()
+            if nick is None:
+                break
+
+            nicks.append(nick)
+
+        if not nicks:
+            return
+
+        self.tokens -= 1
+        self.sent += len(nicks)
+        if whox:
+            token = ''.join(str(randint(0, 9))
+                            for _ in range(randint(1, 3)))
+            mask = ",".join(nicks)
+            self.requests[mask] = (token, self.clock())
+            for nick in nicks:
+                self.pending[nick] = mask
+
+            track.whox_send.append(token)
+            self._schedule_expire()
+            track.send("WHO", [mask, "%tcuihsnflar," + token])
+        else:
+            nick = nicks[0]
+            track.whois_send.add(nick)
+            track.send("WHOIS", ["*", nick])
+
+    def end(self, mask):
+        """Handle the end of a WHO reply.
+
+        The mask is matched a nick at a time, as servers may change the case
+        or order of the nicks, or end each of them separately.
+
+        :returns:
+            True if it answered one of our requests.
+        """
+        pending = self.pending
+        answered = set()
+        for nick in mask.split(','):
+            request = pending.pop(nick, None)
+            if request is not None:
+                answered.add(request)
+
+        if not answered:
+            return False
+
+        for request in answered:
+            if not any(nick in pending for nick in request.split(',')):
+                self._forget(request, self.requests.pop(request)[0])
+
+        if not self.requests:
+            self._unschedule(self.expire_timer)
+            self.expire_timer = None
+
+        return True
+
+    def _schedule_expire(self):
+        """Schedule giving up on the oldest request, if not yet scheduled."""
+        if self.expire_timer is not None or not self.requests:
+            return
+
+        mask, (_, sent_at) = next(iter(self.requests.items()))
+        delay = max(sent_at + self.timeout - self.clock(), 0)
+        self.expire_timer = self.track.schedule(delay,
+                                                partial(self._expire, mask))
+
+    def _expire(self, oldest):
+        """Give up on requests the server did not answer in time.
+
+        :param oldest:
+            The request the timer was set for, which is given up on even if
+            the timer fired a little early.
+        """
+        self.expire_timer = None
+        requests = self.requests
+        deadline = self.clock() - self.timeout
+        for mask, (token, sent_at) in list(requests.items()):
+            if sent_at > deadline and mask != oldest:
+                # The rest were sent later
+                break
+
+            _logger.warning("No end of WHO for %s, giving up on it", mask)
+            del requests[mask]
+            self._forget(mask, token)
+
+        self._schedule_expire()
+
+    def _forget(self, mask, token):
+        """Forget the users and token of a finished request."""
+        pending = self.pending
+        for nick in mask.split(','):
+            if pending.get(nick) == mask:
+                del pending[nick]
+
+        whox_send = self.track.whox_send
+        if token in whox_send:
+            whox_send.remove(token)
+
+    def stats(self):
+        """Get the state of the queue.
+
+        :returns:
+            A :py:class:`WhoisQueueStats`.
+        """
+        oldest = next(iter(self.queued.values()), None)
+        oldest = 0 if oldest is None else self.clock() - oldest
+        return WhoisQueueStats(len(self.queued), oldest, self.sent,
+                               self.dropped, self.merged)
+
+
 # This is a data class
 # pylint: disable=too-many-instance-attributes,too-few-public-methods
 class User:
 
     """A user entity.
 
+    Users are slotted to keep memory use down on large networks. Other
+    attributes may still be set on them, as before, but each user they are
+    set on then takes the space of a ``__dict__`` as well. The username,
+    host, server and account are interned, as they are often shared by many
+    users.
+
     :ivar channels:
         Mapping of channels, where the keys are casemapped channel names, and
-        the values are their status modes on the channel.
+        the values are frozen sets of their status modes on the channel. This
+        is a view of the membership index, so only the channels we share are
+        present, and nothing is stored for users not in any.
 
     For more elaborate channel tracking, see
     :py:module:`~PyIRC.extensions.channeltrack`.
     """
 
-    def __init__(self, case, nick, **kwargs):
+    __slots__ = ["nick", "username", "host", "gecos", "account", "server",
+                 "server_desc", "sid", "secure", "operator", "away", "idle",
+                 "signon", "ip", "realhost", "membership", "__dict__",
+                 "__weakref__"]
+
+    def __init__(self, case, nick, membership=None, **kwargs):
         """Store the data for a user.
 
         Unknown values are stored as None, whereas empty ones are stored as
@@ -56,6 +687,10 @@ class User:
         :param case:
             Casemapping to use for channels member.
 
+        :param membership:
+            The :py:class:`~PyIRC.extensions.basetrack.Membership` index
+            holding the user's channels. A private one is used if not given.
+
         :key username:
             Username of the user, or ident (depending on IRC daemon).
 
@@ -72,6 +707,12 @@ class User:
         :key server:
             Server the user is on. Not always reliable or present.
 
+        :key server_desc:
+            Description of the server the user is on.
+
+        :key sid:
+            ID of the server the user is on, sent in WHO on some networks.
+
         :key secure:
             User is using SSL. Always assume unsecured unless set to True.
 
@@ -79,6 +720,12 @@ class User:
             User is an operator. Being set to None does not guarantee a user
             is not an operator due to IRC daemon limitations and data hiding.
 
+        :key away:
+            User is away.
+
+        :key idle:
+            Idle time of the user, as sent in WHOX.
+
         :key signon:
             Signon time for the user. May not be set.
 
@@ -93,21 +740,34 @@ class User:
             raise ValueError("nick may not be None")
 
         self.nick = nick
-        self.username = kwargs.get("username", None)
-        self.host = kwargs.get("host", None)
+        self.username = _intern(kwargs.get("username", None))
+        self.host = _intern(kwargs.get("host", None))
         self.gecos = kwargs.get("gecos", None)
-        self.account = kwargs.get("account", None)
-        self.server = kwargs.get("server", None)
+        self.account = _intern(kwargs.get("account", None))
+        self.server = _intern(kwargs.get("server", None))
+        self.server_desc = kwargs.get("server_desc", None)
+        self.sid = kwargs.get("sid", None)
         self.secure = kwargs.get("secure", None)
         self.operator = kwargs.get("operator", None)
+        self.away = kwargs.get("away", None)
+        self.idle = kwargs.get("idle", None)
         self.signon = kwargs.get("signon", None)
         self.ip = kwargs.get("ip", None)  # pylint: disable=invalid-name
         self.realhost = kwargs.get("realhost", None)
-        self.channels = IRCDefaultDict(case, set)
+
+        if membership is None:
+            membership = Membership(case)
+        self.membership = membership
+
+    @property
+    def channels(self):
+        """Mapping of the user's channels to their status modes there."""
+        return self.membership.channels_of(self.nick)
 
     def __repr__(self):
         keys = ("nick", "username", "host", "gecos", "account", "server",
-                "secure", "operator", "signon", "ip", "realhost", "channels")
+                "server_desc", "sid", "secure", "operator", "away", "idle",
+                "signon", "ip", "realhost", "channels")
 
         # key={0.key!r}
         rep = ["{0}={{0.{0}!r}}".format(k) for k in keys]
@@ -131,6 +791,13 @@ class UserTrack(BaseExtension):
         User instances. You should probably prefer
         :py:class:`~PyIRC.extensions.usertrack.Usertrack.get_user` to direct
         lookups on this dictionary.
+
+    :ivar who_sync:
+        The :py:class:`WhoSync` syncing the channels we join.
+
+    :ivar whois_queue:
+        The :py:class:`WhoisQueue` looking up users we see outside of
+        channels we have synced, such as senders of private messages.
     """
 
     caps = {
@@ -147,7 +814,6 @@ class UserTrack(BaseExtension):
         self.base.user_track = self
 
         self.u_expire_timers = IRCDict(self.case)
-        self.who_timers = IRCDict(self.case)
 
         self.users = IRCDict(self.case)
         self.whois_send = IRCSet(self.case)
@@ -158,6 +824,16 @@ class UserTrack(BaseExtension):
         # WHOX sent list
         self.whox_send = list()
 
+        # Channel syncing
+        self.who_sync = WhoSync(self, kwargs.get("who_rate", 0.5),
+                                kwargs.get("who_burst", 3),
+                                kwargs.get("who_timeout", 30))
+
+        # Looking up unknown users
+        self.whois_queue = WhoisQueue(self, kwargs.get("whois_rate", 1),
+                                      kwargs.get("whois_burst", 4),
+                                      kwargs.get("whois_timeout", 30))
+
         # Whether or not to time users out
         self.do_timeout = kwargs.get("do_timeout", True)
         self.timeout = kwargs.get("timeout", 30)
@@ -167,7 +843,7 @@ class UserTrack(BaseExtension):
 
         # Create ourselves
         basicrfc = self.base.basic_rfc
-        self.add_user(basicrfc.nick, user=self.username,
+        self.add_user(basicrfc.nick, username=self.username,
                       gecos=self.gecos)
 
     def authenticate(self, nick, callback):
@@ -184,7 +860,8 @@ class UserTrack(BaseExtension):
         user = self.get_user(nick)
         if not user:
             # Add a user for now, get details later.
-            self.users[nick] = User(self.case, nick)
+            user = self.users[nick] = User(
+                self.case, nick, membership=self.base.base_track.membership)
 
         if user.account is not None:
             # User account is known
@@ -216,10 +893,11 @@ class UserTrack(BaseExtension):
         """
         user = self.get_user(nick)
         if not user:
-            user = User(self.case, nick, **kwargs)
+            user = User(self.case, nick,
+                        membership=self.base.base_track.membership, **kwargs)
             self.users[nick] = user
 
-        self.call_event("user", "user_create", user)
+        self.fire_event("user", "user_create", user)
 
         return user
 
@@ -233,11 +911,12 @@ class UserTrack(BaseExtension):
             _logger.warning("Deleting nonexistent user: %s", nick)
             return
 
-        self.call_event("user", "user_delete", self.users[nick])
+        self.fire_event("user", "user_delete", self.users[nick])
 
         _logger.debug("Deleted user: %s", nick)
 
         del self.users[nick]
+        self.whois_queue.discard(nick)
 
     def timeout_user(self, nick):
         """Time a user out, cancelling existing timeouts.
@@ -281,88 +960,86 @@ class UserTrack(BaseExtension):
         user.nick = hostmask.nick
 
         if hostmask.username:
-            user.username = hostmask.username
+            user.username = _intern(hostmask.username)
 
         if hostmask.host:
-            user.host = hostmask.host
+            user.host = _intern(hostmask.host)
 
     @event("protocol", "case_change")
     def case_change(self, _):
-        case = self.case
-
-        self.u_expire_timers = self.u_expire_timers.convert(case)
-        self.who_timers = self.who_timers.convert(case)
-
-        self.users = self.users.convert(case)
-        self.whois_send = self.whois_send.convert(case)
-
-        self.auth_cb = self.auth_cb.convert(case)
+        rekey((self.u_expire_timers, self.users, self.whois_send,
+               self.auth_cb), self.case)
+        self.who_sync.rekey(self.case)
+        self.whois_queue.rekey(self.case)
 
     @event("link", "disconnected")
     def close(self, _):
-        timers = chain(self.u_expire_timers.values(),
-                       self.who_timers.values())
-        for timer in timers:
+        for timer in self.u_expire_timers.values():
             try:
                 self.unschedule(timer)
             except ValueError:
                 pass
 
         self.users.clear()
+        self.who_sync.clear()
+        self.whois_queue.clear()
         self.whox_send.clear()
 
-    @event("modes", "mode_prefix")
-    def prefix(self, _, setter, target, mode):
-        """Update the channel mode of a user."""
-        # pylint: disable=unused-argument
-        # Parse into hostmask in case of usernames-in-host
-        hostmask = Hostmask.parse(mode.param)
+    @event("modes", "mode_change")
+    def mode_change(self, _, change):
+        """Create users whose status changed without us seeing them join.
 
-        assert hostmask
+        Their modes are kept in the membership index by
+        :py:class:`~PyIRC.extensions.basetrack.BaseTrack`.
+        """
+        for mode in change.prefix:
+            # Parse into hostmask in case of usernames-in-host
+            hostmask = Hostmask.parse(mode.param)
 
-        user = self.get_user(hostmask.nick)
-        if user is None:
-            # This can happen from override or ChanServ guard off
-            user = self.add_user(hostmask.nick, username=hostmask.username,
-                                 host=hostmask.host)
-            self.timeout_user(hostmask.nick)
+            assert hostmask
 
-        channel = user.channels[target]
-        if mode.adding:
-            channel.add(mode.mode)
-        else:
-            channel.discard(mode.mode)
+            if self.get_user(hostmask.nick) is None:
+                # This can happen from override or ChanServ guard off
+                self.add_user(hostmask.nick, username=hostmask.username,
+                              host=hostmask.host)
+                self.timeout_user(hostmask.nick)
 
-    @event("scope", "user_burst")
-    def burst(self, _, scope):
+    @event("scope", "user_burst_batch")
+    def burst_batch(self, _, burst):
         """Create or update users from a join burst."""
-        target = scope.target
-        channel = scope.scope
-        modes = {m[0] for m in scope.modes} if scope.modes else set()
+        for target, _modes in burst.targets:
+            self.burst_user(target)
+
+    def burst_user(self, target, gecos=None, account=None):
+        """Create or update a user seen entering a channel.
+
+        Their membership is kept in the membership index by
+        :py:class:`~PyIRC.extensions.basetrack.BaseTrack`.
 
-        if target.nick in self.u_expire_timers:
+        Avoid using this method directly unless you know what you are
+        doing.
+        """
+        nick = target.nick
+        timer = self.u_expire_timers.pop(nick, None)
+        if timer is not None:
             # They're back.  Cancel pending expiry.
-            self.unschedule(self.u_expire_timers[target.nick])
-            del self.u_expire_timers[target.nick]
+            self.unschedule(timer)
 
-        user = self.get_user(target.nick)
+        user = self.get_user(nick)
         if not user:
-            user = self.add_user(target.nick, username=target.username,
-                                 host=target.host, gecos=scope.gecos,
-                                 account=scope.account)
+            user = self.add_user(nick, username=target.username,
+                                 host=target.host, gecos=gecos,
+                                 account=account)
         else:
             self.update_username_host(target)
 
-        # Add the channel
-        user.channels[channel] = modes
-
     @event("scope", "user_join")
-    def join(self, caller, scope):
+    def join(self, _, scope):
         """Handle a user join.
 
-        Schedule a WHO(X) for them.
+        If it is us, sync the channel with WHO(X) once its NAMES are in.
         """
-        self.burst(caller, scope)
+        self.burst_user(scope.target, scope.gecos, scope.account)
 
         target = scope.target
         channel = scope.scope
@@ -370,16 +1047,12 @@ class UserTrack(BaseExtension):
         basicrfc = self.base.basic_rfc
         if self.casecmp(target.nick, basicrfc.nick):
             # It's us!
-            isupport = self.base.isupport
-            params = [channel]
-            if isupport.get("WHOX"):
-                # Use WHOX if possible
-                num = ''.join(str(randint(0, 9)) for x in range(randint(1, 3)))
-                params.append("%tcuihsnflar," + num)
-                self.whox_send.append(num)
+            self.who_sync.joined(channel)
 
-            sched = self.schedule(2, partial(self.send, "WHO", params))
-            self.who_timers[channel] = sched
+    @event("commands", Numerics.RPL_ENDOFNAMES)
+    def names_end(self, _, line):
+        """Queue a channel we joined for syncing."""
+        self.who_sync.names_end(line.params[1])
 
     @event("scope", "user_part")
     @event("scope", "user_kick")
@@ -400,28 +1073,27 @@ class UserTrack(BaseExtension):
                             "(in %s)", target.nick, channel)
             return
 
-        user.channels.pop(channel)
-
+        # The membership index is updated by BaseTrack after this event, so
+        # anyone only on this channel is about to be in no channels at all.
         basicrfc = self.base.basic_rfc
         if self.casecmp(target.nick, basicrfc.nick):
-            # We left the channel, scan all users to remove unneeded ones
-            for u_nick, u_user in list(self.users.items()):
-                if channel in u_user.channels:
-                    # Purge from the cache since we don't know for certain.
-                    del u_user.channels[channel]
-
+            # We left the channel, remove the members we no longer share any
+            # channel with.
+            self.who_sync.discard(channel)
+            membership = self.base.base_track.membership
+            for u_nick in list(membership.members(channel)):
                 if self.casecmp(u_nick, basicrfc.nick):
                     # Don't delete ourselves!
                     continue
 
-                if not u_user.channels:
+                if len(membership.channels_of(u_nick)) == 1 and \
+                        u_nick in self.users:
                     # Delete the user outright to purge any cached data
                     # The data must be considered invalid when we leave
                     # TODO - possible WATCH support?
                     self.remove_user(u_nick)
-                    continue
 
-        elif not user.channels:
+        elif len(user.channels) == 1:
             if self.do_timeout:
                 self.timeout_user(target.nick)
             elif self.remove_no_channels:
@@ -459,7 +1131,7 @@ class UserTrack(BaseExtension):
                 continue
 
             if hostmask.username:
-                user.username = hostmask.username
+                user.username = _intern(hostmask.username)
 
             user.operator = parse.operator
             if not parse.away:
@@ -468,7 +1140,7 @@ class UserTrack(BaseExtension):
             if self.casecmp(hostmask.nick, basicrfc.nick):
                 user.realhost = hostmask.host
             else:
-                user.host = hostmask.host
+                user.host = _intern(hostmask.host)
 
     @event("commands", Numerics.RPL_HOSTHIDDEN)
     def host_hidden(self, _, line):
@@ -478,7 +1150,7 @@ class UserTrack(BaseExtension):
         user = self.get_user(params[0])
         assert user  # This should NEVER fire!
 
-        user.host = params[1]
+        user.host = _intern(params[1])
 
     @event("commands", "ACCOUNT")
     def account(self, _, line):
@@ -490,7 +1162,7 @@ class UserTrack(BaseExtension):
         user = self.get_user(line.hostmask.nick)
         assert user
 
-        user.account = '' if account == '*' else account
+        user.account = '' if account == '*' else _intern(account)
 
         if user.nick in self.auth_cb:
             # User is awaiting authentication
@@ -518,8 +1190,8 @@ class UserTrack(BaseExtension):
         user = self.get_user(line.hostmask.nick)
         assert user
 
-        user.username = line.params[0]
-        user.host = line.params[1]
+        user.username = _intern(line.params[0])
+        user.host = _intern(line.params[1])
 
     @event("commands", "NICK")
     def nick(self, _, line):
@@ -536,6 +1208,7 @@ class UserTrack(BaseExtension):
 
         if not self.casecmp(oldnick, newnick):
             del self.users[oldnick]
+            self.whois_queue.discard(oldnick)
 
     @event("commands", Numerics.ERR_NOSUCHNICK)
     def notfound(self, _, line):
@@ -576,23 +1249,16 @@ class UserTrack(BaseExtension):
                 return
 
             # Obtain more information about the user
-            user = self.add_user(hostmask.nick, user=hostmask.username,
+            user = self.add_user(hostmask.nick, username=hostmask.username,
                                  host=hostmask.host)
-
-            if hostmask.nick not in self.whois_send:
-                self.send("WHOIS", ['*', hostmask.nick])
-                self.whois_send.add(hostmask.nick)
-
+            self.whois_queue.add(hostmask.nick, line.params[0])
             self.timeout_user(hostmask.nick)
 
     @event("commands", Numerics.RPL_ENDOFWHO)
     def who_end(self, _, line):
-        if not self.whox_send:
-            return
-
-        channel = line.params[1]
-        del self.who_timers[channel]
-        del self.whox_send[0]
+        """Finish syncing the channels or users a WHO was sent for."""
+        if not self.who_sync.end(line.params[1]):
+            self.whois_queue.end(line.params[1])
 
     @event("commands", Numerics.RPL_ENDOFWHOIS)
     def whois_end(self, _, line):
@@ -626,8 +1292,8 @@ class UserTrack(BaseExtension):
             return
 
         user.nick = nick
-        user.username = username
-        user.host = host
+        user.username = _intern(username)
+        user.host = _intern(host)
         user.gecos = gecos
 
     @event("commands", Numerics.RPL_WHOISCHANNELS)
@@ -640,10 +1306,12 @@ class UserTrack(BaseExtension):
         isupport = self.base.isupport
         prefix = prefix_parse(isupport.get("PREFIX"))
 
+        channels = self.base.base_track.membership.channels
         for channel in line.params[-1].split():
-            mode = set()
             mode, channel = status_prefix_parse(channel, prefix)
-            user.channels[channel] = mode
+            if channel in channels:
+                # Only channels we are in are tracked
+                user.channels[channel] = mode
 
     @event("commands", Numerics.RPL_WHOISHOST)
     def whois_host(self, _, line):
@@ -692,7 +1360,7 @@ class UserTrack(BaseExtension):
         if not user:
             return
 
-        user.server = line.params[2]
+        user.server = _intern(line.params[2])
         user.server_desc = line.params[3]
 
     @event("commands", Numerics.RPL_WHOISLOGGEDIN)
@@ -702,7 +1370,7 @@ class UserTrack(BaseExtension):
         if not user:
             return
 
-        user.account = line.params[2]
+        user.account = _intern(line.params[2])
 
         nick = user.nick
         if nick in self.auth_cb:
@@ -748,7 +1416,7 @@ class UserTrack(BaseExtension):
             sid = None
             gecos = other
 
-        if channel != '*':
+        if channel in self.base.base_track.membership.channels:
             # Convert symbols to modes
             prefix = prefix_parse(isupport.get("PREFIX")).prefix_to_mode
 
@@ -765,10 +1433,10 @@ class UserTrack(BaseExtension):
 
         # NB - these two members aren't guaranteed to exist (yet?)
         user.sid = sid
-        user.server = server
+        user.server = _intern(server)
 
-        user.username = username
-        user.host = host
+        user.username = _intern(username)
+        user.host = _intern(host)
         user.gecos = gecos
         user.away = away
         user.operator = operator
@@ -807,7 +1475,7 @@ class UserTrack(BaseExtension):
             # Not sent by us, weird!
             return
 
-        if channel != '*':
+        if channel in self.base.base_track.membership.channels:
             # Convert symbols to modes
             prefix = prefix_parse(isupport.get("PREFIX")).prefix_to_mode
 
@@ -830,13 +1498,13 @@ class UserTrack(BaseExtension):
             # Cloaked
             ip_ = None
 
-        user.server = server
+        user.server = _intern(server)
         user.idle = idle
-        user.username = username
-        user.host = host
-        user.server = server
+        user.username = _intern(username)
+        user.host = _intern(host)
+        user.server = _intern(server)
         user.gecos = gecos
         user.away = away
         user.operator = operator
-        user.account = account
+        user.account = _intern(account)
         user.ip = ip_
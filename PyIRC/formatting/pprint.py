@@ -18,7 +18,7 @@ import os
 from PyIRC.base import IRCBase
 from PyIRC.formatting.formatters import ANSIFormatter, XTerm256ColourFormatter
 from PyIRC.line import Hostmask
-from PyIRC.numerics import Numerics
+from PyIRC.numerics import Numerics, numeric_name
 from PyIRC.signal import event
 
 
@@ -236,9 +236,9 @@ class PrettyPrintedIRCMixin(IRCBase):
         if line.command not in self.handled | self.ignored:
             formatted = self._pp_in_str
 
-            if line.command.isnumeric() and len(line.command) == 3:
-                cmd = '{} [{}]'.format(Numerics(line.command).name,
-                                       line.command)
+            name = numeric_name(line.command)
+            if name is not None:
+                cmd = '{} [{}]'.format(name, line.command)
             else:
                 cmd = line.command
 
@@ -10,4 +10,4 @@ This module contains the I/O backends for PyIRC. The backends inherit from
 perform scheduling functions.
 """
 
-__all__ = ["asyncio", "socket"]
+__all__ = ["asyncio", "framing", "socket"]
@@ -14,15 +14,67 @@ import ssl
 
 from collections import namedtuple
 from functools import update_wrapper, partial
-from logging import getLogger
+from logging import DEBUG, getLogger
+
+from taillight.signal import SignalDefer, SignalStop
 
 from PyIRC.base import IRCBase, Event
-from PyIRC.line import Line
+from PyIRC.io.framing import LineFramer
+from PyIRC.signal import _REJECTED
 
 
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
 
 
+# pylint: disable=protected-access
+@asyncio.coroutine
+def _dispatch_async(signal, sender, *args, **kwargs):
+    """Call a signal's slots from its compiled table, yielding from any that
+    return coroutines.
+
+    This is :py:meth:`~PyIRC.signal.DispatchSignal.dispatch` for asyncio, so
+    handlers are filtered and timed the same way, and filtered handlers that
+    weren't called are left out of the results.
+    """
+    defer = signal._defer
+    if defer is not None:
+        # Resume from where the deferred call left off
+        if args or kwargs:
+            signal.defer_set_args(args, kwargs)
+
+        functions = defer.iterator
+        args = defer.args
+        kwargs = defer.kwargs
+    elif signal.functions is None:
+        ret = yield from signal.call_async(sender, *args, **kwargs)
+        return [value for value in ret if value is not _REJECTED]
+    elif signal.filtered is not None:
+        functions = iter(signal.filtered.select(args))
+    else:
+        functions = iter(signal.functions)
+
+    ret = []
+    signal.last_status = signal.STATUS_DONE
+    for function in functions:
+        try:
+            result = function(sender, *args, **kwargs)
+            if asyncio.iscoroutine(result):
+                result = yield from result
+
+            if result is not _REJECTED:
+                ret.append(result)
+        except SignalStop:
+            signal.last_status = signal.STATUS_STOP
+            break
+        except SignalDefer:
+            signal.last_status = signal.STATUS_DEFER
+            signal._defer = signal._DeferType(functions, args, kwargs)
+            return ret
+
+    signal.reset_defer()
+    return ret
+
+
 class IRCProtocol(IRCBase, asyncio.Protocol):
 
     """The asyncio implementation of the IRC protocol. Available only with
@@ -52,7 +104,8 @@ class IRCProtocol(IRCBase, asyncio.Protocol):
 
         self.sched_events = set()
 
-        self.data = None
+        self.framer = LineFramer(self.encoding, self.fallback_encoding,
+                                 kwargs.get("max_line_length"))
 
         self.transport = None
 
@@ -84,18 +137,12 @@ class IRCProtocol(IRCBase, asyncio.Protocol):
 
     def connection_made(self, transport):
         self.transport = transport
-        self.data = b''
+        self.framer.clear()
         super().connect()
 
     def data_received(self, data):
-        data = self.data + data
-
-        lines = data.split(b'\r\n')
-        self.data = lines.pop()
-
-        for line in lines:
-            line = Line.parse(line.decode('utf-8', 'ignore'))
-            _logger.debug("IN: %s", str(line).rstrip())
+        for line in self.framer.feed(data):
+            _logger.debug("IN: %s", line)
             try:
                 super().recv(line)
             except Exception:
@@ -116,13 +163,18 @@ class IRCProtocol(IRCBase, asyncio.Protocol):
         _logger.info("Connection lost: %s", str(exc))
         super().close()
 
-    def send(self, command, params):
-        line = super().send(command, params)
+    def send(self, command, params, tags=None):
+        line = super().send(command, params, tags)
         if line is None:
             return
 
-        self.transport.write(bytes(line))
-        _logger.debug("OUT: %s", str(line).rstrip())
+        self.send_bytes(bytes(line))
+
+    def send_bytes(self, data):
+        self.transport.write(data)
+
+        if _logger.isEnabledFor(DEBUG):
+            _logger.debug("OUT: %s", data.decode('utf-8', 'replace').rstrip())
 
     @asyncio.coroutine
     def _process_queue(self):
@@ -147,16 +199,31 @@ class IRCProtocol(IRCBase, asyncio.Protocol):
             # Exception raised, let's get out of here!
             raise self._call_task.exception()
 
-        signal = self.signals.get_signal((hclass, event))
-        event = Event(signal.name, self)
-
-        cor = signal.call_async(event, *args, **kwargs)
+        signal_name = (hclass, event)
+        event = Event(signal_name, self)
         future = asyncio.Future()
 
+        signal = self.signals.dispatch.get(signal_name)
+        if signal is None:
+            # Don't create a signal or queue a call for nothing
+            future.set_result([])
+            return (event, future)
+
+        cor = _dispatch_async(signal, event, *args, **kwargs)
         self._call_queue.put_nowait((cor, future))
 
         return (event, future)
 
+    def fire_event(self, hclass, event, *args, **kwargs):
+        """Call an (hclass, event) signal, without reusing the Event.
+
+        Events are called later from the call queue, so can't be pooled.
+
+        :returns:
+            A future for the return values from events.
+        """
+        return self.call_event(hclass, event, *args, **kwargs)[1]
+
     def schedule(self, time, callback):
         def cb_cleanup(time, callback):
             self.sched_events.discard((time, callback))
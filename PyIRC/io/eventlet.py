@@ -13,13 +13,13 @@ of the scheduling is done with eventlet's `spawn_after`.
 """
 
 
-from logging import getLogger
+from logging import DEBUG, getLogger
 
 from eventlet.green import socket, ssl
 from eventlet import spawn_after, spawn_n
 
 from PyIRC.base import IRCBase
-from PyIRC.line import Line
+from PyIRC.io.framing import LineFramer
 
 
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
@@ -58,7 +58,8 @@ class IRCEventlet(IRCBase):
         self._socket = self.socket = socket.socket(family=family)
 
         # Data for the socket
-        self.data = b''
+        self.framer = LineFramer(self.encoding, self.fallback_encoding,
+                                 kwargs.get("max_line_length"))
 
     def connect(self):
         # pylint: disable=no-member
@@ -74,6 +75,7 @@ class IRCEventlet(IRCBase):
 
         self.socket.settimeout(self.kwargs.get("socket_timeout", 10))
         self.socket.connect((self.server, self.port))
+        self.framer.clear()
 
         super().connect()
 
@@ -85,17 +87,11 @@ class IRCEventlet(IRCBase):
             data = self.socket.recv(512)
             if not data:
                 raise OSError("Connection reset by peer")
-
-            data = self.data + data
         except socket.timeout:
             return
 
-        lines = data.split(b'\r\n')
-        self.data = lines.pop()
-
-        for line in lines:
-            line = Line.parse(line.decode('utf-8', 'ignore'))
-            _logger.debug("IN: %s", str(line).rstrip())
+        for line in self.framer.feed(data):
+            _logger.debug("IN: %s", line)
             spawn_n(super().recv(line))
 
     def loop(self):
@@ -114,16 +110,20 @@ class IRCEventlet(IRCBase):
                 self.close()
                 raise
 
-    def send(self, command, params):
-        line = super().send(command, params)
+    def send(self, command, params, tags=None):
+        line = super().send(command, params, tags)
         if line is None:
             return
 
+        self.send_bytes(bytes(line))
+
+    def send_bytes(self, data):
         self.socket.settimeout(self.kwargs.get('send_timeout', None))
-        if self.socket.send(bytes(line)) == 0:
+        if self.socket.send(data) == 0:
             raise OSError("Connection reset by peer")
 
-        _logger.debug("OUT: %s", str(line).rstrip())
+        if _logger.isEnabledFor(DEBUG):
+            _logger.debug("OUT: %s", data.decode('utf-8', 'replace').rstrip())
 
     def schedule(self, time, callback):
         return spawn_after(time, callback)
@@ -0,0 +1,131 @@
+# Copyright © 2019 Elizabeth Myers.  All rights reserved.
+# This file is part of the PyIRC3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Framing of the raw byte stream from the server into lines.
+
+This is shared by all the I/O backends, which feed it whatever chunks they
+read from the wire.
+"""
+
+
+from logging import getLogger
+
+from PyIRC.line import Line
+
+
+_logger = getLogger(__name__)  # pylint: disable=invalid-name
+
+
+class LineFramer:
+
+    """Split a stream of bytes into :py:class:`~PyIRC.line.Line` instances.
+
+    Lines may be terminated by either CR LF or a bare LF. Pending data is kept
+    in a single buffer, which is never allowed to grow beyond the maximum
+    line length; overlong lines are discarded.
+
+    >>> framer = LineFramer()
+    >>> framer.feed(b'PING :a\\r\\nPING :b\\nPI')
+    ... # doctest: +ELLIPSIS
+    [Line(..., command='PING', params=['a']), Line(..., params=['b'])]
+    >>> framer.feed(b'NG :c\\r\\n')
+    [Line(tags=None, hostmask=None, command='PING', params=['c'])]
+    """
+
+    MAX_LENGTH = 8191 + 512
+    """Default maximum line length, which allows for the IRCv3 maximum size of
+    message tags in addition to the 512 bytes of a normal line."""
+
+    def __init__(self, encoding='utf-8', fallback=None, max_length=None):
+        """Initialise the LineFramer.
+
+        :param encoding:
+            Encoding to decode lines with.
+
+        :param fallback:
+            Encoding to decode lines that are invalid in ``encoding`` with.
+            See :py:meth:`~PyIRC.line.Line.parse_bytes`.
+
+        :param max_length:
+            Maximum length of a line in bytes, including the line ending.
+            Defaults to :py:attr:`MAX_LENGTH`.
+        """
+        self.encoding = encoding
+        self.fallback = fallback
+        self.max_length = max_length or self.MAX_LENGTH
+
+        self.buffer = bytearray()
+
+        # Set when the rest of an overlong line is being skipped
+        self.discarding = False
+
+    def clear(self):
+        """Discard any pending data, such as when reconnecting."""
+        self.buffer.clear()
+        self.discarding = False
+
+    def feed(self, data):
+        """Add a chunk of data read from the server.
+
+        :param data:
+            A bytes-like object containing the data.
+
+        :returns:
+            A list of the :py:class:`~PyIRC.line.Line` instances completed by
+            this chunk, which may be empty.
+        """
+        buffer = self.buffer
+        buffer += data
+
+        lines = []
+        start = 0
+        max_length = self.max_length
+
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(b'\n', start)
+                if end == -1:
+                    break
+
+                if self.discarding:
+                    # This is the end of an overlong line
+                    self.discarding = False
+                elif end - start >= max_length:
+                    _logger.warning("Discarding overlong line (%d bytes)",
+                                    end - start + 1)
+                else:
+                    self._parse(view[start:end], lines)
+
+                start = end + 1
+
+        del buffer[:start]
+
+        if len(buffer) >= max_length:
+            _logger.warning("Discarding overlong line (over %d bytes)",
+                            len(buffer))
+            buffer.clear()
+            self.discarding = True
+        elif self.discarding:
+            # Nothing of this line is worth keeping
+            buffer.clear()
+
+        return lines
+
+    def _parse(self, data, lines):
+        """Parse one line, appending it to lines if it is valid."""
+        if data[-1:] == b'\r':
+            data = data[:-1]
+
+        if not data:
+            # Blank line
+            return
+
+        try:
+            line = Line.parse_bytes(data, self.encoding, self.fallback)
+        except ValueError:
+            _logger.warning("Discarding invalid line: %r", bytes(data))
+            return
+
+        lines.append(line)
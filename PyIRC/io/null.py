@@ -60,8 +60,8 @@ class NullSocket(IRCBase):
                 self.close()
                 raise
 
-    def send(self, command, params):
-        line = super().send(command, params)
+    def send(self, command, params, tags=None):
+        line = super().send(command, params, tags)
         if line is None:
             return
 
@@ -71,16 +71,38 @@ class NullSocket(IRCBase):
         self.sendq.put(line)
         _logger.debug("OUT: %s", str(line).rstrip())
 
+    def send_bytes(self, data):
+        if self.disconnect_on_next:
+            raise OSError("Connection reset by peer")
+
+        # Raw lines are only parsed when a test draws them
+        for raw in data.splitlines():
+            self.sendq.put(raw)
+            _logger.debug("OUT: %r", raw)
+
     def draw_line(self):
         """Draw the earliest Line in the sendq from the client.
 
         Returns None if there are no lines currently in the sendq.
         """
         try:
-            return self.sendq.get()
+            line = self.sendq.get_nowait()
         except Empty:
             return None
 
+        if isinstance(line, bytes):
+            line = Line.parse_bytes(line)
+
+        return line
+
+    def draw_lines(self):
+        """Draw every Line currently in the sendq from the client."""
+        lines = []
+        while not self.sendq.empty():
+            lines.append(self.draw_line())
+
+        return lines
+
     def reset_connection(self):
         """Emulate a server forcibly disconnecting the client.
 
@@ -8,38 +8,174 @@
 """Objects and utilities related to IRC messages."""
 
 
-import operator
 import re
 
-from itertools import takewhile
-from functools import reduce, lru_cache
+from collections import namedtuple
+from functools import lru_cache
 from logging import getLogger
+from operator import methodcaller
+from sys import intern
 
 
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
 
 
+# Whitespace skipped between the prefix, command and parameters
+_skip_space = re.compile(r"\s*").match  # pylint: disable=invalid-name
+
+# The command runs until the first space or colon
+_match_command = re.compile(r"[^ :]+").match  # pylint: disable=invalid-name
+
+# Parameters; group 1 is the trailing parameter, group 2 a middle one. Middle
+# parameters must start on a non-space so trailing whitespace is never
+# mistaken for a parameter.
+_find_params = re.compile(  # pylint: disable=invalid-name
+    r"\s*(?::(.*)|(\S[^ ]*))", re.DOTALL).findall
+
+
+# Lazy lines match the tags, hostmask and command in one go, leaving the
+# rest of the line until it is needed.
+_match_line = re.compile(  # pylint: disable=invalid-name
+    r"(?:@([^ ]*) \s*)?(?::([^ ]*) \s*)?([^ :@][^ :]*)").match
+
+_match_line_bytes = re.compile(  # pylint: disable=invalid-name
+    rb"(?:@([^ ]*) \s*)?(?::([^ ]*) \s*)?([^ :@][^ :]*)").match
+
+_find_params_bytes = re.compile(  # pylint: disable=invalid-name
+    rb"\s*(?::(.*)|(\S[^ ]*))", re.DOTALL).findall
+
+
+def _decode(raw, encoding, fallback):
+    """Decode raw bytes received from the wire.
+
+    :param encoding:
+        The encoding to try first.
+
+    :param fallback:
+        The encoding to use if the data is invalid in ``encoding``. If None,
+        invalid characters are dropped.
+    """
+    try:
+        return raw.decode(encoding)
+    except UnicodeDecodeError:
+        if fallback is None:
+            return raw.decode(encoding, 'ignore')
+
+        return raw.decode(fallback, 'replace')
+
+
+def _tokenize(line):
+    r"""Split a raw line into its (tags, hostmask, command, params) fields.
+
+    The tag and hostmask fields are returned unparsed, or None if absent.
+    The line is scanned once, without slicing off each token as it goes.
+
+    >>> _tokenize('@a=b :n!u@h PRIVMSG #c :hi there\r\n')
+    ('a=b', 'n!u@h', 'PRIVMSG', ['#c', 'hi there'])
+    >>> _tokenize('PING')
+    (None, None, 'PING', [])
+    """
+    line = line.rstrip('\r\n')
+    if not line:
+        raise ValueError("Blank line")
+
+    tags = hostmask = None
+    pos = 0
+
+    # Do we have tags?
+    if line[0] == '@':
+        space = line.index(' ')  # Grab the separator
+        tags = line[1:space]
+        pos = _skip_space(line, space).end()
+
+    # Do we have a hostmask?
+    if line[pos] == ':':
+        space = line.index(' ', pos)
+        hostmask = line[pos + 1:space]
+        pos = _skip_space(line, space).end()
+
+    # Grab command
+    match = _match_command(line, pos)
+    if match is None:
+        raise ValueError("No command found in line")
+
+    command = match.group()
+
+    # Retrieve parameters
+    params = [middle or trailing for trailing, middle in
+              _find_params(line, match.end())]
+
+    return (tags, hostmask, command, params)
+
+
+# IRCv3 tag value escapes
+_tag_escapes = str.maketrans({  # pylint: disable=invalid-name
+    ';': '\\:', ' ': '\\s', '\\': '\\\\', '\r': '\\r', '\n': '\\n'})
+
+_tag_unescapes = {  # pylint: disable=invalid-name
+    ':': ';', 's': ' ', '\\': '\\', 'r': '\r', 'n': '\n'}
+
+_sub_tag_escapes = re.compile(  # pylint: disable=invalid-name
+    r"\\(.?)", re.DOTALL).sub
+
+
+def _unescape_tag(value):
+    r"""Unescape an IRCv3 tag value.
+
+    Unknown escapes stand for the escaped character, and a lone backslash at
+    the end is dropped.
+
+    >>> _unescape_tag(r'a\sb\:c\\d\e')
+    'a b;c\\de'
+    >>> _unescape_tag('trailing' + chr(92))
+    'trailing'
+    """
+    if '\\' not in value:
+        return value
+
+    return _sub_tag_escapes(
+        lambda match: _tag_unescapes.get(match.group(1), match.group(1)),
+        value)
+
+
 class Tags:
 
-    """Stores message tags.
+    r"""Stores message tags.
+
+    Message tags are an IRCv3 extension adding out-of-band data to messages,
+    such as the time a message was sent, or the account of its sender.
 
-    Message tags are a new feature proposed by IRCv3 to add enhanced
-    out-of-band data to messages.
+    Most servers send several tags on every line, and most are never looked
+    at, so tags are only split up and unescaped when first accessed. The
+    serialised form is kept until :py:attr:`tags` is handed out, so lines
+    are relayed with their tags exactly as they were received.
 
-    Not presently tested a whole lot due to the lack of conforming
-    servers.
+    >>> tags = Tags.parse(r'time=2019-05-01T12:00:00.000Z;+x/y=a\sb\:c;bot')
+    >>> tags['+x/y']
+    'a b;c'
+    >>> 'bot' in tags, tags['bot']
+    (True, None)
+    >>> str(Tags(tags={'label': 'a b'}))
+    'label=a\\sb'
     """
 
-    __slots__ = ('tags', 'tagstr')
+    __slots__ = ('_tags', 'tagstr')
 
     def __init__(self, *, tags=None, tagstr=None):
-        self.tags = tags
-        self.tagstr = tagstr
+        """Initialise the Tags object.
+
+        :param tags:
+            A dict of tags, mapping each key to its value, or None if it has
+            no value.
 
-        if not self.tags:
-            parse = self.parse(self.tagstr)
-            self.tags = parse.tags
-            self.tagstr = parse.tagstr
+        :param tagstr:
+            The raw tag string, which is only parsed if tags is None.
+        """
+        if tags is None and tagstr is None:
+            tags = dict()
+
+        self._tags = tags
+        self.tagstr = tagstr
 
     @classmethod
     def parse(cls, raw):
@@ -49,28 +185,76 @@ class Tags:
             # pylint: disable=inconsistent-return-statements
             return None
 
-        tags = dict()
+        return cls(tagstr=raw)
+
+    def _parsed(self):
+        """Get the dict of tags, splitting up the tag string if need be."""
+        if self._tags is None:
+            tags = dict()
+
+            for tag in self.tagstr.split(';'):
+                key, _, value = tag.partition('=')
+                if not key:
+                    continue
+
+                # Servers send the same few keys on every line
+                tags[intern(key)] = _unescape_tag(value) if value else None
+
+            self._tags = tags
+
+        return self._tags
+
+    @property
+    def tags(self):
+        """A dict of the tags, mapping each key to its unescaped value, or
+        None if it has no value.
+
+        The dict may be changed in place, so getting or replacing it
+        discards the cached serialised form.
+        """
+        tags = self._parsed()
+        self.tagstr = None
+        return tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+        self.tagstr = None
+
+    def get(self, key, default=None):
+        """Get the value of a tag, or default if it is not present."""
+        return self._parsed().get(key, default)
 
-        for tag in raw.split(';'):
-            key, _, value = tag.partition('=')
-            if value == '':
-                value = None
-            tags[key] = value
+    def __getitem__(self, key):
+        return self._parsed()[key]
 
-        return cls(tags=tags, tagstr=raw)
+    def __contains__(self, key):
+        return key in self._parsed()
 
     def __repr__(self):
-        return "Tags(tags={})".format(repr(self.tags))
+        return "Tags(tags={})".format(repr(self._parsed()))
 
     def __str__(self):
-        ret = []
-        for key, value in self.tags.items():
-            if value is None:
-                value = ''
+        if self.tagstr is None:
+            ret = []
+            for key, value in self._parsed().items():
+                value = '' if value is None else str(value)
+                if value:
+                    ret.append('{}={}'.format(key,
+                                              value.translate(_tag_escapes)))
+                else:
+                    ret.append(key)
+
+            self.tagstr = ';'.join(ret)
+
+        return self.tagstr
+
 
-            ret.append('{}={}'.format(key, value))
+InternInfo = namedtuple("InternInfo", "hits misses maxsize currsize hit_rate")
+"""Statistics for the hostmask intern table.
 
-        return ';'.join(ret)
+See :py:meth:`Hostmask.intern_info`.
+"""
 
 
 class Hostmask:
@@ -87,10 +271,15 @@ class Hostmask:
     Hostmask(nick=None, username=None, host='host.org')
     >>> Hostmask.parse('nickname')
     Hostmask(nick='nickname', username=None, host=None)
+
+    Busy channels send a lot of lines from the same few sources, so parsed
+    hostmasks may optionally be interned with :py:meth:`set_intern_size`.
     """
 
     __slots__ = ('nick', 'username', 'host', 'maskstr')
 
+    _intern = None
+
     def __init__(self, *, nick=None, username=None, host=None, mask=None):
         """Initalise the Hostmask object."""
         self.nick = nick
@@ -107,12 +296,23 @@ class Hostmask:
 
         :param raw:
             The raw hostmask to parse.
+
+        :returns:
+            A Hostmask, or None if raw is empty. If interning is enabled, the
+            Hostmask is shared and may not be modified.
         """
         if not raw:
             _logger.debug("No hostmask found")
             # pylint: disable=inconsistent-return-statements
             return None
 
+        if cls._intern is not None and cls is Hostmask:
+            return cls._intern(raw)
+
+        return cls._parse(raw)
+
+    @classmethod
+    def _parse(cls, raw):
         host_sep = raw.find('@')
         if host_sep == -1:
             if raw.find('.') != -1:
@@ -130,6 +330,55 @@ class Hostmask:
                    username=raw[nick_sep + 1:host_sep],
                    host=raw[host_sep + 1:], mask=raw)
 
+    @staticmethod
+    def set_intern_size(maxsize):
+        """Enable or disable interning of parsed hostmasks.
+
+        When enabled, :py:meth:`parse` keeps the most recently used hostmasks
+        in a table keyed on the raw mask, and returns the same immutable
+        Hostmask each time a mask is seen. The nick, username, and host
+        strings are interned as well, so trackers storing them share the same
+        string objects.
+
+        This affects all connections, and resets the statistics.
+
+        >>> Hostmask.set_intern_size(16)
+        >>> mask = Hostmask.parse('nick!user@host')
+        >>> mask is Hostmask.parse('nick!user@host')
+        True
+        >>> Hostmask.intern_info()
+        InternInfo(hits=1, misses=1, maxsize=16, currsize=1, hit_rate=0.5)
+        >>> Hostmask.set_intern_size(0)
+
+        :param maxsize:
+            Maximum number of hostmasks to keep, or 0 to disable interning.
+        """
+        if not maxsize:
+            Hostmask._intern = None
+            return
+
+        Hostmask._intern = staticmethod(lru_cache(maxsize=maxsize)(
+            _InternedHostmask._parse))
+
+    @staticmethod
+    def intern_info():
+        """Get the statistics for the hostmask intern table.
+
+        These can be used to size the table with :py:meth:`set_intern_size`.
+
+        :returns:
+            A :py:class:`InternInfo` instance, or None if interning is not
+            enabled.
+        """
+        if Hostmask._intern is None:
+            return None
+
+        info = Hostmask._intern.cache_info()
+        lookups = info.hits + info.misses
+        hit_rate = info.hits / lookups if lookups else 0.0
+        return InternInfo(info.hits, info.misses, info.maxsize,
+                          info.currsize, hit_rate)
+
     @staticmethod
     @lru_cache(maxsize=128)
     def _compile(string):
@@ -138,7 +387,10 @@ class Hostmask:
         return re.compile(string)
 
     def match(self, mask):
-        """Check if a given mask matches this hostmask."""
+        """Check if a given mask matches this hostmask.
+
+        To check against many masks at once, use :py:class:`MaskSet`.
+        """
         # pylint: disable=too-many-return-statements
         # XXX this assumes an ASCII scheme for comparisons. It should be
         # correct for most cases, though.
@@ -207,6 +459,358 @@ class Hostmask:
             repr(self.nick), repr(self.username), repr(self.host))
 
 
+class _InternedHostmask(Hostmask):
+
+    """A Hostmask shared through the intern table, which is immutable."""
+
+    __slots__ = ()
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, *, nick=None, username=None, host=None, mask=None):
+        setattr_ = object.__setattr__
+        setattr_(self, 'nick', None if nick is None else intern(nick))
+        setattr_(self, 'username',
+                 None if username is None else intern(username))
+        setattr_(self, 'host', None if host is None else intern(host))
+        setattr_(self, 'maskstr', mask)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Interned hostmasks may not be modified")
+
+
+# Masks are matched a part at a time; each part is None if absent from the
+# mask, or a function testing the casefolded part of a hostmask.
+_MaskEntry = namedtuple("_MaskEntry", "mask parts nick username host")
+
+
+def _has_glob(pattern):
+    """Check if a mask part contains any wildcards."""
+    return '*' in pattern or '?' in pattern
+
+
+def _glob(pattern):
+    """Translate an IRC glob into a regular expression."""
+    return re.escape(pattern).replace('\\*', '.*').replace('\\?', '.')
+
+
+@lru_cache(maxsize=1024)
+def _glob_test(pattern):
+    """Create a function testing a string against an IRC glob."""
+    if pattern is None:
+        return None
+
+    if not _has_glob(pattern):
+        return pattern.__eq__
+
+    # Most masks only have wildcards at either end, which need no regular
+    # expression to test.
+    inner = pattern.strip('*')
+    if not _has_glob(inner):
+        if not inner:
+            return _match_all
+
+        if pattern[0] != '*':
+            return methodcaller('startswith', inner)
+
+        if pattern[-1] != '*':
+            return methodcaller('endswith', inner)
+
+        return methodcaller('__contains__', inner)
+
+    return re.compile(_glob(pattern), re.DOTALL).fullmatch
+
+
+def _match_all(part):  # pylint: disable=unused-argument
+    """Match any string, for a mask part that is only ``*``."""
+    return True
+
+
+def _parse_mask(mask, casefold):
+    """Compile a mask into a :py:class:`_MaskEntry`."""
+    if not mask:
+        raise ValueError("Empty mask")
+
+    if mask.startswith(('$', '#', '&', '!', '+')):
+        # Special chars, at least the ones I know about
+        raise ValueError("Possible extban detected, naive match impossible")
+
+    parsed = Hostmask._parse(casefold(mask))
+    parts = (parsed.nick, parsed.username, parsed.host)
+    return _MaskEntry(mask, parts, *map(_glob_test, parts))
+
+
+def _fold_parts(hostmask, casefold):
+    """Get the casefolded (nick, username, host) of a hostmask."""
+    return tuple(None if part is None else casefold(part) for part in
+                 (hostmask.nick, hostmask.username, hostmask.host))
+
+
+def _mask_matches(entry, nick, username, host):
+    """Check a compiled mask against the casefolded parts of a hostmask.
+
+    A part missing from the hostmask, such as the host of a user only seen in
+    NAMES, only matches a mask part that is just ``*``.
+    """
+    for test, part in ((entry.nick, nick), (entry.username, username),
+                       (entry.host, host)):
+        if test is None:
+            continue
+
+        if part is None:
+            if test is not _match_all:
+                return False
+        elif not test(part):
+            return False
+
+    return True
+
+
+class MaskSet:
+
+    """A collection of masks, indexed to match hostmasks against all of them
+    at once.
+
+    This is meant for ban lists and the like, where checking each mask in turn
+    with :py:meth:`Hostmask.match` is slow. Masks are indexed by exact host,
+    host suffix (``*.example.com``), host prefix (``192.0.2.*``), or exact
+    nick, so only the masks that could match a given hostmask are checked. The
+    remaining masks are combined into a single regular expression, which
+    rules them all out in one go for most hostmasks.
+
+    Matching is stricter than :py:meth:`Hostmask.match`: globs must match
+    each part of the hostmask whole, both sides are casefolded, and a part the
+    hostmask lacks, such as the host of a user only seen in NAMES, only
+    matches ``*``. Extbans are rejected with :py:exc:`ValueError`.
+
+    >>> masks = MaskSet(['*!*@*.example.com', 'troll!*@*', '*!*bot@*'])
+    >>> sorted(masks.match(Hostmask.parse('Troll!~t@host.example.com')))
+    ['*!*@*.example.com', 'troll!*@*']
+    >>> masks.discard('troll!*@*')
+    >>> masks.match(Hostmask.parse('troll!~t@example.org'))
+    []
+    >>> masks.match_any(Hostmask.parse('x!spambot@example.org'))
+    True
+    >>> MaskSet(['nick!*@*']).match_any(Hostmask(nick='NICK'))
+    True
+    >>> MaskSet(['nick!*@*.com']).match_any(Hostmask(nick='nick'))
+    False
+    """
+
+    def __init__(self, masks=(), casefold=None):
+        """Initialise the MaskSet.
+
+        :param masks:
+            An iterable of masks to add.
+
+        :param casefold:
+            Function used to casefold masks and hostmasks, which defaults to
+            :py:meth:`str.lower`.
+        """
+        self.casefold = casefold or str.lower
+
+        # All the masks, mapped to their (index, key)
+        self.masks = dict()
+
+        # Each index maps a key to a bucket of {mask: entry}
+        self.hosts = dict()
+        self.suffixes = dict()
+        self.prefixes = dict()
+        self.nicks = dict()
+
+        # Masks that fit in no index, and the expression matching any of them
+        self.other = dict()
+        self._other_match = None
+
+        # Distinct lengths of the suffixes and prefixes, with their counts
+        self._suffix_lengths = dict()
+        self._prefix_lengths = dict()
+
+        self.update(masks)
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __iter__(self):
+        return iter(self.masks)
+
+    def __contains__(self, mask):
+        return mask in self.masks
+
+    def __repr__(self):
+        return "MaskSet({})".format(repr(list(self.masks)))
+
+    def add(self, mask):
+        """Add a mask to the set, if not already present."""
+        if mask in self.masks:
+            return
+
+        entry = _parse_mask(mask, self.casefold)
+        nick, _, host = entry.parts
+
+        if host is not None and not _has_glob(host):
+            index, key = self.hosts, host
+        elif host in (None, '*') and nick is not None and not _has_glob(nick):
+            index, key = self.nicks, nick
+        elif (len(host or '') > 1 and host[0] == '*' and
+              not _has_glob(host[1:])):
+            index, key = self.suffixes, host[1:]
+            self._count_length(self._suffix_lengths, len(key), 1)
+        elif (len(host or '') > 1 and host[-1] == '*' and
+              not _has_glob(host[:-1])):
+            index, key = self.prefixes, host[:-1]
+            self._count_length(self._prefix_lengths, len(key), 1)
+        elif nick is not None and not _has_glob(nick):
+            index, key = self.nicks, nick
+        else:
+            index, key = None, None
+            self.other[mask] = entry
+            self._other_match = None
+
+        if index is not None:
+            index.setdefault(key, dict())[mask] = entry
+
+        self.masks[mask] = (index, key)
+
+    def update(self, masks):
+        """Add each of an iterable of masks to the set."""
+        for mask in masks:
+            self.add(mask)
+
+    def remove(self, mask):
+        """Remove a mask from the set, raising KeyError if not present."""
+        index, key = self.masks.pop(mask)
+
+        if index is None:
+            del self.other[mask]
+            self._other_match = None
+            return
+
+        bucket = index[key]
+        del bucket[mask]
+        if not bucket:
+            del index[key]
+
+        if index is self.suffixes:
+            self._count_length(self._suffix_lengths, len(key), -1)
+        elif index is self.prefixes:
+            self._count_length(self._prefix_lengths, len(key), -1)
+
+    def discard(self, mask):
+        """Remove a mask from the set, if present."""
+        if mask in self.masks:
+            self.remove(mask)
+
+    def clear(self):
+        """Remove all masks from the set."""
+        for mask in list(self.masks):
+            self.remove(mask)
+
+    @staticmethod
+    def _count_length(lengths, length, count):
+        count += lengths.get(length, 0)
+        if count:
+            lengths[length] = count
+        else:
+            del lengths[length]
+
+    def _buckets(self, nick, username, host):
+        """Yield every bucket of masks that could match a hostmask."""
+        if host is not None:
+            bucket = self.hosts.get(host)
+            if bucket:
+                yield bucket
+
+            size = len(host)
+            for length in self._suffix_lengths:
+                if length <= size:
+                    bucket = self.suffixes.get(host[size - length:])
+                    if bucket:
+                        yield bucket
+
+            for length in self._prefix_lengths:
+                if length <= size:
+                    bucket = self.prefixes.get(host[:length])
+                    if bucket:
+                        yield bucket
+
+        if nick is not None:
+            bucket = self.nicks.get(nick)
+            if bucket:
+                yield bucket
+
+        if self.other:
+            match = self._other_match
+            if match is None:
+                match = self._other_match = self._compile_other()
+
+            # Never fails to match if one of the masks would, though it
+            # may match when none of them actually do.
+            if match('{}!{}@{}'.format(nick or '', username or '',
+                                       host or '')):
+                yield self.other
+
+    def _compile_other(self):
+        """Combine the unindexed masks into one expression."""
+        patterns = []
+        for entry in self.other.values():
+            nick, username, host = ('.*' if part is None else _glob(part)
+                                    for part in entry.parts)
+            patterns.append('{}!{}@{}'.format(nick, username, host))
+
+        return re.compile('(?:{})'.format('|'.join(patterns)),
+                          re.DOTALL).fullmatch
+
+    def match(self, hostmask):
+        """Find the masks matching a hostmask.
+
+        :param hostmask:
+            The :py:class:`Hostmask` to match.
+
+        :returns:
+            A list of the matching masks, in no particular order.
+        """
+        parts = _fold_parts(hostmask, self.casefold)
+        return [mask for bucket in self._buckets(*parts)
+                for mask, entry in bucket.items()
+                if _mask_matches(entry, *parts)]
+
+    def match_any(self, hostmask):
+        """Check if any mask matches a hostmask.
+
+        This stops at the first matching mask, so is cheaper than
+        :py:meth:`match` when the masks themselves are not needed.
+        """
+        parts = _fold_parts(hostmask, self.casefold)
+        return any(_mask_matches(entry, *parts)
+                   for bucket in self._buckets(*parts)
+                   for entry in bucket.values())
+
+
+class _LazySlot:
+
+    """Fill in a slot of :py:class:`Line` from a loader on first access."""
+
+    __slots__ = ('slot', 'load')
+
+    def __init__(self, slot, load):
+        self.slot = slot
+        self.load = load
+
+    def __get__(self, inst, owner=None):
+        if inst is None:
+            return self
+
+        try:
+            return self.slot.__get__(inst, owner)
+        except AttributeError:
+            value = self.load(inst)
+            self.slot.__set__(inst, value)
+            return value
+
+    def __set__(self, inst, value):
+        self.slot.__set__(inst, value)
+
+
 class Line:
 
     """Stores an IRC line in the RFC1459 framing format.
@@ -248,6 +852,8 @@ class Line:
 
         if isinstance(self.tags, str):
             self.tags = Tags.parse(self.tags)
+        elif isinstance(self.tags, dict):
+            self.tags = Tags(tags=self.tags)
 
         if isinstance(self.hostmask, str):
             self.hostmask = Hostmask.parse(self.hostmask)
@@ -259,84 +865,111 @@ class Line:
             str(self)
 
     @classmethod
-    def parse(cls, line):
+    def parse(cls, line, lazy=False):
         """Parse a raw string into a Line.
 
         Also should raise on any invalid line.  It will be quite liberal
         with hostmasks (accepting such joys as '' and
         'user1@user2@user3'), but trying to enforce strict validity in
         hostmasks will be slow.
+
+        :param lazy:
+            If True, only the command is extracted up front, and a
+            :py:class:`LazyLine` is returned. The tags, hostmask, and
+            parameters are parsed when first accessed.
         """
         if not line:
             _logger.warning("Blank line passed in!")
             # pylint: disable=inconsistent-return-statements
             return None
 
-        raw_line = line
-        tags = None
-        hostmask = None
-        params = list()
-
-        # Do we have tags?
-        if line[0] == '@':
-            space = line.index(' ')  # Grab the separator
-            tags = Tags.parse(line[1:space])
-            line = line[space:].lstrip()
-
-        # Do we have a hostmask?
-        if line[0] == ':':
-            space = line.index(' ')  # Grab the separator
-            hostmask = Hostmask.parse(line[1:space])
-            line = line[space:].lstrip()
-
-        # Grab command
-        command = reduce(operator.concat,
-                         takewhile(lambda char: char not in (' ', ':'), line))
-        # pylint: disable=len-as-condition
-        assert len(command) > 0
-
-        line = line[len(command):].lstrip().rstrip('\r\n')
-
-        # Retrieve parameters
-        # pylint: disable=len-as-condition
-        while len(line) > 0:
-            next_param = ''
-            line = line.lstrip()
-
-            if not line:
-                # XXX is this really the correct behaviour?
-                next_param = ''
-                break
-
-            if line[0] == ':':
-                next_param = line[1:]
-                line = ''
-            else:
-                next_param = reduce(operator.concat,
-                                    takewhile(lambda char: char != ' ', line))
-                line = line[len(next_param):]
+        if lazy:
+            match = _match_line(line, 0, len(line.rstrip('\r\n')))
+            if match is None:
+                raise ValueError("No command found in line")
+
+            # pylint: disable=protected-access
+            line = LazyLine._create(match, None, None)
+            line.command = match.group(3)
+            line.linestr = match.string
+            return line
+
+        tags, hostmask, command, params = _tokenize(line)
 
-            params.append(next_param)
+        if tags is not None:
+            tags = Tags.parse(tags)
+
+        if hostmask is not None:
+            hostmask = Hostmask.parse(hostmask)
 
         return cls(tags=tags, hostmask=hostmask, command=command,
-                   params=params, line=raw_line)
+                   params=params, line=line)
+
+    @classmethod
+    def parse_bytes(cls, data, encoding='utf-8', fallback=None):
+        """Parse raw bytes from the wire into a Line.
+
+        Only the framing is checked here; the fields are decoded (and the
+        hostmask and tags parsed) when they are first accessed. This makes
+        lines that are never looked at, or only dispatched on their command,
+        a lot cheaper.
+
+        >>> line = Line.parse_bytes(b':n!u@h PRIVMSG #chan :\\xe9t\\xe9',
+        ...                         fallback='latin-1')
+        >>> line.command, line.params
+        ('PRIVMSG', ['#chan', 'été'])
+
+        :param data:
+            A bytes-like object containing the line. Objects other than
+            :py:class:`bytes` are copied, so buffers may be reused afterwards.
+
+        :param encoding:
+            The encoding to decode fields with.
+
+        :param fallback:
+            The encoding to decode fields that are invalid in ``encoding``
+            with. If None, invalid characters are dropped.
+
+        :returns:
+            A :py:class:`LazyLine` instance, or None for blank lines.
+        """
+        if not data:
+            _logger.warning("Blank line passed in!")
+            # pylint: disable=inconsistent-return-statements
+            return None
+
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
+        match = _match_line_bytes(data, 0, len(data.rstrip(b'\r\n')))
+        if match is None:
+            raise ValueError("No command found in line")
+
+        # pylint: disable=protected-access
+        return LazyLine._create(match, encoding, fallback)
 
     def __str__(self):
         if not self.linestr:
             line = []
+            if self.tags is not None:
+                tags = str(self.tags)
+                if tags:
+                    line.append('@' + tags)
+
             if self.hostmask:
                 line.append(':' + str(self.hostmask))
 
-            line.append(self.command)
+            line.append(str(self.command))
 
             if self.params:
-                if any(x in (' ', ':') for x in self.params[-1]):
-                    line.extend(self.params[:-1])
-                    line.append(':' + self.params[-1])
-                else:
-                    line.extend(self.params)
+                params = [str(x) for x in self.params]
+                last = params[-1]
+                if not last or ' ' in last or ':' in last:
+                    params[-1] = ':' + last
+
+                line.extend(params)
 
-            self.linestr = ' '.join([str(x) for x in line]) + '\r\n'
+            self.linestr = ' '.join(line) + '\r\n'
 
         return self.linestr
 
@@ -350,3 +983,139 @@ class Line:
 
     def __hash__(self):
         return hash(str(self))
+
+
+class LazyLine(Line):
+
+    """A :py:class:`Line` whose fields are parsed on first access.
+
+    These are created by :py:meth:`Line.parse_bytes` and by
+    :py:meth:`Line.parse` in lazy mode, and otherwise behave like any other
+    Line.
+
+    >>> line = Line.parse(':n!u@h PRIVMSG #chan :hi', lazy=True)
+    >>> line.command
+    'PRIVMSG'
+    >>> line
+    ... # doctest: +ELLIPSIS
+    Line(..., command='PRIVMSG', params=['#chan', 'hi'])
+    """
+
+    __slots__ = ('_match', '_encoding', '_fallback')
+
+    @classmethod
+    def _create(cls, match, encoding, fallback):
+        """Create a line from a match of the line prefix and command.
+
+        If encoding is None, the line was parsed from a string.
+        """
+        line = cls.__new__(cls)
+        line._match = match
+        line._encoding = encoding
+        line._fallback = fallback
+        return line
+
+    def _decode(self, raw):
+        if self._encoding is None:
+            return raw
+
+        return _decode(raw, self._encoding, self._fallback)
+
+    def _load_tags(self):
+        raw = self._match.group(1)
+        if raw is None:
+            return None
+
+        return Tags.parse(self._decode(raw))
+
+    def _load_hostmask(self):
+        raw = self._match.group(2)
+        if raw is None:
+            return None
+
+        return Hostmask.parse(self._decode(raw))
+
+    def _load_command(self):
+        return self._decode(self._match.group(3))
+
+    def _load_params(self):
+        match = self._match
+        if self._encoding is None:
+            return [middle or trailing for trailing, middle in
+                    _find_params(match.string, match.end(), match.endpos)]
+
+        decode = self._decode
+        return [decode(middle or trailing) for trailing, middle in
+                _find_params_bytes(match.string, match.end(), match.endpos)]
+
+    def _load_linestr(self):
+        return self._decode(self._match.string)
+
+    tags = _LazySlot(Line.tags, _load_tags)
+    hostmask = _LazySlot(Line.hostmask, _load_hostmask)
+    command = _LazySlot(Line.command, _load_command)
+    params = _LazySlot(Line.params, _load_params)
+    linestr = _LazySlot(Line.linestr, _load_linestr)
+
+
+class LineTemplate:
+
+    """A line with all but its last parameter filled in, and encoded ahead of
+    time.
+
+    Bots sending lots of lines to the same place, such as relays, can use
+    these to skip building and serialising a :py:class:`Line` for each one.
+    See :py:meth:`~PyIRC.base.IRCBase.send_template`.
+
+    >>> template = LineTemplate('PRIVMSG', ['#PyIRC'])
+    >>> template.format('hello world')
+    b'PRIVMSG #PyIRC :hello world\\r\\n'
+    >>> template.line('hi')
+    Line(tags=None, hostmask=None, command='PRIVMSG', params=['#PyIRC', 'hi'])
+    """
+
+    __slots__ = ('command', 'params', 'tags', 'encoding', 'prefix')
+
+    def __init__(self, command, params=(), tags=None, encoding='utf-8'):
+        """Initialise the LineTemplate.
+
+        :param command:
+            The command of the line.
+
+        :param params:
+            The parameters preceding the last one. These may not contain
+            spaces.
+
+        :param tags:
+            Optional dict of message tags to send with the line.
+
+        :param encoding:
+            The encoding to use for the line.
+        """
+        self.command = command
+        self.params = list(params)
+        self.tags = tags
+        self.encoding = encoding
+
+        for param in self.params:
+            if not param or ' ' in param or param[0] == ':':
+                raise ValueError("Invalid parameter in template: "
+                                 "{}".format(repr(param)))
+
+        # Everything up to the colon of the last parameter
+        line = Line(tags=tags, command=command, params=self.params + [''])
+        self.prefix = str(line)[:-2].encode(encoding, 'replace')
+
+    def format(self, param):
+        """Build the encoded line for the given last parameter."""
+        return b''.join((self.prefix, param.encode(self.encoding, 'replace'),
+                         b'\r\n'))
+
+    def line(self, param):
+        """Build a :py:class:`Line` for the given last parameter."""
+        return Line(tags=self.tags, command=self.command,
+                    params=self.params + [param])
+
+    def __repr__(self):
+        return "LineTemplate(command={}, params={})".format(
+            repr(self.command), repr(self.params))
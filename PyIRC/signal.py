@@ -7,20 +7,178 @@
 """Decorator and helpers connecting the PyIRC event system to Taillight."""
 
 
-from collections import defaultdict
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
 from enum import Enum
-from inspect import getmembers
+from functools import wraps
 from logging import getLogger
+from time import perf_counter
+from weakref import WeakKeyDictionary
 
-from taillight.signal import UnsharedSignal
+from taillight.signal import SignalDefer, SignalStop, UnsharedSignal
 from taillight import ANY
 
+from PyIRC.line import Line, MaskSet
+from PyIRC.numerics import Numeric
+
 
 _logger = getLogger(__name__)  # pylint: disable=invalid-name
 
 
+# Returned by filtered slots when the filter rejects the line
+_REJECTED = object()
+
+
+def _as_tuple(value):
+    """Turn a string or iterable of strings into a tuple, or None if empty."""
+    if not value:
+        return None
+    elif isinstance(value, str):
+        return (value,)
+
+    return tuple(value)
+
+
+class EventFilter:
+    """Conditions a :py:class:`~PyIRC.line.Line` must meet for a handler to
+    be called.
+
+    Filters are set with the keyword arguments of :py:func:`event`, and are
+    indexed by the dispatcher so handlers that don't match a line are never
+    called. Each condition may be a string or a sequence of strings, any of
+    which may match; all the given conditions must match.
+
+    Events whose first argument is not a line never match a filter.
+
+    :ivar targets:
+        First parameters (such as channels) to match, compared using the
+        connection's casemapping.
+
+    :ivar prefixes:
+        Prefixes of the last parameter (such as the message) to match.
+
+    :ivar sources:
+        Hostmask globs the source of the line must match.
+
+    :ivar tags:
+        IRCv3 message tags which must all be present.
+    """
+
+    __slots__ = ["targets", "prefixes", "sources", "tags"]
+
+    def __init__(self, target=None, prefix=None, source=None, tags=None):
+        self.targets = _as_tuple(target)
+        self.prefixes = _as_tuple(prefix)
+        self.sources = _as_tuple(source)
+        self.tags = _as_tuple(tags)
+
+    def __bool__(self):
+        return any((self.targets, self.prefixes, self.sources, self.tags))
+
+    def __repr__(self):
+        return ("EventFilter(target={}, prefix={}, source={}, "
+                "tags={})".format(self.targets, self.prefixes, self.sources,
+                                  self.tags))
+
+
+class _FilterMatcher:
+    """An :py:class:`EventFilter` prepared for a connection's casemapping."""
+
+    __slots__ = ["targets", "prefixes", "sources", "tags", "casefold"]
+
+    def __init__(self, event_filter, casefold):
+        self.casefold = casefold
+        self.targets = None
+        if event_filter.targets:
+            self.targets = frozenset(casefold(target) for target in
+                                     event_filter.targets)
+
+        self.prefixes = event_filter.prefixes
+        self.sources = None
+        if event_filter.sources:
+            self.sources = MaskSet(event_filter.sources, casefold)
+
+        self.tags = event_filter.tags
+
+    def match(self, line):
+        """Check everything but the target of a line."""
+        params = line.params
+        if self.prefixes is not None and not (
+                params and params[-1].startswith(self.prefixes)):
+            return False
+
+        if self.sources is not None and not (
+                line.hostmask and self.sources.match_any(line.hostmask)):
+            return False
+
+        if self.tags is not None:
+            tags = line.tags
+            if tags is None or not all(tag in tags for tag in self.tags):
+                return False
+
+        return True
+
+    def match_all(self, line):
+        """Check all of a line."""
+        if not isinstance(line, Line):
+            return False
+
+        if self.targets is not None:
+            params = line.params
+            if not params or self.casefold(params[0]) not in self.targets:
+                return False
+
+        return self.match(line)
+
+
+class _FilterIndex:
+    """Picks out the handlers of a signal that match a line.
+
+    Unfiltered handlers are always called. Handlers filtered by target are
+    looked up by the casefolded first parameter, so the cost of a line is in
+    proportion to the handlers that could match it.
+    """
+
+    def __init__(self, unfiltered, targeted, untargeted, casefold):
+        # All lists are of (position, function[, matcher]) tuples
+        self.unfiltered = unfiltered
+        self.functions = tuple(function for _, function in unfiltered)
+        self.untargeted = untargeted
+        self.targeted = {
+            target: sorted(untargeted + entries, key=lambda e: e[0])
+            for target, entries in targeted.items()}
+        self.casefold = casefold
+
+    def select(self, args):
+        """Get the functions to call for a signal's arguments."""
+        if not args:
+            return self.functions
+
+        line = args[0]
+        if not isinstance(line, Line):
+            return self.functions
+
+        candidates = self.untargeted
+        if self.targeted:
+            params = line.params
+            if params:
+                candidates = self.targeted.get(self.casefold(params[0]),
+                                               candidates)
+
+        if not candidates:
+            return self.functions
+
+        matched = [(position, function) for position, function, matcher
+                   in candidates if matcher.match(line)]
+        if not matched:
+            return self.functions
+
+        return tuple(function for _, function in
+                     sorted(self.unfiltered + matched, key=lambda e: e[0]))
+
+
 def event(hclass, event_name, priority=UnsharedSignal.PRIORITY_NORMAL,
-          listener=ANY):
+          listener=ANY, *, target=None, prefix=None, source=None, tags=None):
     """Tag a function as an event for later binding.
 
     This function is a decorator.
@@ -36,32 +194,359 @@ def event(hclass, event_name, priority=UnsharedSignal.PRIORITY_NORMAL,
 
     :param listener:
         Listener of the signal.
+
+    :param target:
+        Only call the function for lines with this first parameter, such as a
+        channel, or one of a sequence of them. This is compared using the
+        connection's casemapping.
+
+    :param prefix:
+        Only call the function for lines whose last parameter (such as the
+        message text) starts with this, or one of a sequence of prefixes.
+
+    :param source:
+        Only call the function for lines whose source matches this hostmask
+        glob, or one of a sequence of them.
+
+    :param tags:
+        Only call the function for lines with this IRCv3 message tag, or all
+        of a sequence of them.
+
+    See :py:class:`EventFilter`.
     """
 
-    if isinstance(event_name, Enum):
+    if isinstance(event_name, (Enum, Numeric)):
         # FIXME - workaround!
         event_name = event_name.value
 
     name = (hclass, event_name)
 
+    event_filter = EventFilter(target, prefix, source, tags) or None
+
     def wrapped(function):
         if not hasattr(function, '_signal'):
             # pylint: disable=protected-access
             function._signal = list()
 
         # pylint: disable=protected-access
-        function._signal.append((name, priority, listener))
+        function._signal.append((name, priority, listener, event_filter))
 
         return function
 
     return wrapped
 
 
+_class_slots = WeakKeyDictionary()  # pylint: disable=invalid-name
+
+
+def class_slots(cls):
+    """Get the event-tagged members of a class.
+
+    The class is scanned once and the result cached for later calls, so
+    binding further instances of it is just a walk over the returned list.
+    Only class attributes are examined; instance attributes, properties and
+    ``__getattr__`` forwarding are never evaluated.
+
+    :param cls:
+        The class to scan.
+
+    :returns:
+        A list of ``(name, params)`` tuples in name order, where ``params`` is
+        the list of ``(signal name, priority, listener, filter)`` tuples added
+        by :py:func:`event`.
+    """
+    try:
+        return _class_slots[cls]
+    except KeyError:
+        pass
+
+    slots = []
+    for name in sorted(dir(cls)):
+        try:
+            member = getattr(cls, name)
+        except AttributeError:
+            continue
+
+        params = getattr(member, "_signal", None)
+        if params:
+            slots.append((name, params))
+
+    _class_slots[cls] = slots
+    return slots
+
+
+HandlerTiming = namedtuple("HandlerTiming", "hclass event slot calls total "
+                           "worst histogram")
+"""A snapshot of the statistics for one handler.
+
+``slot`` is the qualified name of the handler, ``total`` and ``worst`` are
+in seconds, and ``histogram`` is a tuple of call counts for each of
+:py:attr:`HandlerStats.BUCKETS`, followed by the count of slower calls.
+"""
+
+
+class _HandlerRecord:
+    """Running statistics for one handler."""
+
+    __slots__ = ["key", "calls", "total", "worst", "histogram"]
+
+    def __init__(self, key, buckets):
+        self.key = key
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.histogram = [0] * (buckets + 1)
+
+
+class HandlerStats:
+    """Per-handler latency statistics, with a slow-handler watchdog.
+
+    Pass an instance as the ``handler_stats`` keyword argument of
+    :py:class:`~PyIRC.base.IRCBase`, or to :py:meth:`SignalStorage.set_stats`.
+    One instance may be shared between connections to aggregate their
+    statistics.
+
+    Handlers are timed by wrapping them in the compiled dispatch table, so
+    nothing is timed (and nothing is paid) for connections without an
+    instance. Signals with listener-filtered slots, and resumed deferred
+    calls, are not timed. On the asyncio backend, a handler which is a
+    coroutine is only timed until it returns its coroutine, so time spent
+    awaiting is not counted.
+
+    :ivar budget:
+        Time in seconds a handler may take before a warning is logged, or
+        None to never warn.
+    """
+
+    BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+    """Upper bounds of the latency histogram buckets, in seconds."""
+
+    def __init__(self, budget=None, clock=perf_counter):
+        """Initialise the statistics.
+
+        :param budget:
+            Time in seconds a handler may take before a warning is logged.
+
+        :param clock:
+            Function returning the time in seconds.
+        """
+        self.budget = budget
+        self.clock = clock
+        self.records = {}
+
+    def record(self, signal_name, function):
+        """Get the running statistics for a handler, creating them if needed.
+
+        Records are keyed by ``(hclass, event, slot)``.
+        """
+        key = (signal_name[0], signal_name[1],
+               getattr(function, "__qualname__", repr(function)))
+        record = self.records.get(key)
+        if record is None:
+            record = self.records[key] = _HandlerRecord(key, len(self.BUCKETS))
+
+        return record
+
+    def wrap(self, signal_name, function):
+        """Wrap a handler so its calls are timed."""
+        record = self.record(signal_name, function)
+        clock = self.clock
+        add = self.add
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add(record, clock() - start)
+
+        return timed
+
+    def add(self, record, elapsed):
+        """Add a call taking `elapsed` seconds to a handler's record."""
+        record.calls += 1
+        record.total += elapsed
+        if elapsed > record.worst:
+            record.worst = elapsed
+
+        record.histogram[bisect_left(self.BUCKETS, elapsed)] += 1
+
+        budget = self.budget
+        if budget is not None and elapsed > budget:
+            _logger.warning("Slow handler %s for %r: %.2f ms (budget %.2f ms)",
+                            record.key[2], record.key[:2], elapsed * 1000,
+                            budget * 1000)
+
+    def snapshot(self, top=None):
+        """Report the hottest handlers.
+
+        :param top:
+            Number of handlers to report, or None for all of them.
+
+        :returns:
+            A list of :py:class:`HandlerTiming`, in descending order of total
+            time spent in the handler.
+        """
+        records = sorted(self.records.values(), key=lambda r: r.total,
+                         reverse=True)
+        if top is not None:
+            records = records[:top]
+
+        ret = []
+        for record in records:
+            hclass, event_name, slot = record.key
+            ret.append(HandlerTiming(hclass, event_name, slot, record.calls,
+                                     record.total, record.worst,
+                                     tuple(record.histogram)))
+
+        return ret
+
+    def reset(self):
+        """Clear all statistics."""
+        for record in self.records.values():
+            record.calls = 0
+            record.total = record.worst = 0.0
+            record.histogram = [0] * len(record.histogram)
+
+
+class DispatchSignal(UnsharedSignal):
+    """An unshared Taillight signal that keeps a compiled slot table.
+
+    Whenever a slot is added or deleted, the signal's slots are flattened into
+    :py:attr:`functions`, a tuple of the bound functions in the order they are
+    to be called, and the :py:class:`SignalStorage` dispatch table is updated.
+
+    :ivar functions:
+        Tuple of functions to call, or None if the slots cannot be flattened
+        (such as when a slot is filtered by listener). If any slots have an
+        :py:class:`EventFilter`, this holds only the unfiltered functions.
+
+    :ivar filtered:
+        Index used to select the functions to call if any slots have an
+        :py:class:`EventFilter`, else None.
+    """
+
+    def __init__(self, name, storage):
+        super().__init__(name)
+        self.storage = storage
+        self.functions = ()
+        self.filtered = None
+
+    def _compile(self):
+        slots = self.slots if self.prio_descend else self.slots[::-1]
+        self.filtered = None
+        if any(slot.listener is not ANY for slot in slots):
+            self.functions = None
+            # pylint: disable=protected-access
+            self.storage._update(self)
+            return
+
+        storage = self.storage
+        stats = storage.stats
+        unfiltered = []
+        targeted = defaultdict(list)
+        untargeted = []
+        for position, slot in enumerate(slots):
+            function = slot.function
+            event_filter = getattr(function, "event_filter", None)
+            if event_filter is not None:
+                # Call the function directly; the index does the filtering
+                function = function.__wrapped__
+
+            if stats is not None:
+                function = stats.wrap(self.name, function)
+
+            if event_filter is None:
+                unfiltered.append((position, function))
+                continue
+
+            matcher = storage.matcher(event_filter)
+            if matcher.targets is None:
+                untargeted.append((position, function, matcher))
+            else:
+                for target in matcher.targets:
+                    targeted[target].append((position, function, matcher))
+
+        if targeted or untargeted:
+            self.filtered = _FilterIndex(unfiltered, targeted, untargeted,
+                                         storage.casefold)
+
+        self.functions = tuple(function for _, function in unfiltered)
+
+        # pylint: disable=protected-access
+        self.storage._update(self)
+
+    def add(self, function=None, priority=UnsharedSignal.PRIORITY_NORMAL,
+            listener=ANY):
+        slot = super().add(function, priority, listener)
+        if function is not None:
+            self._compile()
+
+        return slot
+
+    def delete(self, slot):
+        super().delete(slot)
+        self._compile()
+
+    def delete_uid(self, uid):
+        super().delete_uid(uid)
+        self._compile()
+
+    def clear(self):
+        super().clear()
+        self._compile()
+
+    def call(self, sender, *args, **kwargs):
+        # Drop the results of filtered slots that weren't called, as compiled
+        # dispatch never calls them at all.
+        ret = super().call(sender, *args, **kwargs)
+        if _REJECTED in ret:
+            ret = [value for value in ret if value is not _REJECTED]
+
+        return ret
+
+    def dispatch(self, sender, *args, **kwargs):
+        """Call the signal's slots from the compiled table.
+
+        This behaves like :py:meth:`~taillight.signal.Signal.call`, but avoids
+        its per-call generator. Deferred calls are resumed by
+        :py:meth:`~taillight.signal.Signal.call`.
+        """
+        functions = self.functions
+        if functions is None or self._defer is not None:
+            return self.call(sender, *args, **kwargs)
+
+        if self.filtered is not None:
+            functions = self.filtered.select(args)
+
+        ret = []
+        self.last_status = self.STATUS_DONE
+
+        functions = iter(functions)
+        for function in functions:
+            try:
+                ret.append(function(sender, *args, **kwargs))
+            except SignalStop:
+                self.last_status = self.STATUS_STOP
+                break
+            except SignalDefer:
+                # Resume from the next function, as call() would
+                self.last_status = self.STATUS_DEFER
+                self._defer = self._DeferType(functions, args, kwargs)
+                break
+
+        return ret
+
+
 class SignalDict(dict):
     """A dictionary used for unshared Taillight signals."""
 
+    def __init__(self, storage):
+        super().__init__()
+        self.storage = storage
+
     def __missing__(self, key):
-        value = self[key] = UnsharedSignal(key)
+        value = self[key] = DispatchSignal(key, self.storage)
         return value
 
 
@@ -75,28 +560,52 @@ class SignalStorage:
     The idea is Signals are bound to dictionary values, stored in this class.
     This will use an existing dictionary if present; otherwise, it will simply
     create a new one.
-    """
 
-    @staticmethod
-    def _signal_pred(member):
-        return hasattr(member, "_signal")
+    :ivar dispatch:
+        Dispatch table of signal names to the
+        :py:class:`DispatchSignal` instances which have slots bound. Signals
+        with nothing bound to them are never in this table.
+
+    :ivar stats:
+        The :py:class:`HandlerStats` handlers are timed with, or None.
+
+    :ivar casefold:
+        Function used to casefold the targets of :py:class:`EventFilter`. If
+        this changes, call :py:meth:`recompile`.
+    """
 
-    def __init__(self):
-        self.signals = SignalDict()
+    def __init__(self, stats=None):
+        self.signals = SignalDict(self)
         self.signal_slots = defaultdict(list)
+        self.dispatch = {}
+        self.stats = stats
+        self.casefold = str.lower
+        self._matchers = {}
 
     def bind(self, inst):
         """Bind slots from `inst` to their respective signals."""
         slots = self.signal_slots[id(inst)]
-        for (_, function) in getmembers(inst, self._signal_pred):
+        changed = set()
+        for name, params in class_slots(type(inst)):
+            function = getattr(inst, name)
+            for (signal_name, priority, listener, event_filter) in params:
+                signal = self.signals[signal_name]
+                slot_function = function
+                if event_filter is not None:
+                    slot_function = self._filtered(function, event_filter)
+
+                # Compile each signal once, after all the slots are added
+                slots.append(UnsharedSignal.add(signal, slot_function,
+                                                priority, listener))
+                changed.add(signal)
+
+        for signal in changed:
             # pylint: disable=protected-access
-            for param in function._signal:
-                signal = self.get_signal(param[0])
-                slots.append(signal.add(function, *param[1:]))
+            signal._compile()
 
     def unbind(self, inst):
         """Remove slots from `inst` from their respective signals."""
-        for slot in self.signal_slots[id(inst)]:
+        for slot in self.signal_slots.pop(id(inst), ()):
             slot.signal.delete(slot)
 
     def get_bound(self, inst):
@@ -107,5 +616,66 @@ class SignalStorage:
         """Retrieve the specified signal for this PyIRC instance."""
         return self.signals[name]
 
+    def has_slots(self, name):
+        """Check if anything is bound to the specified signal.
+
+        Unlike :py:meth:`get_signal`, this does not create the signal.
+        """
+        return name in self.dispatch
+
+    def set_stats(self, stats):
+        """Start or stop timing handlers.
+
+        :param stats:
+            A :py:class:`HandlerStats` instance, or None to stop timing.
+        """
+        self.stats = stats
+        self.recompile()
+
+    def recompile(self):
+        """Rebuild the compiled slot tables of every signal.
+
+        This must be called when :py:attr:`casefold` changes.
+        """
+        self._matchers.clear()
+        for signal in list(self.dispatch.values()):
+            # pylint: disable=protected-access
+            signal._compile()
+
+    def matcher(self, event_filter):
+        """Get an :py:class:`EventFilter` prepared for this storage."""
+        matcher = self._matchers.get(event_filter)
+        if matcher is None:
+            matcher = self._matchers[event_filter] = _FilterMatcher(
+                event_filter, self.casefold)
+
+        return matcher
+
+    def _filtered(self, function, event_filter):
+        """Wrap `function` so it is only called for lines matching
+        `event_filter`.
+
+        Compiled dispatch calls the function directly, and the wrapper is only
+        used when slots are called by Taillight itself. If the line doesn't
+        match, the wrapper returns a sentinel which
+        :py:meth:`DispatchSignal.call` leaves out of the results.
+        """
+        @wraps(function)
+        def filtered(caller, *args, **kwargs):
+            if args and self.matcher(event_filter).match_all(args[0]):
+                return function(caller, *args, **kwargs)
+
+            return _REJECTED
+
+        filtered.event_filter = event_filter
+        return filtered
+
+    def _update(self, signal):
+        """Update the dispatch table entry for `signal`."""
+        if signal.slots:
+            self.dispatch[signal.name] = signal
+        else:
+            self.dispatch.pop(signal.name, None)
+
     def __contains__(self, name):
         return name in self.signals
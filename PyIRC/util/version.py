@@ -51,7 +51,8 @@ def _versionstr():
         req = pkg_resources.require("PyIRC")  # pylint: disable=not-callable
         return req[0].version
     except pkg_resources.DistributionNotFound:
-        return "{major}.{minor}-{status[0]}[{gitversion}]".format(**globals())
+        return "{major}.{minor}-{status[0]}[{gitversion}]".format(
+            **VERSION._asdict())
 
 
 VERSIONSTR = _versionstr()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark syncing, changing, and checking users against large ban,
+exception, and invex lists.
+
+Run from the tests directory: ``python bench_bans.py``.
+"""
+
+
+from time import perf_counter
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Hostmask, Line
+from PyIRC.numerics import Numerics
+
+
+SERVER = "irc.example.com"
+CHANNEL = "#bans"
+ENTRIES = 5000
+MEMBERS = 500
+LISTS = ((Numerics.RPL_BANLIST, 'b'), (Numerics.RPL_EXCEPTLIST, 'e'),
+         (Numerics.RPL_INVITELIST, 'I'))
+
+
+def handshake():
+    """Build the lines to register and join the channel."""
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "CHANMODES=beI,k,l,imnpst :are supported by this server".format(
+            SERVER),
+        ":bench!bench@bench JOIN {}".format(CHANNEL),
+    ]
+    return [Line.parse(line) for line in lines]
+
+
+def sync():
+    """Build the lines listing ENTRIES masks for each list mode."""
+    return [Line.parse(":{} {} bench {} *!*@host-{}.{}.example.com "
+                       "op!op@op.host 1400000000".format(
+                           SERVER, numeric.value, CHANNEL, i, mode))
+            for numeric, mode in LISTS for i in range(ENTRIES)]
+
+
+def deltas():
+    """Build MODE lines removing and re-adding masks throughout the lists."""
+    lines = []
+    for i in range(0, ENTRIES, 10):
+        for _, mode in LISTS:
+            mask = "*!*@HOST-{}.{}.EXAMPLE.COM".format(i, mode)
+            lines.append(":op!op@op.host MODE {} -{} {}".format(CHANNEL, mode,
+                                                                 mask))
+            lines.append(":op!op@op.host MODE {} +{} {}".format(CHANNEL, mode,
+                                                                 mask))
+
+    return [Line.parse(line) for line in lines]
+
+
+def joins():
+    """Build the lines for MEMBERS users joining, some of them banned."""
+    return [Line.parse(":user{0}!~u{0}@host-{1}.b.example.com JOIN {2}".format(
+        i, i * 37, CHANNEL)) for i in range(MEMBERS)]
+
+
+def linear_banned(channel, user):
+    """Check a user against each ban and exception in turn."""
+    def matches(mode):
+        return any(user.match(entry.string)
+                   for entry in channel.modes[mode].entries())
+
+    return matches('b') and not matches('e')
+
+
+def timed(irc, lines):
+    """Return the time taken to receive lines, in milliseconds."""
+    start = perf_counter()
+    for line in lines:
+        IRCBase.recv(irc, line)
+
+    return (perf_counter() - start) * 1000
+
+
+def main():
+    """Print the time taken by each operation."""
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    irc.connect()
+    for line in handshake():
+        IRCBase.recv(irc, line)
+
+    channel = irc.channel_track.get_channel(CHANNEL)
+    changes = deltas()
+    print("sync {:,} entries: {:10.1f} ms".format(len(LISTS) * ENTRIES,
+                                                  timed(irc, sync())))
+    print("{:,} mode changes: {:10.1f} ms".format(len(changes),
+                                                  timed(irc, changes)))
+
+    timed(irc, joins())
+    users = [irc.user_track.get_user(nick) for nick in channel.users]
+    hostmasks = [Hostmask(nick=user.nick, username=user.username,
+                          host=user.host) for user in users]
+    for name, check, subjects in (
+            ("linear", linear_banned, hostmasks),
+            ("is_banned", irc.ban_track.is_banned, users)):
+        start = perf_counter()
+        banned = sum(1 for user in subjects if check(channel, user))
+        print("{:10} {:,} of {:,} members banned: {:8.1f} ms".format(
+            name, banned, len(subjects), (perf_counter() - start) * 1000))
+
+    start = perf_counter()
+    banned = irc.ban_track.banned_members(channel)
+    print("banned_members: {:,} banned: {:8.1f} ms".format(
+        len(banned), (perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main()
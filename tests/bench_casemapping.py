@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark the casemapped containers against IRCString keys.
+
+Run from the tests directory: ``python bench_casemapping.py``.
+"""
+
+
+from collections import UserDict
+from timeit import repeat
+
+from PyIRC.casemapping import IRCDict, IRCString, FoldedDict, casefolder
+
+
+CASE = IRCString.RFC1459
+NICKS = ["Nick[{}]".format(i) for i in range(10000)]
+LOOKUPS = [nick.lower().replace("[", "{") for nick in NICKS]
+
+
+# pylint: disable=too-many-ancestors
+class IRCStringDict(UserDict):
+
+    """A dictionary wrapping each key in an IRCString, as IRCDict used to."""
+
+    def __init__(self, case):
+        self.case = case
+        super().__init__()
+
+    def __getitem__(self, key):
+        return super().__getitem__(IRCString(self.case, key))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(IRCString(self.case, key), value)
+
+    def __contains__(self, key):
+        return super().__contains__(IRCString(self.case, key))
+
+
+def irc_string_casecmp(string, other):
+    """Compare strings by casefolding IRCStrings, as IRCBase used to."""
+    return (IRCString(CASE, string).casefold() ==
+            IRCString(CASE, other).casefold())
+
+
+def folded_casecmp(string, other):
+    """Compare strings with the casemapping's fold function, as IRCBase
+    does."""
+    fold = casefolder(CASE)
+    return fold(string) == fold(other)
+
+
+def per_op(func, count):
+    """Return the best time taken by func, in nanoseconds per operation."""
+    return min(repeat(func, number=1, repeat=5)) * 1e9 / count
+
+
+def bench(kind):
+    """Return the (insert, lookup, contains) timings for a dictionary
+    type."""
+    full = kind(CASE)
+    for nick in NICKS:
+        full[nick] = None
+
+    def insert():
+        new = kind(CASE)
+        for nick in NICKS:
+            new[nick] = None
+
+    def lookup():
+        for nick in LOOKUPS:
+            full[nick]  # pylint: disable=pointless-statement
+
+    def contains():
+        for nick in LOOKUPS:
+            nick in full  # pylint: disable=pointless-statement
+
+    count = len(NICKS)
+    return (per_op(insert, count), per_op(lookup, count),
+            per_op(contains, count))
+
+
+def main():
+    """Print the timings."""
+    print("{:14} {:>10} {:>10} {:>10}".format("ns/op", "insert", "lookup",
+                                                 "contains"))
+    for kind in (IRCStringDict, IRCDict, FoldedDict):
+        print("{:14} {:10.0f} {:10.0f} {:10.0f}".format(kind.__name__,
+                                                          *bench(kind)))
+
+    pairs = list(zip(NICKS, LOOKUPS))
+    for func in (irc_string_casecmp, folded_casecmp):
+        timing = per_op(lambda: [func(a, b) for a, b in pairs], len(pairs))
+        print("{:22} {:10.0f} ns/op".format(func.__name__, timing))
+
+
+if __name__ == "__main__":
+    main()
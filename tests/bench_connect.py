@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark setting up connections with the bot extensions.
+
+Run from the tests directory: ``python bench_connect.py``.
+"""
+
+
+from timeit import repeat
+
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+
+
+def connections(count=1000):
+    """Create count connections with bot_recommended extensions."""
+    return [NullSocket((None, None), "bench", "bench", "Benchmark",
+                       bot_recommended, sasl_username="bench",
+                       sasl_password="bench") for _ in range(count)]
+
+
+def main():
+    """Print the time taken to create the connections."""
+    best = min(repeat(connections, number=1, repeat=5))
+    print("1,000 connections: {:8.2f} ms ({:.1f} us each)".format(
+        best * 1000, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
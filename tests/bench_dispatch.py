@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark dispatching a busy network's traffic to a bot.
+
+Run from the tests directory: ``python bench_dispatch.py``.
+"""
+
+
+from random import Random
+from timeit import repeat
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+
+
+SERVER = "irc.example.com"
+CHANNELS = ["#busy{}".format(i) for i in range(5)]
+
+
+def mask(i):
+    """Return the hostmask of user i."""
+    return "user{0}!~ident{0}@host-{0}.example.com".format(i)
+
+
+def handshake(users=500):
+    """Build the lines to register and join the channels."""
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "CHANMODES=beI,k,l,imnpst :are supported by this server".format(
+            SERVER),
+    ]
+
+    for channel in CHANNELS:
+        lines.append(":bench!bench@bench JOIN {}".format(channel))
+        for i in range(0, users, 25):
+            lines.append(":{} 353 bench = {} :{}".format(
+                SERVER, channel, " ".join("user{}".format(j)
+                                          for j in range(i, i + 25))))
+
+        lines.append(":{} 366 bench {} :End of /NAMES list.".format(
+            SERVER, channel))
+
+    return [Line.parse(line) for line in lines]
+
+
+def transcript(users=500, count=10000):
+    """Build a transcript of traffic which leaves the state unchanged."""
+    rand = Random(1)
+    lines = []
+    while len(lines) < count:
+        user = rand.randrange(users)
+        channel = rand.choice(CHANNELS)
+        kind = rand.random()
+        if kind < 0.75:
+            lines.append(":{} PRIVMSG {} :message {} with some words".format(
+                mask(user), channel, len(lines)))
+        elif kind < 0.8:
+            lines.append(":{} NOTICE {} :notice {}".format(
+                mask(user), channel, len(lines)))
+        elif kind < 0.85:
+            lines.append(":{} PART {} :bye".format(mask(user), channel))
+            lines.append(":{} JOIN {}".format(mask(user), channel))
+        elif kind < 0.88:
+            lines.append(":{} NICK away{}".format(mask(user), user))
+            lines.append(":away{0}!~ident{0}@host-{0}.example.com NICK "
+                         "user{0}".format(user))
+        elif kind < 0.91:
+            lines.append(":{} MODE {} +v user{}".format(mask(0), channel,
+                                                         user))
+            lines.append(":{} MODE {} -v user{}".format(mask(0), channel,
+                                                         user))
+        elif kind < 0.93:
+            lines.append(":{} TOPIC {} :topic {}".format(mask(0), channel,
+                                                         len(lines)))
+        elif kind < 0.96:
+            lines.append(":{} AWAY :gone".format(mask(user)))
+        else:
+            # Numerics and commands nothing handles
+            lines.append(":{} {} bench :something".format(
+                SERVER, rand.choice(("250", "251", "255", "265", "266",
+                                     "372", "WALLOPS"))))
+
+    return [Line.parse(line) for line in lines]
+
+
+def new_bot():
+    """Create a bot connection that has joined the channels."""
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    irc.connect()
+    for line in handshake():
+        IRCBase.recv(irc, line)
+
+    return irc
+
+
+def lines_per_second(irc, lines, number=5):
+    """Return the best lines-per-second rate of receiving lines."""
+    def run():
+        for line in lines:
+            IRCBase.recv(irc, line)
+
+        irc.sendq.queue.clear()
+
+    best = min(repeat(run, number=number, repeat=5))
+    return (len(lines) * number) / best
+
+
+def main():
+    """Print the dispatch rates."""
+    irc = new_bot()
+    lines = transcript()
+    unhandled = [Line.parse(":{} 372 bench :- motd".format(SERVER))] * 10000
+
+    print("transcript: {:12,.0f} lines/s".format(
+        lines_per_second(irc, lines)))
+    print("unhandled:  {:12,.0f} lines/s".format(
+        lines_per_second(irc, unhandled)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark PRIVMSG dispatch to many per-channel command plugins.
+
+Each plugin handles commands in its own channel, either checking the line
+itself or with bind-time filters.
+
+Run from the tests directory: ``python bench_filters.py``.
+"""
+
+
+from random import Random
+from timeit import repeat
+
+from PyIRC.extensions import BaseExtension
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+from PyIRC.signal import event
+
+
+PLUGINS = 50
+
+
+def checking_plugin(channel):
+    """Create a plugin which checks the channel and prefix itself."""
+    class Checking(BaseExtension):
+        """Check every PRIVMSG."""
+
+        @event("commands", "PRIVMSG")
+        def command(self, _, line):
+            params = line.params
+            if self.casefold(params[0]) != channel:
+                return
+
+            if not params[-1].startswith("!"):
+                return
+
+    Checking.__name__ = "Checking" + channel
+    return Checking
+
+
+def filtered_plugin(channel):
+    """Create a plugin which uses bind-time filters."""
+    class Filtered(BaseExtension):
+        """Only handle commands in one channel."""
+
+        @event("commands", "PRIVMSG", target=channel, prefix="!")
+        def command(self, _, line):
+            pass
+
+    Filtered.__name__ = "Filtered" + channel
+    return Filtered
+
+
+def transcript(count=10000):
+    """Build messages to random channels, a tenth of which are commands."""
+    rand = Random(1)
+    lines = []
+    for i in range(count):
+        channel = "#chan{}".format(rand.randrange(PLUGINS))
+        text = "!cmd" if rand.random() < 0.1 else "message {}".format(i)
+        lines.append(Line.parse(":user!ident@host PRIVMSG {} :{}".format(
+            channel, text)))
+
+    return lines
+
+
+def lines_per_second(plugin, lines, number=5):
+    """Return the best lines-per-second rate of dispatching lines."""
+    extensions = [plugin("#chan{}".format(i)) for i in range(PLUGINS)]
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark", extensions)
+
+    def run():
+        for line in lines:
+            irc.call_event("commands", "PRIVMSG", line)
+
+    best = min(repeat(run, number=number, repeat=5))
+    return (len(lines) * number) / best
+
+
+def main():
+    """Print the dispatch rates."""
+    lines = transcript()
+    print("{} plugins checking:  {:10,.0f} lines/s".format(
+        PLUGINS, lines_per_second(checking_plugin, lines)))
+    print("{} plugins filtered:  {:10,.0f} lines/s".format(
+        PLUGINS, lines_per_second(filtered_plugin, lines)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark framing a NAMES burst for a 20,000 user channel.
+
+Run from the tests directory: ``python bench_framing.py``.
+"""
+
+
+from timeit import repeat
+
+from PyIRC.io.framing import LineFramer
+from PyIRC.line import Line
+
+
+def names_burst(users=20000, per_line=25):
+    """Build the raw NAMES reply for a channel with the given user count."""
+    nicks = ["@user{0}!~ident{0}@host-{0}.example.com".format(i)
+             for i in range(users)]
+
+    lines = []
+    for i in range(0, users, per_line):
+        lines.append(":irc.example.com 353 Test = #huge :" +
+                     " ".join(nicks[i:i + per_line]))
+
+    lines.append(":irc.example.com 366 Test #huge :End of /NAMES list.")
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+def chunked(data, size):
+    """Split data into chunks as they would be read from a socket."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def legacy_frame(chunks):
+    """Frame lines the way the I/O backends used to."""
+    pending = b''
+    count = 0
+    for chunk in chunks:
+        data = pending + chunk
+        lines = data.split(b'\r\n')
+        pending = lines.pop()
+
+        for line in lines:
+            Line.parse(line.decode('utf-8', 'ignore'))
+            count += 1
+
+    return count
+
+
+def framer_frame(chunks):
+    """Frame lines with LineFramer."""
+    framer = LineFramer()
+    count = 0
+    for chunk in chunks:
+        count += len(framer.feed(chunk))
+
+    return count
+
+
+def main():
+    """Print the time taken to frame the burst."""
+    data = names_burst()
+    print("NAMES burst: {:,} bytes".format(len(data)))
+
+    for size in (512, 4096, 65536):
+        chunks = chunked(data, size)
+        assert legacy_frame(chunks) == framer_frame(chunks)
+
+        for name, frame in (("legacy", legacy_frame),
+                            ("framer", framer_frame)):
+            best = min(repeat(lambda: frame(chunks), number=5, repeat=5)) / 5
+            print("{:>6} byte reads, {}: {:8.2f} ms".format(size, name,
+                                                            best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Shared harness for the benchmarks that simulate time."""
+
+
+from sched import scheduler
+
+from PyIRC.io.null import NullSocket
+
+
+SERVER = "irc.example.com"
+WINDOW = 10
+
+
+class Clock:
+
+    """A simulated clock, advanced by sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        """Get the simulated time."""
+        return self.now
+
+    def sleep(self, delay):
+        """Advance the simulated time."""
+        self.now += delay
+
+
+def simulated_connection(extensions):
+    """Create a connected NullSocket whose scheduler runs on a simulated
+    clock.
+
+    UserTrack's WHO sync and WHOIS queue are switched to the simulated clock
+    as well, where they are present.
+
+    :returns:
+        A tuple of the connection and its :py:class:`Clock`.
+    """
+    clock = Clock()
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark", extensions)
+    irc.scheduler = scheduler(clock.time, clock.sleep)
+    irc.connect()
+
+    for name in ("who_sync", "whois_queue"):
+        limiter = getattr(irc.user_track, name, None)
+        if limiter is not None:
+            limiter.clock = clock.time
+            limiter.stamp = clock.time()
+
+    return irc, clock
+
+
+def record_sends(irc, clock, commands, reply=None):
+    """Replace the connection's send, recording when commands are sent.
+
+    :param commands:
+        The commands to record; anything else is dropped.
+
+    :param reply:
+        If given, called with the params of each recorded command, to
+        simulate the server answering it.
+
+    :returns:
+        The list the send times are appended to.
+    """
+    sent = []
+
+    def send(command, params, tags=None):
+        if command in commands:
+            sent.append(clock.time())
+            if reply is not None:
+                reply(params)
+
+    irc.send = send
+    return sent
+
+
+def peak(times):
+    """Get the most requests sent within WINDOW seconds."""
+    start = 0
+    most = 0
+    for end, time in enumerate(times):
+        while time - times[start] >= WINDOW:
+            start += 1
+
+        most = max(most, end - start + 1)
+
+    return most
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark the line parser against the reference parser, and the lazy
+parsers against parsing whole lines up front.
+
+Run from the tests directory: ``python bench_line.py``.
+"""
+
+
+from timeit import repeat
+
+from PyIRC.line import Line, _tokenize
+from line_corpus import CORPUS, legacy_tokenize
+
+
+def lines_per_second(parse, lines, number=200):
+    """Return the best lines-per-second rate of a parser over lines."""
+    def run():
+        for line in lines:
+            parse(line)
+
+    best = min(repeat(run, number=number, repeat=5))
+    return (len(lines) * number) / best
+
+
+def decode_parse(data):
+    """Parse a line the way the I/O backends used to."""
+    return Line.parse(data.decode('utf-8', 'ignore')).command
+
+
+def parse_bytes(data):
+    """Parse a line from bytes, looking only at the command."""
+    return Line.parse_bytes(data).command
+
+
+def parse_lazy(line):
+    """Parse a line in lazy mode, looking only at the command."""
+    return Line.parse(line, lazy=True).command
+
+
+TAGGED = ["@time=2019-05-01T12:00:{:02}.000Z;msgid=Zr5Nxd2k{:04};"
+          "account=elizacat :n!u@h PRIVMSG #PyIRC :message {}".format(
+              i % 60, i, i) for i in range(100)]
+"""Lines as sent by servers with server-time, msgid, and account-tag."""
+
+
+def parse_all_tags(line):
+    """Parse a line and all of its tags."""
+    return Line.parse(line).tags.tags
+
+
+def parse_no_tags(line):
+    """Parse a line without looking at its tags."""
+    return Line.parse(line).command
+
+
+def main():
+    """Print the parse rates."""
+    legacy = lines_per_second(legacy_tokenize, CORPUS)
+    current = lines_per_second(_tokenize, CORPUS)
+
+    print("legacy parser:  {:12,.0f} lines/s".format(legacy))
+    print("current parser: {:12,.0f} lines/s".format(current))
+    print("speedup:        {:12.1f}x".format(current / legacy))
+
+    eager = lines_per_second(Line.parse, CORPUS)
+    lazy = lines_per_second(parse_lazy, CORPUS)
+
+    print("parse:          {:12,.0f} lines/s".format(eager))
+    print("lazy parse:     {:12,.0f} lines/s".format(lazy))
+    print("speedup:        {:12.1f}x".format(lazy / eager))
+
+    raw = [line.encode('utf-8') for line in CORPUS]
+    eager = lines_per_second(decode_parse, raw)
+    lazy = lines_per_second(parse_bytes, raw)
+
+    print("decode + parse: {:12,.0f} lines/s".format(eager))
+    print("parse_bytes:    {:12,.0f} lines/s".format(lazy))
+    print("speedup:        {:12.1f}x".format(lazy / eager))
+
+    eager = lines_per_second(parse_all_tags, TAGGED)
+    lazy = lines_per_second(parse_no_tags, TAGGED)
+
+    print("tags parsed:    {:12,.0f} lines/s".format(eager))
+    print("tags untouched: {:12,.0f} lines/s".format(lazy))
+    print("speedup:        {:12.1f}x".format(lazy / eager))
+
+
+if __name__ == "__main__":
+    main()
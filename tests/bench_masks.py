@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark matching hostmasks against a large ban list.
+
+Run from the tests directory: ``python bench_masks.py``.
+"""
+
+
+from random import Random
+from timeit import repeat
+
+from PyIRC.line import Hostmask, MaskSet
+
+
+def ban_list(count=5000, seed=0):
+    """Build a ban list with a realistic mix of mask shapes."""
+    rand = Random(seed)
+    masks = []
+    for i in range(count):
+        kind = rand.random()
+        if kind < 0.5:
+            masks.append("*!*@host-{}.example.com".format(i))
+        elif kind < 0.7:
+            masks.append("*!*@*.isp{}.example.net".format(i))
+        elif kind < 0.8:
+            masks.append("*!*@198.51.{}.*".format(i % 256))
+        elif kind < 0.9:
+            masks.append("troll{}!*@*".format(i))
+        else:
+            masks.append("*!*spam{}*@*".format(i))
+
+    return masks
+
+
+def joining_users(count=100, seed=1):
+    """Build hostmasks for users joining the channel."""
+    rand = Random(seed)
+    return [Hostmask.parse("user{0}!~u{0}@host-{1}.example.com".format(
+        i, rand.randrange(100000))) for i in range(count)]
+
+
+def linear(masks, users):
+    """Check each user against each mask in turn."""
+    return sum(1 for user in users for mask in masks if user.match(mask))
+
+
+def indexed(masks, users):
+    """Check each user against a MaskSet."""
+    return sum(len(masks.match(user)) for user in users)
+
+
+def main():
+    """Print the time taken to check the users against the ban list."""
+    masks = ban_list()
+    users = joining_users()
+    maskset = MaskSet(masks)
+    assert linear(masks, users) == indexed(maskset, users)
+
+    print("{:,} masks, {:,} users".format(len(masks), len(users)))
+
+    before = min(repeat(lambda: linear(masks, users), number=1, repeat=1))
+    after = min(repeat(lambda: indexed(maskset, users), number=10,
+                       repeat=5)) / 10
+    build = min(repeat(lambda: MaskSet(masks), number=10, repeat=5)) / 10
+
+    print("Hostmask.match: {:10.2f} ms".format(before * 1000))
+    print("MaskSet.match:  {:10.2f} ms".format(after * 1000))
+    print("MaskSet build:  {:10.2f} ms".format(build * 1000))
+    print("speedup:        {:10.1f}x".format(before / after))
+
+
+if __name__ == "__main__":
+    main()
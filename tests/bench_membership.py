@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark leaving channels, changing nicks, and switching casemapping on a
+bot in many channels.
+
+Run from the tests directory: ``python bench_membership.py``.
+"""
+
+
+from time import perf_counter
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+
+
+SERVER = "irc.example.com"
+CHANNELS = 2000
+MEMBERS = 100
+PER_USER = 10
+
+
+def handshake():
+    """Build the lines to join the channels, for CHANNELS * MEMBERS
+    memberships by users each in PER_USER channels."""
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "CHANMODES=beI,k,l,imnpst :are supported by this server".format(
+            SERVER),
+    ]
+
+    users = CHANNELS * MEMBERS // PER_USER
+    for chan in range(CHANNELS):
+        channel = "#chan{}".format(chan)
+        lines.append(":bench!bench@bench JOIN {}".format(channel))
+
+        first = (chan // PER_USER) * MEMBERS
+        nicks = ["user{}".format((first + i) % users)
+                 for i in range(MEMBERS)]
+        for i in range(0, MEMBERS, 25):
+            lines.append(":{} 353 bench = {} :{}".format(
+                SERVER, channel, " ".join(nicks[i:i + 25])))
+
+        lines.append(":{} 366 bench {} :End of /NAMES list.".format(
+            SERVER, channel))
+
+    return [Line.parse(line) for line in lines]
+
+
+def timed(irc, lines):
+    """Return the time taken to receive lines, in milliseconds per line."""
+    start = perf_counter()
+    for line in lines:
+        IRCBase.recv(irc, line)
+
+    return (perf_counter() - start) * 1000 / len(lines)
+
+
+def main():
+    """Print the time taken by each operation."""
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    irc.connect()
+
+    start = perf_counter()
+    for line in handshake():
+        IRCBase.recv(irc, line)
+
+    irc.sendq.queue.clear()
+    print("joined {:,} channels, {:,} memberships in {:.1f} s".format(
+        CHANNELS, CHANNELS * MEMBERS, perf_counter() - start))
+
+    nicks = []
+    for i in range(100):
+        nicks.append(Line.parse(":user{0}!u@h NICK renamed{0}".format(i)))
+        nicks.append(Line.parse(":renamed{0}!u@h NICK user{0}".format(i)))
+
+    parts = [Line.parse(":bench!bench@bench PART #chan{}".format(chan))
+             for chan in range(0, CHANNELS, 20)]
+
+    cases = [Line.parse(":{} 005 bench CASEMAPPING={} :are supported by "
+                        "this server".format(SERVER, case))
+             for case in ("ascii", "rfc1459")]
+
+    print("nick change: {:8.3f} ms".format(timed(irc, nicks)))
+    print("self-part:   {:8.3f} ms".format(timed(irc, parts)))
+    print("case change: {:8.3f} ms".format(timed(irc, cases)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark the memory used to track users and channel memberships.
+
+Run from the tests directory: ``python bench_memory.py``.
+"""
+
+
+import gc
+import tracemalloc
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+
+
+SERVER = "irc.example.com"
+USERS = 20000
+MEMBERS = 100
+
+
+def mask(i):
+    """Return the hostmask of user i, with a shared ident."""
+    return "user{0}!~bot@gateway/web/x-{0}".format(i)
+
+
+def channel_lines(first, channels, who):
+    """Build the lines for joining channels holding all the users, MEMBERS
+    to a channel, optionally with a WHO reply for each user."""
+    lines = []
+    for chan in range(first, first + channels):
+        channel = "#chan{}".format(chan)
+        lines.append(":bench!bench@bench JOIN {}".format(channel))
+
+        users = range((chan - first) * MEMBERS, (chan - first + 1) * MEMBERS)
+        for i in range(0, MEMBERS, 25):
+            lines.append(":{} 353 bench = {} :{}".format(
+                SERVER, channel, " ".join(
+                    ("@" if j % 50 == 0 else "") + mask(j)
+                    for j in users[i:i + 25])))
+
+        lines.append(":{} 366 bench {} :End of /NAMES list.".format(
+            SERVER, channel))
+
+        if not who:
+            continue
+
+        for j in users:
+            lines.append(":{} 352 bench {} ~bot gateway/web/x-{} "
+                         "leaf{}.example.com user{} H :0 User {}".format(
+                             SERVER, channel, j, j % 4, j, j))
+
+        lines.append(":{} 315 bench {} :End of /WHO list.".format(
+            SERVER, channel))
+
+    return [Line.parse(line) for line in lines]
+
+
+def traced(irc, lines):
+    """Return the memory retained after receiving lines, in bytes."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    for line in lines:
+        IRCBase.recv(irc, line)
+
+    irc.sendq.queue.clear()
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - before
+
+
+def main():
+    """Print the memory used per user and per membership."""
+    channels = USERS // MEMBERS
+    users = channel_lines(0, channels, True)
+    memberships = channel_lines(channels, channels, False)
+
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    irc.connect()
+    for line in Line.parse(":{} 001 bench :Welcome".format(SERVER)), \
+            Line.parse(":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# "
+                       "PREFIX=(ov)@+ CHANMODES=beI,k,l,imnpst :are "
+                       "supported by this server".format(SERVER)):
+        IRCBase.recv(irc, line)
+
+    tracemalloc.start()
+
+    # Each user enters in one channel, then every user joins a second one
+    first = traced(irc, users)
+    second = traced(irc, memberships)
+
+    tracemalloc.stop()
+
+    print("{:,} users in {:,} channels".format(USERS, channels))
+    print("per user:       {:8,.0f} bytes".format(first / USERS))
+    print("per membership: {:8,.0f} bytes".format(second / USERS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark a mass-mode flood on a channel.
+
+Run from the tests directory: ``python bench_modes.py``.
+"""
+
+
+from timeit import repeat
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+
+
+SERVER = "irc.example.com"
+CHANNEL = "#flood"
+
+
+def new_bot(users=100, per_mode=False):
+    """Create a bot that has joined a channel with the given users.
+
+    If per_mode is set, a handler is bound to the per-mode events.
+    """
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    if per_mode:
+        for mode_call in ("mode_prefix", "mode_list", "mode_key",
+                          "mode_param", "mode_normal"):
+            irc.signals.get_signal(("modes", mode_call)).add(
+                lambda caller, setter, target, mode: None)
+
+    irc.connect()
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "CHANMODES=beI,k,l,imnpst :are supported by this server".format(
+            SERVER),
+        ":bench!bench@bench JOIN {}".format(CHANNEL),
+        ":{} 353 bench = {} :{}".format(SERVER, CHANNEL, " ".join(
+            "user{}".format(i) for i in range(users))),
+        ":{} 366 bench {} :End of /NAMES list.".format(SERVER, CHANNEL),
+    ]
+    for line in lines:
+        IRCBase.recv(irc, Line.parse(line))
+
+    return irc
+
+
+def flood(users=100, count=10000):
+    """Build MODE lines each changing eight modes."""
+    lines = []
+    for i in range(count):
+        nicks = ["user{}".format((i + j) % users) for j in range(4)]
+        lines.append(":op!op@op MODE {} +oooo-vvvv {} {}".format(
+            CHANNEL, " ".join(nicks), " ".join(nicks)))
+
+    return [Line.parse(line) for line in lines]
+
+
+def lines_per_second(irc, lines, number=3):
+    """Return the best lines-per-second rate of receiving lines."""
+    def run():
+        for line in lines:
+            IRCBase.recv(irc, line)
+
+    best = min(repeat(run, number=number, repeat=3))
+    return (len(lines) * number) / best
+
+
+def main():
+    """Print the rates with and without per-mode handlers."""
+    lines = flood()
+    print("mode_change only:   {:10,.0f} lines/s".format(
+        lines_per_second(new_bot(), lines)))
+    print("per-mode handlers:  {:10,.0f} lines/s".format(
+        lines_per_second(new_bot(per_mode=True), lines)))
+
+
+if __name__ == "__main__":
+    main()
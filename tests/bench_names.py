@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark a bot joining a huge channel and receiving its NAMES burst.
+
+Run from the tests directory: ``python bench_names.py``.
+"""
+
+
+import tracemalloc
+from time import perf_counter
+
+import PyIRC.base
+from PyIRC.base import Event, IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.io.null import NullSocket
+from PyIRC.line import Line
+
+
+SERVER = "irc.example.com"
+CHANNEL = "#huge"
+
+
+class CountingEvent(Event):
+    """An Event that counts how many are created."""
+
+    __slots__ = []
+
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        CountingEvent.created += 1
+
+
+def burst(users=30000):
+    """Build the lines for joining a channel with the given users."""
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "CHANMODES=beI,k,l,imnpst :are supported by this server".format(
+            SERVER),
+        ":bench!bench@bench JOIN {}".format(CHANNEL),
+    ]
+
+    for i in range(0, users, 25):
+        lines.append(":{} 353 bench = {} :{}".format(
+            SERVER, CHANNEL, " ".join(
+                "{}user{}".format("@" if j % 50 == 0 else "", j)
+                for j in range(i, i + 25))))
+
+    lines.append(":{} 366 bench {} :End of /NAMES list.".format(
+        SERVER, CHANNEL))
+    return [Line.parse(line) for line in lines]
+
+
+def new_bot(pool_size, per_user):
+    """Create a bot, optionally with a handler for per-user burst events."""
+    irc = NullSocket((None, None), "bench", "bench", "Benchmark",
+                     bot_recommended)
+    irc.event_pool_size = pool_size
+    if per_user:
+        irc.signals.get_signal(("scope", "user_burst")).add(
+            lambda caller, scope: None)
+
+    irc.connect()
+    return irc
+
+
+def run(lines, pool_size=8, per_user=False):
+    """Receive the lines on new bots, returning the best time, the events
+    created and the peak traced memory."""
+    def burst_time():
+        irc = new_bot(pool_size, per_user)
+        start = perf_counter()
+        for line in lines:
+            IRCBase.recv(irc, line)
+
+        return perf_counter() - start
+
+    elapsed = min(burst_time() for _ in range(3))
+
+    irc = new_bot(pool_size, per_user)
+    CountingEvent.created = 0
+    tracemalloc.start()
+    for line in lines:
+        IRCBase.recv(irc, line)
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, CountingEvent.created, peak
+
+
+def main():
+    """Print the time and allocations for the burst."""
+    lines = burst()
+    PyIRC.base.Event = CountingEvent
+    try:
+        for name, kwargs in (("batched", {}),
+                             ("unpooled", {"pool_size": 0}),
+                             ("per-user", {"per_user": True})):
+            elapsed, created, peak = run(lines, **kwargs)
+            print("{:9} {:8.1f} ms {:8,} events {:12,} bytes peak".format(
+                name + ":", elapsed * 1000, created, peak))
+    finally:
+        PyIRC.base.Event = Event
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    events = [Event(None, None) for _ in range(10000)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print("Event:    {:8.1f} bytes each".format(size / len(events)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark importing the numerics, and looking them up by number and by
+name.
+
+Run from the tests directory: ``python bench_numerics.py``.
+"""
+
+
+import os
+import subprocess
+import sys
+
+from timeit import repeat
+
+import PyIRC
+
+from PyIRC.numerics import Numerics, numeric_name, numeric_for_name
+
+
+def import_time(statement, module, runs=10):
+    """Return the best self-time of importing a module, in microseconds.
+
+    Each run is a new interpreter started with ``-X importtime``, which needs
+    Python 3.7 or later.
+    """
+    env = dict(os.environ)
+    path = os.path.dirname(os.path.dirname(PyIRC.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (path, env.get("PYTHONPATH"))))
+
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement], env=env,
+            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+        for line in result.stderr.splitlines():
+            own, _, name = line[len("import time:"):].split("|")
+            if name.strip() == module and own.strip().isdigit():
+                own = int(own)
+                best = own if best is None else min(best, own)
+
+    return best
+
+
+def per_lookup(lookup, keys, number=200):
+    """Return the best time per lookup, in nanoseconds."""
+    def run():
+        for key in keys:
+            lookup(key)
+
+    best = min(repeat(run, number=number, repeat=5))
+    return best / (len(keys) * number) * 1e9
+
+
+def main():
+    """Print the import and lookup times."""
+    if sys.version_info >= (3, 7):
+        imports = [
+            ("PyIRC.numerics", import_time(
+                "from PyIRC.numerics import Numerics; Numerics.RPL_WELCOME",
+                "PyIRC.numerics")),
+            ("PyIRC._numerics_enum", import_time(
+                "import PyIRC._numerics_enum", "PyIRC._numerics_enum")),
+        ]
+
+        for name, time in imports:
+            print("{:24} {:8} us".format(name + ":", time))
+
+    numerics = [member.value for member in Numerics]
+    names = list(Numerics.__members__)
+
+    times = [
+        ("Numerics(numeric).name", per_lookup(
+            lambda numeric: Numerics(numeric).name, numerics)),
+        ("numeric_name(numeric)", per_lookup(numeric_name, numerics)),
+        ("Numerics[name].value", per_lookup(
+            lambda name: Numerics[name].value, names)),
+        ("numeric_for_name(name)", per_lookup(numeric_for_name, names)),
+    ]
+
+    for name, time in times:
+        print("{:24} {:8.0f} ns".format(name + ":", time))
+
+
+if __name__ == "__main__":
+    main()
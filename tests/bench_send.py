@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Benchmark sending messages to a channel.
+
+Run from the tests directory: ``python bench_send.py``.
+"""
+
+
+from sched import scheduler
+from timeit import repeat
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions.basicrfc import BasicRFC
+from PyIRC.line import LineTemplate
+
+
+class BufferIRC(IRCBase):
+    """A backend writing to a buffer, as a socket backend would."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler()
+        self.buffer = bytearray()
+
+    def send(self, command, params, tags=None):
+        line = super().send(command, params, tags)
+        if line is None:
+            return
+
+        self.send_bytes(bytes(line))
+
+    def send_bytes(self, data):
+        self.buffer += data
+
+    def schedule(self, time, callback):
+        return self.scheduler.enter(time, 0, callback)
+
+    def unschedule(self, sched):
+        self.scheduler.cancel(sched)
+
+
+def hook(event, line):  # pylint: disable=unused-argument
+    """A commands_out hook that does nothing."""
+
+
+def lines_per_second(send, messages, number=20):
+    """Return the best lines-per-second rate of a send function."""
+    def run():
+        for message in messages:
+            send(message)
+
+    best = min(repeat(run, number=number, repeat=5))
+    return (len(messages) * number) / best
+
+
+def main():
+    """Print the send rates."""
+    irc = BufferIRC((None, None), "bench", "bench", "Benchmark", [BasicRFC])
+    messages = ["message number {} to the channel".format(i)
+                for i in range(1000)]
+    template = LineTemplate("PRIVMSG", ["#PyIRC"])
+
+    rates = [
+        ("send", lines_per_second(
+            lambda msg: irc.send("PRIVMSG", ["#PyIRC", msg]), messages)),
+        ("send_template", lines_per_second(
+            lambda msg: irc.send_template(template, msg), messages)),
+    ]
+
+    irc.signals.get_signal(("commands_out", "PRIVMSG")).add(hook)
+    rates.append(("send (hooked)", lines_per_second(
+        lambda msg: irc.send("PRIVMSG", ["#PyIRC", msg]), messages)))
+
+    for name, rate in rates:
+        print("{:14} {:12,.0f} lines/s".format(name + ":", rate))
+
+
+if __name__ == "__main__":
+    main()
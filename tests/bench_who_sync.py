@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Simulate syncing users with WHO after joining many channels at once.
+
+Time is simulated, with the server answering each WHO after a fixed delay.
+
+Run from the tests directory: ``python bench_who_sync.py``.
+"""
+
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.line import Line
+from bench_helpers import (SERVER, WINDOW, simulated_connection, record_sends,
+                           peak)
+
+
+CHANNELS = 1500
+REPLY_DELAY = 0.2
+
+
+def simulate(isupport):
+    """Join CHANNELS channels at once, and return the times WHOs were sent
+    and the time the last was answered."""
+    irc, clock = simulated_connection(bot_recommended)
+    answered = []
+
+    def reply(mask):
+        answered.append(clock.time())
+        IRCBase.recv(irc, Line.parse(":{} 315 bench {} :End of /WHO "
+                                     "list.".format(SERVER, mask)))
+
+    def answer(params):
+        irc.scheduler.enter(REPLY_DELAY, 0, reply, (params[0],))
+
+    sent = record_sends(irc, clock, ("WHO",), answer)
+
+    lines = [
+        ":{} 001 bench :Welcome to the network bench".format(SERVER),
+        ":{} 005 bench CASEMAPPING=rfc1459 CHANTYPES=# PREFIX=(ov)@+ "
+        "{} :are supported by this server".format(SERVER, isupport),
+    ]
+    for chan in range(CHANNELS):
+        lines.append(":bench!bench@bench JOIN #chan{}".format(chan))
+        lines.append(":{} 366 bench #chan{} :End of /NAMES list.".format(
+            SERVER, chan))
+
+    for line in lines:
+        IRCBase.recv(irc, Line.parse(line))
+
+    irc.scheduler.run()
+    return sent, max(answered)
+
+
+def main():
+    """Print the request pacing for servers with and without coalescing."""
+    for name, isupport in (("one per WHO", "CHANMODES=b,k,l,imnpst"),
+                           ("TARGMAX=WHO:10", "TARGMAX=WHO:10")):
+        sent, finished = simulate(isupport)
+        print("{:15} {:5,} WHOs, at most {:5,} per {} s, synced in "
+              "{:7.1f} s".format(name, len(sent), peak(sent), WINDOW,
+                                  finished))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Simulate looking up the senders of a wave of messages from unknown users.
+
+Time is simulated, with messages arriving evenly over the wave. Senders
+expire once UserTrack's timeout passes, so those still queued by then are
+dropped rather than looked up.
+
+Run from the tests directory: ``python bench_whois.py``.
+"""
+
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions import bot_recommended
+from PyIRC.line import Line
+from bench_helpers import (SERVER, WINDOW, simulated_connection, record_sends,
+                           peak)
+
+
+SENDERS = 500
+MESSAGES = 3
+WAVE = 10.0
+
+
+def simulate(isupport):
+    """Receive the wave of messages, and return the times lookups were sent
+    and the queue statistics at the end of the wave, if any."""
+    # Lag checking would time out, as nothing answers its pings
+    irc, clock = simulated_connection([name for name in bot_recommended
+                                       if name != "LagCheck"])
+    queue = getattr(irc.user_track, "whois_queue", None)
+    sent = record_sends(irc, clock, ("WHO", "WHOIS"))
+
+    for line in (":{} 001 bench :Welcome to the network bench",
+                 ":{} 005 bench CASEMAPPING=rfc1459 {} :are supported by "
+                 "this server"):
+        IRCBase.recv(irc, Line.parse(line.format(SERVER, isupport)))
+
+    count = SENDERS * MESSAGES
+    for i in range(count):
+        line = Line.parse(":spam{0}!~s{0}@host-{0}.example.com PRIVMSG bench "
+                          ":buy now {1}".format(i % SENDERS, i))
+        irc.scheduler.enter(WAVE * i / count, 0, IRCBase.recv, (irc, line))
+
+    irc.scheduler.run()
+    stats = queue.stats() if queue is not None else None
+    return sent, stats
+
+
+def main():
+    """Print the request pacing with and without WHOX."""
+    for name, isupport in (("WHOIS", "CHANTYPES=#"),
+                           ("WHOX, WHO:10", "WHOX TARGMAX=WHO:10")):
+        sent, stats = simulate(isupport)
+        print("{:13} {:5,} requests, at most {:5,} per {} s, last at "
+              "{:6.1f} s".format(name, len(sent), peak(sent), WINDOW,
+                                 max(sent)))
+        if stats is not None:
+            print("{:13} {:5,} users looked up, {:,} dropped, {:,} "
+                  "merged".format('', stats.sent, stats.dropped,
+                                  stats.merged))
+
+if __name__ == "__main__":
+    main()
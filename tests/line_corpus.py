@@ -0,0 +1,168 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Conformance corpus for the line parser.
+
+This contains a set of lines taken from real-world traffic (and some that are
+merely nasty), along with the original character-at-a-time parser, kept as a
+reference implementation to check the current one against.
+"""
+
+
+import operator
+
+from itertools import takewhile
+from functools import reduce
+
+
+CORPUS = [
+    # Basics
+    "PING",
+    "PING Elizacat",
+    "PING :irc.example.com",
+    "PING Elizacat :test",
+    "PONG irc.example.com :1561234567.123",
+    "ERROR :Closing Link: 127.0.0.1 (Ping timeout: 240 seconds)",
+    "AUTHENTICATE +",
+    # Hostmasks
+    ":lol.org PRIVMSG",
+    ":nick!user@host PRIVMSG #testroom meow :testing",
+    ":nick@host NOTICE Test :hi",
+    ":nick NICK :newnick",
+    ":user1@user2@user3 PRIVMSG #x :liberal hostmasks",
+    ":Elizacat!~elizabeth@interlinked/netadmin/elizacat JOIN #PyIRC",
+    ":Elizacat!~elizabeth@interlinked/netadmin/elizacat JOIN #PyIRC "
+    "elizacat :Elizabeth Myers",
+    ":Elizacat!~elizabeth@interlinked/netadmin/elizacat PART #PyIRC "
+    ":Leaving",
+    ":Elizacat!~elizabeth@interlinked/netadmin/elizacat QUIT "
+    ":Quit: brb",
+    ":Elizacat!~elizabeth@host KICK #PyIRC Test :no bots allowed",
+    ":ChanServ!ChanServ@services. MODE #PyIRC +o Elizacat",
+    ":ChanServ!ChanServ@services. MODE #PyIRC +oooo-vvvv a b c d e f g h",
+    ":ChanServ!ChanServ@services. MODE #PyIRC +b *!*@*.example.com",
+    ":n!u@h TOPIC #PyIRC :The topic: with colons :: and  double  spaces",
+    ":n!u@h PRIVMSG #PyIRC :\x01ACTION waves\x01",
+    ":n!u@h PRIVMSG #PyIRC :\x02bold\x02 \x0304red\x03 \x1fund\x1f",
+    ":n!u@h PRIVMSG #PyIRC :ünïcödé 🐱 text",
+    ":n!u@h PRIVMSG #PyIRC :",
+    ":n!u@h PRIVMSG #PyIRC ::)",
+    ":n!u@h PRIVMSG #PyIRC :   leading spaces in trailing",
+    ":n!u@h PRIVMSG #PyIRC :trailing spaces in trailing   ",
+    ":n!u@h ACCOUNT *",
+    ":n!u@h AWAY",
+    ":n!u@h AWAY :Gone fishing",
+    ":n!u@h CHGHOST newuser new.host",
+    # Numerics
+    ":irc.example.com 001 Test :Welcome to the Test network Test",
+    ":irc.example.com 005 Test CHANTYPES=# EXCEPTS INVEX "
+    "CHANMODES=eIbq,k,flj,CFLMPQScgimnprstz CHANLIMIT=#:120 PREFIX=(ov)@+ "
+    "MAXLIST=bqeI:100 MODES=4 NETWORK=Test KNOCK STATUSMSG=@+ "
+    "CALLERID=g :are supported by this server",
+    ":irc.example.com 353 Test = #PyIRC :@Elizacat +Test a b c d e",
+    ":irc.example.com 353 Test @ #PyIRC :@Elizacat!e@h +Test!t@h ",
+    ":irc.example.com 366 Test #PyIRC :End of /NAMES list.",
+    ":irc.example.com 352 Test #PyIRC ~e host irc.example.com Elizacat H@ "
+    ":0 Elizabeth Myers",
+    ":irc.example.com 354 Test 123 #PyIRC ~e 1.2.3.4 host "
+    "irc.example.com Elizacat H@ 0 elizacat :Elizabeth Myers",
+    ":irc.example.com 332 Test #PyIRC :Welcome to #PyIRC | be nice",
+    ":irc.example.com 333 Test #PyIRC Elizacat!e@h 1404711155",
+    ":irc.example.com 367 Test #PyIRC *!*@bad.host setter!s@h 1404711155",
+    ":irc.example.com 433 * Test :Nickname is already in use.",
+    # Tags
+    "@aaa=bbb;ccc;example.com/ddd=eee :nick!ident@host.com PRIVMSG me "
+    ":Hello",
+    "@time=2019-05-01T12:00:00.000Z :n!u@h PRIVMSG #PyIRC :tagged",
+    "@time=2019-05-01T12:00:00.000Z;msgid=abc;account=elizacat "
+    ":n!u@h PRIVMSG #PyIRC :tagged",
+    "@a=b PING",
+    "@+draft/reply=abc;label=a\\sb\\:c;empty=;flag :n!u@h TAGMSG #PyIRC",
+    "@a=b   :n!u@h    PRIVMSG    #c   :spacey",
+    # Separators and whitespace
+    "PRIVMSG #a  b   c",
+    "PRIVMSG #a b c ",
+    "PRIVMSG #a b c   ",
+    "PRIVMSG #a b\tc",
+    "PRIVMSG #a \tb c",
+    "PRIVMSG #a b\t ",
+    "PRIVMSG:trailing right after command",
+    "PRIVMSG :",
+    "PRIVMSG #a :b :c",
+    "PRIVMSG #a b:c",
+    "CAP * LS :multi-prefix sasl=PLAIN,EXTERNAL account-notify",
+    # Line endings are stripped off the end of the params
+    ":n!u@h PRIVMSG #PyIRC :line ending\r\n",
+    ":n!u@h PRIVMSG #PyIRC line ending\r\n",
+    ":n!u@h PRIVMSG #PyIRC line ending\n",
+    ":n!u@h PRIVMSG #PyIRC :embedded\r\nline ending",
+]
+"""Lines both parsers must agree upon."""
+
+
+INVALID = [
+    " PING",
+    "@tags-but-nothing-else",
+    "@tags :prefix-but-nothing-else",
+    ":prefix-but-nothing-else",
+    ":prefix ",
+    ":prefix :",
+    "@tags ",
+    ":",
+]
+"""Lines both parsers must reject."""
+
+
+def legacy_tokenize(line):
+    """The original character-at-a-time line parser.
+
+    :returns:
+        A (tags, hostmask, command, params) tuple, with tags and hostmask
+        unparsed.
+    """
+    tags = None
+    hostmask = None
+    params = list()
+
+    # Do we have tags?
+    if line[0] == '@':
+        space = line.index(' ')  # Grab the separator
+        tags = line[1:space]
+        line = line[space:].lstrip()
+
+    # Do we have a hostmask?
+    if line[0] == ':':
+        space = line.index(' ')  # Grab the separator
+        hostmask = line[1:space]
+        line = line[space:].lstrip()
+
+    # Grab command
+    command = reduce(operator.concat,
+                     takewhile(lambda char: char not in (' ', ':'), line))
+    assert len(command) > 0
+
+    line = line[len(command):].lstrip().rstrip('\r\n')
+
+    # Retrieve parameters
+    while len(line) > 0:
+        next_param = ''
+        line = line.lstrip()
+
+        if not line:
+            next_param = ''
+            break
+
+        if line[0] == ':':
+            next_param = line[1:]
+            line = ''
+        else:
+            next_param = reduce(operator.concat,
+                                takewhile(lambda char: char != ' ', line))
+            line = line[len(next_param):]
+
+        params.append(next_param)
+
+    return (tags, hostmask, command, params)
@@ -0,0 +1,117 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test calling events on the asyncio backend."""
+
+
+import asyncio
+import unittest
+
+from taillight.signal import SignalDefer
+
+from PyIRC.extensions import BaseExtension
+from PyIRC.extensions.basicrfc import BasicRFC
+from PyIRC.io.asyncio import IRCProtocol
+from PyIRC.line import Line
+from PyIRC.signal import HandlerStats, event
+
+
+class Filtered(BaseExtension):
+    """A handler with a bind-time filter."""
+
+    @event("commands", "PRIVMSG", target="#chan")
+    def chan(self, _, line):  # pylint: disable=unused-argument
+        return "chan"
+
+
+class TestAsyncEvents(unittest.TestCase):
+    """Ensure events are dispatched through the compiled table."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.stats = HandlerStats()
+        self.connection = IRCProtocol((None, None), "test", "test", "Test",
+                                      [BasicRFC], handler_stats=self.stats)
+
+    def tearDown(self):
+        # pylint: disable=protected-access
+        self.connection._call_task.remove_done_callback(
+            self.connection._process_queue_exit)
+        self.connection._call_task.cancel()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def call(self, hclass, event, *args):
+        """Call an event and wait for its results."""
+        _, future = self.connection.call_event(hclass, event, *args)
+        return self.loop.run_until_complete(future)
+
+    def test_unhandled(self):
+        """Ensure unhandled events don't create signals."""
+        self.assertEqual(self.call("test", "nothing"), [])
+        self.assertNotIn(("test", "nothing"), self.connection.signals)
+
+    def test_handled(self):
+        """Ensure plain functions and coroutines are both called."""
+        @asyncio.coroutine
+        def coroutine(_, value):
+            yield from asyncio.sleep(0)
+            return value * 2
+
+        signal = self.connection.signals.get_signal(("test", "call"))
+        signal.add(lambda _, value: value)
+        signal.add(coroutine)
+        self.assertEqual(sorted(self.call("test", "call", 2)), [2, 4])
+
+    def test_timed(self):
+        """Ensure handlers are timed on the asyncio backend too."""
+        def handler(_, value):
+            return value
+
+        self.connection.signals.get_signal(("test", "timed")).add(handler)
+        self.call("test", "timed", 1)
+        self.call("test", "timed", 2)
+
+        timing, = [timing for timing in self.stats.snapshot()
+                   if (timing.hclass, timing.event) == ("test", "timed")]
+        self.assertEqual(timing.calls, 2)
+
+    def test_defer(self):
+        """Ensure deferred calls resume with the next handler."""
+        seen = []
+
+        def defer(_, value):
+            seen.append(("defer", value))
+            raise SignalDefer()
+
+        signal = self.connection.signals.get_signal(("test", "defer"))
+        signal.add(defer, priority=0)
+        signal.add(lambda _, value: seen.append(("after", value)),
+                   priority=10)
+
+        self.call("test", "defer", 1)
+        self.assertEqual(seen, [("defer", 1)])
+        self.assertEqual(signal.last_status, signal.STATUS_DEFER)
+
+        self.call("test", "defer")
+        self.assertEqual(seen, [("defer", 1), ("after", 1)])
+        self.assertEqual(signal.last_status, signal.STATUS_DONE)
+
+    def test_filtered(self):
+        """Ensure rejected handlers are left out of the results either way."""
+        self.connection.load_extension(Filtered)
+        line = Line.parse(":a!b@c PRIVMSG #elsewhere :hi")
+        compiled = self.call("commands", "PRIVMSG", line)
+
+        signal = self.connection.signals.get_signal(("commands", "PRIVMSG"))
+        signal.add(lambda *_: "listener", listener=object())
+        self.assertIsNone(signal.functions)
+        fallback = self.call("commands", "PRIVMSG", line)
+
+        self.assertNotIn("chan", compiled)
+        self.assertEqual(fallback, compiled)
@@ -0,0 +1,133 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test tracking ban lists and checking users against them."""
+
+
+import unittest
+
+from PyIRC.extensions.ircd.hybridfamily import CharybdisServer
+from PyIRC.line import Line, Hostmask
+from PyIRC.numerics import Numerics
+from test_helpers import new_conn_with_handshake, join_line
+
+
+class TestBanTrack(unittest.TestCase):
+    """Test the behaviour of the BanTrack extension."""
+
+    def setUp(self):
+        extensions = ['BasicRFC', 'BaseTrack', 'ChannelTrack', 'BanTrack']
+        self.connection = new_conn_with_handshake(extensions=extensions)
+
+    def test_ban_list(self):
+        """Ensure list modes are kept in order, keyed caselessly by mask."""
+        irc = self.connection
+        name = '#bans'
+        irc.inject_line(join_line(irc, name))
+        channel = irc.channel_track.get_channel(name)
+        bans = channel.modes['b']
+        generation = channel.list_generation
+
+        for mask, setter in (('*!*@Evil[1]', 'a!a@a'), ('*!*@good', 'b!b@b'),
+                             ('*!*@evil{1}', 'c!c@c')):
+            irc.inject_line(Line(hostmask='nonexistent.test.server',
+                                 command=Numerics.RPL_BANLIST,
+                                 params=(irc.nick, name, mask, setter,
+                                         '1400000000')))
+
+        # The third line replaces the first in place
+        self.assertEqual([(e.string, e.setter.nick, e.timestamp)
+                          for e in bans.entries()],
+                         [('*!*@evil{1}', 'c', 1400000000),
+                          ('*!*@good', 'b', 1400000000)])
+        self.assertEqual(list(bans), ['*!*@Evil[1]', '*!*@good'])
+        self.assertEqual(channel.list_generation, generation + 3)
+
+        setter = Hostmask(nick='op', username='op', host='op.host')
+        irc.inject_line(Line(hostmask=setter, command='MODE',
+                             params=(name, '-bb+b', '*!*@GOOD', '*!*@none',
+                                     '*!*@new')))
+        self.assertEqual([e.string for e in bans.entries()],
+                         ['*!*@evil{1}', '*!*@new'])
+        self.assertIs(bans['*!*@NEW'].setter, setter)
+        self.assertEqual(channel.list_generation, generation + 5)
+
+    def test_ban_evaluation(self):
+        """Ensure users are checked against bans, exceptions, and extbans."""
+        irc = self.connection
+        irc.load_extension('UserTrack')
+        irc.load_extension(CharybdisServer)
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'CHANMODES=beI,k,l,imnpst',
+                                     'EXTBAN=$,acjorsxz',
+                                     'are supported by this server')))
+        name = '#evaluate'
+        irc.inject_line(join_line(irc, name))
+        for mask in ('a!a@a', 'b!b@b', 'c!c@c'):
+            irc.inject_line(Line(hostmask=mask, command='JOIN',
+                                 params=(name,)))
+
+        bans = irc.ban_track
+        setter = Hostmask(nick='op', username='op', host='op.host')
+        irc.inject_line(Line(hostmask=setter, command='MODE',
+                             params=(name, '+bbe', '*!*@A', '$a:Troll*',
+                                     'a!*@*')))
+        self.assertFalse(bans.is_banned(name, 'a'))
+        self.assertFalse(bans.is_banned(name, 'b'))
+
+        banned = []
+        irc.signals.get_signal(('channel', 'members_banned')).add(
+            lambda caller, channel, nicks: banned.append(nicks))
+        irc.user_track.get_user('b').account = 'trolling'
+        irc.inject_line(Line(hostmask=setter, command='MODE',
+                             params=(name, '-e+b', 'a!*@*', '*!c@*')))
+        self.assertTrue(bans.is_banned(name, 'A'))
+        self.assertTrue(bans.is_banned(name, irc.user_track.get_user('b')))
+        self.assertTrue(bans.is_banned(name, Hostmask.parse('x!c@y')))
+        self.assertFalse(bans.is_banned(name, irc.nick))
+        self.assertEqual(sorted(banned[0]), ['a', 'b', 'c'])
+
+    def test_ban_unknown_host(self):
+        """Ensure users only seen in NAMES match bans on what is known."""
+        irc = self.connection
+        irc.load_extension('UserTrack')
+        irc.load_extension(CharybdisServer)
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'CHANMODES=beI,k,l,imnpst',
+                                     'EXTBAN=$,acjorsxz',
+                                     'are supported by this server')))
+        name = '#names'
+        irc.inject_line(join_line(irc, name))
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_NAMREPLY,
+                             params=(irc.nick, '=', name, 'Foo[a] bar')))
+        self.assertIsNone(irc.user_track.get_user('foo[a]').host)
+
+        bans = irc.ban_track
+        setter = Hostmask(nick='op', username='op', host='op.host')
+
+        def ban(mask):
+            irc.inject_line(Line(hostmask=setter, command='MODE',
+                                 params=(name, '+b', mask)))
+
+        ban('*!*@bar.host')
+        self.assertFalse(bans.is_banned(name, 'foo[a]'))
+        self.assertFalse(bans.is_banned(name, 'bar'))
+
+        # Casemapped like the server, for masks and extbans alike
+        ban('FOO{A}!*@*')
+        self.assertTrue(bans.is_banned(name, 'foo[a]'))
+        self.assertFalse(bans.is_banned(name, 'bar'))
+
+        irc.user_track.get_user('bar').account = 'Bar[Away]'
+        ban('$a:bar{away}')
+        self.assertTrue(bans.is_banned(name, 'bar'))
+
+        ban('*!*@*')
+        self.assertEqual(sorted(bans.banned_members(name)),
+                         ['Foo[a]', 'Test', 'bar'])
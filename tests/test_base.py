@@ -19,4 +19,5 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(auxparse))
     tests.addTests(doctest.DocTestSuite(line))
     tests.addTests(doctest.DocTestSuite(casemapping))
+    tests.addTests(doctest.DocTestSuite(numerics))
     return tests
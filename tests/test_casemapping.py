@@ -0,0 +1,175 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test the casemapped containers."""
+
+
+import pickle
+import unittest
+
+from PyIRC.casemapping import (IRCDefaultDict, IRCDict, IRCSet, IRCString,
+                               casefolder)
+
+
+class TestFolding(unittest.TestCase):
+    """Ensure each casemapping folds the right characters."""
+
+    def test_rfc1459(self):
+        """Ensure RFC1459 folds []\\^ to {}|~."""
+        fold = casefolder(IRCString.RFC1459)
+        self.assertEqual(fold("NICK[]\\^"), "nick{}|~")
+        self.assertEqual(fold("nick{}|~"), "nick{}|~")
+
+        users = IRCDict(IRCString.RFC1459, {"Nick[a]": 1})
+        self.assertEqual(users["NICK{A}"], 1)
+        self.assertIn("nick[a]", users)
+
+    def test_ascii(self):
+        """Ensure ASCII leaves []\\^ and {}|~ alone."""
+        fold = casefolder(IRCString.ASCII)
+        self.assertEqual(fold("NICK[]\\^"), "nick[]\\^")
+
+        users = IRCDict(IRCString.ASCII, {"Nick[a]": 1})
+        self.assertEqual(users["NICK[A]"], 1)
+        self.assertNotIn("nick{a}", users)
+
+    def test_irc_string(self):
+        """Ensure IRCString keys are folded like plain strings."""
+        users = IRCDict(IRCString.RFC1459)
+        users[IRCString(IRCString.RFC1459, "Nick[a]")] = 1
+        self.assertEqual(users["nick{a}"], 1)
+        self.assertEqual(users[IRCString(IRCString.ASCII, "NICK[A]")], 1)
+        self.assertEqual(users.data, {"nick{a}": 1})
+
+        key = next(iter(users))
+        self.assertIsInstance(key, IRCString)
+        self.assertEqual(key, "NICK{A}")
+        self.assertEqual(str(key), "Nick[a]")
+
+
+class TestIRCDict(unittest.TestCase):
+    """Ensure IRCDict behaves like a dict with caseless keys."""
+
+    def setUp(self):
+        self.users = IRCDict(IRCString.RFC1459, {"Nick[a]": 1})
+
+    def test_replace(self):
+        """Ensure replacing a value keeps the key as first given."""
+        self.users["NICK{A}"] = 2
+        self.assertEqual(len(self.users), 1)
+        self.assertEqual([str(key) for key in self.users], ["Nick[a]"])
+        self.assertEqual(self.users["nick[a]"], 2)
+
+        # Once deleted, the new key is kept instead
+        del self.users["nick{a}"]
+        self.users["NICK{A}"] = 3
+        self.assertEqual([str(key) for key in self.users], ["NICK{A}"])
+
+    def test_pop(self):
+        """Ensure pop removes the key and its display name."""
+        self.assertEqual(self.users.pop("NICK{A}"), 1)
+        self.assertEqual(self.users.names, {})
+        self.assertEqual(self.users.pop("nick[a]", None), None)
+        with self.assertRaises(KeyError):
+            self.users.pop("nick[a]")
+
+    def test_setdefault(self):
+        """Ensure setdefault finds keys casefolded."""
+        self.assertEqual(self.users.setdefault("NICK{A}", 2), 1)
+        self.assertEqual(self.users.setdefault("Other", 3), 3)
+        self.assertEqual(self.users["OTHER"], 3)
+
+    def test_update(self):
+        """Ensure update replaces values of keys that fold the same."""
+        self.users.update({"nick{A}": 2, "Other": 3}, Third=4)
+        self.assertEqual(len(self.users), 3)
+        self.assertEqual(self.users, {"Nick[a]": 2, "other": 3, "third": 4})
+
+    def test_copy(self):
+        """Ensure copies are independent."""
+        copy = self.users.copy()
+        self.assertIsInstance(copy, IRCDict)
+        self.assertEqual(copy, self.users)
+
+        copy["other"] = 2
+        self.assertNotIn("other", self.users)
+
+    def test_pickle(self):
+        """Ensure dictionaries survive pickling with their casemapping."""
+        users = pickle.loads(pickle.dumps(self.users))
+        self.assertIsInstance(users, IRCDict)
+        self.assertEqual(users.case, IRCString.RFC1459)
+        self.assertIs(users.fold, casefolder(IRCString.RFC1459))
+        self.assertEqual(users["NICK{A}"], 1)
+        self.assertEqual([str(key) for key in users], ["Nick[a]"])
+
+    def test_convert(self):
+        """Ensure converting refolds the keys under the new casemapping."""
+        users = self.users.convert(IRCString.ASCII)
+        self.assertEqual(users.case, IRCString.ASCII)
+        self.assertIn("NICK[A]", users)
+        self.assertNotIn("nick{a}", users)
+        self.assertIn("nick{a}", self.users)
+
+
+class TestIRCDefaultDict(unittest.TestCase):
+    """Ensure IRCDefaultDict creates missing values."""
+
+    def test_default(self):
+        """Ensure missing keys get a default value under their own name."""
+        channels = IRCDefaultDict(IRCString.RFC1459, list)
+        channels["#Chan[a]"].append(1)
+        channels["#CHAN{A}"].append(2)
+        self.assertEqual(channels["#chan[a]"], [1, 2])
+        self.assertEqual([str(key) for key in channels], ["#Chan[a]"])
+
+    def test_convert(self):
+        """Ensure converting and copying keep the default factory."""
+        channels = IRCDefaultDict(IRCString.RFC1459, set, {"#a": {1}})
+        for new in (channels.convert(IRCString.ASCII), channels.copy()):
+            self.assertIsInstance(new, IRCDefaultDict)
+            self.assertIs(new.default, set)
+            self.assertEqual(new["#a"], {1})
+            self.assertEqual(new["#b"], set())
+
+    def test_pickle(self):
+        """Ensure pickling keeps the default factory."""
+        channels = IRCDefaultDict(IRCString.ASCII, list, {"#A": [1]})
+        channels = pickle.loads(pickle.dumps(channels))
+        self.assertIs(channels.default, list)
+        self.assertEqual(channels["#a"], [1])
+        self.assertEqual(channels["#b"], [])
+
+
+class TestIRCSet(unittest.TestCase):
+    """Ensure IRCSet behaves like a set with caseless members."""
+
+    def test_members(self):
+        """Ensure members are found casefolded and kept as first given."""
+        seen = IRCSet(IRCString.RFC1459, ["Nick[a]", "NICK{A}", "Other"])
+        self.assertEqual(len(seen), 2)
+        self.assertIn("nick{a}", seen)
+        self.assertEqual(sorted(str(member) for member in seen),
+                         ["Nick[a]", "Other"])
+
+        seen.discard("OTHER")
+        self.assertNotIn("Other", seen)
+        seen.discard("missing")
+
+    def test_convert(self):
+        """Ensure converting refolds the members."""
+        seen = IRCSet(IRCString.RFC1459, ["Nick[a]"])
+        ascii_seen = seen.convert(IRCString.ASCII)
+        self.assertIsInstance(ascii_seen, IRCSet)
+        self.assertIn("NICK[A]", ascii_seen)
+        self.assertNotIn("nick{a}", ascii_seen)
+
+    def test_pickle(self):
+        """Ensure sets survive pickling with their casemapping."""
+        seen = pickle.loads(pickle.dumps(IRCSet(IRCString.RFC1459,
+                                                ["Nick[a]"])))
+        self.assertIsInstance(seen, IRCSet)
+        self.assertIn("nick{a}", seen)
@@ -10,23 +10,11 @@
 from time import time
 
 import unittest
+import weakref
 
 from PyIRC.line import Line, Hostmask
 from PyIRC.numerics import Numerics
-from test_helpers import new_conn_with_handshake, conn_mask
-
-
-def join_line(irc, name):
-    """Helper: Construct a JOIN line.
-
-    :param irc:
-        The IRC ocnnection.
-
-    :param name:
-        The channel name.
-    """
-
-    return Line(hostmask=conn_mask(irc), command='JOIN', params=(name,))
+from test_helpers import new_conn_with_handshake, conn_mask, join_line
 
 
 def rpl_topic_line(irc, name, topic):
@@ -166,3 +154,179 @@ class TestChannelTrackBehaviour(unittest.TestCase):
                              command=Numerics.RPL_NOTOPIC,
                              params=(irc.nick, name)))
         self.assertIsNotNone(self.channel.topic)
+
+    def test_names_burst(self):
+        """Ensure NAMES bursts add users, with one event per line."""
+        name = '#Burst'
+        batches = []
+        scopes = []
+
+        irc = self.connection
+        irc.signals.get_signal(('scope', 'user_burst_batch')).add(
+            lambda caller, burst: batches.append(burst))
+        irc.inject_line(join_line(irc, name))
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_NAMREPLY,
+                             params=(irc.nick, '=', name, '@Op +Voice user ')))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(self.channel.users['op'], {'o'})
+        self.assertEqual(self.channel.users['VOICE'], {'v'})
+        self.assertEqual(self.channel.users['user'], set())
+
+        # Per-user events are only sent if something wants them
+        irc.signals.get_signal(('scope', 'user_burst')).add(
+            lambda caller, scope: scopes.append(scope))
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_NAMREPLY,
+                             params=(irc.nick, '=', name, '@Other')))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual([(s.target.nick, s.scope, s.modes[0][0])
+                          for s in scopes], [('Other', name, 'o')])
+
+    def test_mode_change(self):
+        """Ensure modes are changed with one event per line."""
+        name = '#modes'
+        changes = []
+        prefixes = []
+
+        irc = self.connection
+        irc.signals.get_signal(('modes', 'mode_change')).add(
+            lambda caller, change: changes.append(change))
+        irc.inject_line(join_line(irc, name))
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_NAMREPLY,
+                             params=(irc.nick, '=', name, '+a b')))
+
+        setter = Hostmask(nick='op', username='op', host='op.host')
+        irc.inject_line(Line(hostmask=setter, command='MODE',
+                             params=(name, '+ov-v+kn', 'a', 'b', 'a', 'key')))
+        self.assertEqual(len(changes), 1)
+        self.assertEqual([m.mode for m in changes[0].prefix], ['o', 'v', 'v'])
+        self.assertEqual(self.channel.users['a'], {'o'})
+        self.assertEqual(self.channel.users['b'], {'v'})
+        self.assertEqual(self.channel.modes, {'k': 'key', 'n': None})
+
+        # Per-mode events are only sent if something wants them
+        irc.signals.get_signal(('modes', 'mode_prefix')).add(
+            lambda caller, setter, target, mode: prefixes.append(mode))
+        irc.inject_line(Line(hostmask=setter, command='MODE',
+                             params=(name, '-o-n', 'a')))
+        self.assertEqual(len(changes), 2)
+        self.assertEqual([(m.mode, m.param, m.adding) for m in prefixes],
+                         [('o', 'a', False)])
+        self.assertEqual(self.channel.users['a'], set())
+        self.assertEqual(self.channel.modes, {'k': 'key'})
+
+    def test_membership(self):
+        """Ensure channel and user membership share one index."""
+        irc = self.connection
+        irc.load_extension('UserTrack')
+        user_track = irc.user_track
+
+        for name in ('#one', '#two'):
+            irc.inject_line(join_line(irc, name))
+            irc.inject_line(Line(hostmask='nonexistent.test.server',
+                                 command=Numerics.RPL_NAMREPLY,
+                                 params=(irc.nick, '=', name, '@both')))
+
+        irc.inject_line(Line(hostmask='only!only@only.host', command='JOIN',
+                             params=('#one',)))
+        one = irc.channel_track.get_channel('#one')
+        two = irc.channel_track.get_channel('#two')
+        both = user_track.get_user('both')
+        self.assertEqual(both.channels, {'#one': {'o'}, '#two': {'o'}})
+        self.assertIs(both.channels['#one'], one.users['both'])
+
+        # Equal mode sets are shared between channels
+        self.assertIs(one.users['both'], two.users['both'])
+
+        irc.inject_line(Line(hostmask='both!both@both.host', command='NICK',
+                             params=('Renamed',)))
+        self.assertNotIn('both', one.users)
+        self.assertEqual(two.users['renamed'], {'o'})
+        self.assertEqual(user_track.get_user('renamed').channels,
+                         {'#one': {'o'}, '#two': {'o'}})
+
+        irc.inject_line(Line(hostmask='Renamed!both@both.host',
+                             command='KICK', params=('#two', 'Renamed', 'x')))
+        self.assertNotIn('renamed', two.users)
+        self.assertEqual(list(user_track.get_user('renamed').channels),
+                         ['#one'])
+
+        # Leaving removes the channel, and users we no longer share any
+        # channel with.
+        irc.inject_line(Line(hostmask=conn_mask(irc), command='PART',
+                             params=('#one',)))
+        self.assertIsNone(irc.channel_track.get_channel('#one'))
+        self.assertIsNone(user_track.get_user('only'))
+        self.assertIsNone(user_track.get_user('renamed'))
+        self.assertEqual(list(user_track.get_user(irc.nick).channels),
+                         ['#two'])
+        self.assertEqual(list(two.users), [irc.nick])
+
+        irc.inject_line(Line(hostmask='late!late@late.host', command='JOIN',
+                             params=('#two',)))
+        irc.inject_line(Line(hostmask='late!late@late.host', command='QUIT',
+                             params=('bye',)))
+        self.assertEqual(list(two.users), [irc.nick])
+        self.assertNotIn('late', irc.base_track.membership.users)
+
+    def test_membership_views(self):
+        """Ensure channel users read like the defaultdict they replace."""
+        irc = self.connection
+        irc.load_extension('UserTrack')
+        irc.inject_line(join_line(irc, '#chan'))
+        irc.inject_line(Line(hostmask='a!a@a.host', command='JOIN',
+                             params=('#chan',)))
+        users = irc.channel_track.get_channel('#chan').users
+
+        # Missing users have no modes, and aren't added
+        self.assertEqual(users['nobody'], frozenset())
+        self.assertNotIn('nobody', users)
+        with self.assertRaises(AttributeError):
+            users['a'].add('o')
+
+        self.assertEqual(users.setdefault('A', {'v'}), frozenset())
+        self.assertEqual(users.setdefault('b', {'v'}), {'v'})
+        user = irc.user_track.get_user('a')
+        users['A'] = users['a'] | {'o'}
+        self.assertEqual(user.channels['#chan'], {'o'})
+
+        # Removing a user is mirrored to their channels
+        self.assertEqual(users.pop('A'), {'o'})
+        self.assertNotIn('#chan', user.channels)
+        self.assertIsNone(users.pop('a', None))
+        with self.assertRaises(KeyError):
+            users.pop('a')
+
+    def test_record_attributes(self):
+        """Ensure user and channel records still take extra attributes."""
+        irc = self.connection
+        irc.load_extension('UserTrack')
+        irc.inject_line(join_line(irc, '#chan'))
+        records = (irc.channel_track.get_channel('#chan'),
+                   irc.user_track.get_user(irc.nick))
+        for record in records:
+            record.note = 'kept'
+            self.assertEqual(record.note, 'kept')
+            self.assertIs(weakref.ref(record)(), record)
+
+    def test_case_change(self):
+        """Ensure tracked channels and members follow a casemapping change."""
+        irc = self.connection
+        irc.inject_line(join_line(irc, '#Chan['))
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_NAMREPLY,
+                             params=(irc.nick, '=', '#Chan[', '@Nick^')))
+        self.assertIsNotNone(irc.channel_track.get_channel('#chan{'))
+
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'CASEMAPPING=ascii',
+                                     'are supported by this server')))
+        self.assertIsNone(irc.channel_track.get_channel('#chan{'))
+        channel = irc.channel_track.get_channel('#chan[')
+        self.assertEqual(channel.users['NICK^'], {'o'})
+        self.assertNotIn('nick~', channel.users)
+        self.assertIn('#CHAN[', irc.base_track.membership.users['nick^'])
+
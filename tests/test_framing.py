@@ -0,0 +1,76 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test framing of the byte stream into lines."""
+
+
+import doctest
+import unittest
+
+from PyIRC.io import framing
+from PyIRC.io.framing import LineFramer
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(framing))
+    return tests
+
+
+class TestLineFramer(unittest.TestCase):
+    """Test the behaviour of LineFramer."""
+
+    def setUp(self):
+        self.framer = LineFramer(max_length=64)
+
+    def feed(self, *chunks):
+        """Feed all chunks into the framer, returning the line strings."""
+        lines = []
+        for chunk in chunks:
+            lines.extend(str(line) for line in self.framer.feed(chunk))
+
+        return lines
+
+    def test_chunks(self):
+        """Ensure lines split across chunks are reassembled."""
+        data = b':n!u@h PRIVMSG #test :hello\r\nPING :test\r\n'
+        expected = [':n!u@h PRIVMSG #test :hello', 'PING :test']
+
+        for size in range(1, len(data) + 1):
+            with self.subTest(size=size):
+                self.framer.clear()
+                chunks = [data[i:i + size] for i in range(0, len(data), size)]
+                self.assertEqual(self.feed(*chunks), expected)
+
+    def test_terminators(self):
+        """Ensure both CR LF and bare LF end lines."""
+        self.assertEqual(self.feed(b'PING :a\nPING :b\r\nPING :c\r'),
+                         ['PING :a', 'PING :b'])
+        self.assertEqual(self.feed(b'\n'), ['PING :c'])
+
+    def test_blank(self):
+        """Ensure blank lines are skipped."""
+        self.assertEqual(self.feed(b'\r\n\n\r\nPING\r\n\r\n'), ['PING'])
+
+    def test_invalid(self):
+        """Ensure invalid lines are skipped."""
+        self.assertEqual(self.feed(b':server.only\r\nPING\r\n'), ['PING'])
+
+    def test_overlong(self):
+        """Ensure overlong lines are discarded without buffering them."""
+        self.assertEqual(self.feed(b'PRIVMSG #test :' + b'a' * 64 + b'\r\n'
+                                   b'PING :a\r\n'), ['PING :a'])
+
+        self.assertEqual(self.feed(b'PRIVMSG #test :' + b'a' * 60), [])
+        self.assertEqual(len(self.framer.buffer), 0)
+        self.assertEqual(self.feed(b'a' * 1000), [])
+        self.assertEqual(len(self.framer.buffer), 0)
+        self.assertEqual(self.feed(b'aaa\r\nPING :b\r\n'), ['PING :b'])
+
+    def test_clear(self):
+        """Ensure pending data is discarded when cleared."""
+        self.assertEqual(self.feed(b'PRIVMSG #test :hel'), [])
+        self.framer.clear()
+        self.assertEqual(self.feed(b'PING\r\n'), ['PING'])
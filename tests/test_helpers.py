@@ -34,3 +34,9 @@ def new_conn_with_handshake(username='TestUser', nick='Test', gecos='Test User',
 def conn_mask(connection):
     return Hostmask(nick=connection.nick, username=connection.username,
                     host='test-connection.local')
+
+
+def join_line(connection, name):
+    """Construct a line of the connection joining a channel."""
+    return Line(hostmask=conn_mask(connection), command='JOIN',
+                params=(name,))
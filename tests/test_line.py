@@ -0,0 +1,367 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Check the line parser against the conformance corpus."""
+
+
+import unittest
+
+from fnmatch import fnmatchcase
+from sys import intern
+
+from PyIRC.line import Line, Hostmask, MaskSet, Tags, _tokenize
+from line_corpus import CORPUS, INVALID, legacy_tokenize
+
+
+class TestLineParser(unittest.TestCase):
+    """Ensure the line parser agrees with the reference parser."""
+
+    def test_tokenize_corpus(self):
+        """Ensure every corpus line is split identically."""
+        for raw in CORPUS:
+            with self.subTest(line=raw):
+                self.assertEqual(_tokenize(raw), legacy_tokenize(raw))
+
+    def test_parse_corpus(self):
+        """Ensure every corpus line produces an identical Line."""
+        for raw in CORPUS:
+            with self.subTest(line=raw):
+                line = Line.parse(raw)
+                tags, hostmask, command, params = legacy_tokenize(raw)
+                expected = Line(tags=tags, hostmask=hostmask, command=command,
+                                params=params, line=raw)
+
+                self.assertEqual(repr(line), repr(expected))
+                self.assertEqual(str(line), str(expected))
+                self.assertEqual(hash(line), hash(expected))
+
+    def test_invalid(self):
+        """Ensure both parsers reject invalid lines."""
+        for raw in INVALID:
+            with self.subTest(line=raw):
+                with self.assertRaises(Exception):
+                    legacy_tokenize(raw)
+
+                with self.assertRaises((ValueError, IndexError)):
+                    Line.parse(raw)
+
+    def test_blank(self):
+        """Ensure blank lines are not parsed."""
+        self.assertIsNone(Line.parse(''))
+        self.assertIsNone(Line.parse(None))
+
+    def test_line_ending_only(self):
+        """Ensure a bare line ending is rejected, not taken as a command."""
+        with self.assertRaises(ValueError):
+            Line.parse('\r\n')
+
+
+class TestBytesLineParser(unittest.TestCase):
+    """Ensure lines parsed from bytes match lines parsed from strings."""
+
+    def test_parse_corpus(self):
+        """Ensure every corpus line produces an identical Line."""
+        for raw in CORPUS:
+            with self.subTest(line=raw):
+                line = Line.parse_bytes(raw.encode('utf-8'))
+                expected = Line.parse(raw)
+
+                self.assertEqual(repr(line), repr(expected))
+                self.assertEqual(str(line), str(expected))
+                self.assertEqual(hash(line), hash(expected))
+
+    def test_invalid(self):
+        """Ensure invalid lines are rejected."""
+        for raw in INVALID:
+            with self.subTest(line=raw):
+                with self.assertRaises(ValueError):
+                    Line.parse_bytes(raw.encode('utf-8'))
+
+    def test_blank(self):
+        """Ensure blank lines are not parsed."""
+        self.assertIsNone(Line.parse_bytes(b''))
+
+    def test_buffer(self):
+        """Ensure lines from reusable buffers are copied."""
+        buf = bytearray(b':n!u@h PRIVMSG #test :hello')
+        line = Line.parse_bytes(memoryview(buf))
+        buf[:] = b'X' * len(buf)
+
+        self.assertEqual(line.hostmask.nick, 'n')
+        self.assertEqual(line.params, ['#test', 'hello'])
+
+    def test_lazy(self):
+        """Ensure fields are only decoded on access, and can be replaced."""
+        line = Line.parse_bytes(b':n!u@h PRIVMSG #test :hello')
+        line.params = ['#other', 'bye']
+
+        self.assertEqual(line.params, ['#other', 'bye'])
+        self.assertEqual(line.command, 'PRIVMSG')
+
+    def test_fallback(self):
+        """Ensure the fallback encoding is used for invalid fields only."""
+        raw = ':n\xe9!u@h PRIVMSG #t\xe9st :caf\xe9'.encode('latin-1')
+
+        line = Line.parse_bytes(raw, fallback='latin-1')
+        self.assertEqual(line.hostmask.nick, 'n\xe9')
+        self.assertEqual(line.params, ['#t\xe9st', 'caf\xe9'])
+
+        line = Line.parse_bytes(raw)
+        self.assertEqual(line.hostmask.nick, 'n')
+        self.assertEqual(line.params, ['#tst', 'caf'])
+
+        raw = 'PRIVMSG #t\xe9st :caf\xe9'.encode('utf-8')
+        line = Line.parse_bytes(raw, fallback='latin-1')
+        self.assertEqual(line.params, ['#t\xe9st', 'caf\xe9'])
+
+
+class TestLazyLineParser(unittest.TestCase):
+    """Ensure lazily parsed lines match eagerly parsed lines."""
+
+    def test_parse_corpus(self):
+        """Ensure every corpus line produces an identical Line."""
+        for raw in CORPUS:
+            with self.subTest(line=raw):
+                line = Line.parse(raw, lazy=True)
+                expected = Line.parse(raw)
+
+                self.assertEqual(str(line), str(expected))
+                self.assertEqual(hash(line), hash(expected))
+                self.assertEqual(repr(line), repr(expected))
+
+    def test_invalid(self):
+        """Ensure invalid lines are rejected."""
+        for raw in INVALID:
+            with self.subTest(line=raw):
+                with self.assertRaises(ValueError):
+                    Line.parse(raw, lazy=True)
+
+    def test_lazy(self):
+        """Ensure only the command is parsed up front."""
+        line = Line.parse('@a=b :n!u@h PRIVMSG #test :hello', lazy=True)
+
+        for slot in (Line.tags, Line.hostmask, Line.params):
+            with self.assertRaises(AttributeError):
+                slot.__get__(line)
+
+        self.assertEqual(Line.command.__get__(line), 'PRIVMSG')
+        self.assertEqual(line.hostmask.nick, 'n')
+        self.assertEqual(line.tags.tags, {'a': 'b'})
+        self.assertEqual(line.params, ['#test', 'hello'])
+
+
+class TestTags(unittest.TestCase):
+    """Test parsing and serialising message tags."""
+
+    def test_unescape(self):
+        """Ensure tag values are unescaped as per the spec."""
+        tags = Tags.parse(r"a=\:\s\\\r\n;b=x\yz\;c=;d;e=plain")
+        self.assertEqual(tags.tags, {'a': '; \\\r\n', 'b': 'xyz', 'c': None,
+                                     'd': None, 'e': 'plain'})
+
+    def test_lazy(self):
+        """Ensure tags are not split up until accessed."""
+        line = Line.parse('@time=12:00;msgid=abc :n!u@h PRIVMSG #a :hi')
+        self.assertIsNone(line.tags._tags)
+        self.assertEqual(line.tags['msgid'], 'abc')
+        self.assertIs(next(iter(line.tags.tags)), intern('time'))
+
+    def test_round_trip(self):
+        """Ensure tags survive serialising and parsing again."""
+        values = {'label': 'a b;c\\d\r\n', 'flag': None, '+x/y': 'z'}
+        line = Line(tags=values, command='TAGMSG', params=['#PyIRC'])
+        self.assertEqual(str(line), '@label=a\\sb\\:c\\\\d\\r\\n;flag;+x/y=z '
+                                    'TAGMSG #PyIRC\r\n')
+        self.assertEqual(Line.parse(str(line)).tags.tags, values)
+
+    def test_relay(self):
+        """Ensure received tags are sent on unchanged."""
+        raw = '@b=1;a=x\\s;c :n!u@h PRIVMSG #a :hi there'
+        line = Line.parse(raw)
+        relayed = Line(tags=line.tags, hostmask=line.hostmask,
+                       command=line.command, params=line.params)
+        self.assertEqual(str(relayed), raw + '\r\n')
+
+        line.tags.tags = {'a': 'b'}
+        self.assertEqual(str(line.tags), 'a=b')
+
+    def test_edit_in_place(self):
+        """Ensure tags changed in place are serialised."""
+        tags = Line.parse('@a=1;b :n!u@h PRIVMSG #a :hi').tags
+        self.assertEqual(tags['a'], '1')
+        self.assertEqual(str(tags), 'a=1;b')
+
+        tags.tags['c'] = 'x y'
+        del tags.tags['b']
+        self.assertEqual(str(tags), 'a=1;c=x\\sy')
+
+
+class TestHostmaskInterning(unittest.TestCase):
+    """Test the hostmask intern table."""
+
+    def setUp(self):
+        Hostmask.set_intern_size(2)
+
+    def tearDown(self):
+        Hostmask.set_intern_size(0)
+
+    def test_shared(self):
+        """Ensure repeated masks are shared, with interned parts."""
+        raw = ':nick!user@some.host PRIVMSG #test :hi'
+        first = Line.parse(raw).hostmask
+        second = Line.parse_bytes(raw.encode('utf-8')).hostmask
+
+        self.assertIs(first, second)
+        self.assertIs(first.nick, intern('nick'))
+        self.assertIs(first.username, intern('user'))
+        self.assertIs(first.host, intern('some.host'))
+        self.assertEqual(str(first), 'nick!user@some.host')
+
+    def test_immutable(self):
+        """Ensure shared masks may not be modified."""
+        hostmask = Hostmask.parse('nick!user@host')
+        with self.assertRaises(AttributeError):
+            hostmask.nick = 'other'
+
+    def test_bounded(self):
+        """Ensure the table is bounded and reports its statistics."""
+        first = Hostmask.parse('a!b@c')
+        Hostmask.parse('d!e@f')
+        Hostmask.parse('g!h@i')
+        self.assertIsNot(Hostmask.parse('a!b@c'), first)
+
+        info = Hostmask.intern_info()
+        self.assertEqual((info.hits, info.misses), (0, 4))
+        self.assertEqual((info.maxsize, info.currsize), (2, 2))
+
+        Hostmask.parse('a!b@c')
+        self.assertEqual(Hostmask.intern_info().hit_rate, 0.2)
+
+    def test_disabled(self):
+        """Ensure masks are not shared once interning is disabled."""
+        Hostmask.set_intern_size(0)
+        self.assertIsNone(Hostmask.intern_info())
+        self.assertIsNot(Hostmask.parse('a!b@c'), Hostmask.parse('a!b@c'))
+
+
+def reference_match(hostmask, mask):
+    """Match a mask against a hostmask one part at a time, as MaskSet does."""
+    mask = Hostmask.parse(mask.lower())
+    for test, part in ((mask.nick, hostmask.nick),
+                       (mask.username, hostmask.username),
+                       (mask.host, hostmask.host)):
+        if test is None:
+            continue
+
+        if part is None:
+            if test != '*':
+                return False
+        elif not fnmatchcase(part.lower(), test):
+            return False
+
+    return True
+
+
+class TestMaskSet(unittest.TestCase):
+    """Ensure a MaskSet matches the same masks as checking each in turn."""
+
+    masks = [
+        "*!*@bad.host",
+        "*!*@*.example.com",
+        "*!*@*example.org",
+        "*!*@192.0.2.*",
+        "troll!*@*",
+        "Troll",
+        "*!*bot@*",
+        "*!~?@*",
+        "*!*ser@*",
+        "*!us*@*",
+        "*!*se*@*",
+        "*!u*r@*",
+        "nick@*.net",
+        "spam*!*@*.spam.net",
+        "host.only.example.com",
+        "*!*@*",
+    ]
+
+    hostmasks = [
+        "nick!user@bad.host",
+        "nick!user@BAD.HOST",
+        "nick!user@not.bad.host",
+        "nick!user@example.com",
+        "nick!user@sub.example.com",
+        "nick!user@notexample.org",
+        "nick!user@192.0.2.10",
+        "nick!user@192.0.20.1",
+        "Troll!~t@host.net",
+        "trollface!~t@host.net",
+        "x!spambot@host",
+        "x!~a@host",
+        "x!~ab@host",
+        "nick@host.net",
+        "spammer!s@mail.spam.net",
+        "host.only.example.com",
+        "nickname",
+    ]
+
+    def test_match(self):
+        """Ensure every hostmask is matched by the same masks."""
+        masks = MaskSet(self.masks)
+        for raw in self.hostmasks:
+            with self.subTest(hostmask=raw):
+                hostmask = Hostmask.parse(raw)
+                expected = [mask for mask in self.masks
+                            if reference_match(hostmask, mask)]
+
+                self.assertCountEqual(masks.match(hostmask), expected)
+                self.assertEqual(masks.match_any(hostmask), bool(expected))
+
+    def test_remove(self):
+        """Ensure removed masks no longer match."""
+        masks = MaskSet(self.masks)
+        for mask in self.masks:
+            masks.remove(mask)
+            self.assertNotIn(mask, masks)
+
+            for raw in self.hostmasks:
+                self.assertNotIn(mask, masks.match(Hostmask.parse(raw)))
+
+        self.assertEqual(len(masks), 0)
+        with self.assertRaises(KeyError):
+            masks.remove("*!*@*")
+
+        masks.discard("*!*@*")
+        masks.add("*!*@*")
+        self.assertEqual(masks.match(Hostmask.parse("a!b@c")), ["*!*@*"])
+
+    def test_glob_anchored(self):
+        """Ensure globs match whole parts, case-insensitively."""
+        hostmask = Hostmask.parse("Nickname!user@host")
+        self.assertFalse(MaskSet(["nick!*@*"]).match_any(hostmask))
+        self.assertFalse(MaskSet(["*!*@hos"]).match_any(hostmask))
+        self.assertTrue(MaskSet(["NICKNAME!*@*"]).match_any(hostmask))
+
+    def test_missing_parts(self):
+        """Ensure parts a hostmask lacks only match ``*``."""
+        hostmask = Hostmask(nick="nick")
+        self.assertTrue(MaskSet(["nick!*@*"]).match_any(hostmask))
+        self.assertFalse(MaskSet(["nick!*@*.com"]).match_any(hostmask))
+
+    def test_hostmask_match(self):
+        """Ensure Hostmask.match keeps its own semantics."""
+        hostmask = Hostmask.parse("nickname!user@host")
+        self.assertTrue(hostmask.match("nick!*@*"))
+        self.assertTrue(hostmask.match("NICK*!*@HOST"))
+        self.assertFalse(hostmask.match("*!*@other"))
+        self.assertFalse(Hostmask(nick="nick").match("nick!*@*"))
+
+    def test_extban(self):
+        """Ensure extbans are rejected."""
+        with self.assertRaises(ValueError):
+            MaskSet(["$a:account"])
+
+        with self.assertRaises(ValueError):
+            Hostmask.parse("a!b@c").match("$a:account")
@@ -0,0 +1,126 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Check the numeric lookup tables against the numerics enum."""
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+import PyIRC
+
+from PyIRC import extensions
+from PyIRC.numerics import (Numeric, Numerics, numeric_info, numeric_name,
+                            numeric_for_name, numerics_enum, _table)
+
+
+class TestNumericTables(unittest.TestCase):
+    """Ensure the lookup tables agree with the enum."""
+
+    def test_table(self):
+        """Ensure the compact table matches the enum."""
+        enum = numerics_enum()
+        self.assertEqual(_table(),
+                         [(name, member.value) for name, member in
+                          enum.__members__.items()])
+
+    def test_by_numeric(self):
+        """Ensure every numeric maps to its canonical member."""
+        for member in numerics_enum():
+            with self.subTest(numeric=member.value):
+                self.assertEqual(numeric_name(member.value), member.name)
+                self.assertEqual(numeric_name(int(member.value)), member.name)
+                self.assertEqual(numeric_name(member), member.name)
+                self.assertIs(Numerics(member.value),
+                              getattr(Numerics, member.name))
+
+    def test_by_name(self):
+        """Ensure every name and alias maps to its numeric."""
+        for name, member in numerics_enum().__members__.items():
+            with self.subTest(name=name):
+                self.assertEqual(numeric_for_name(name), member.value)
+                self.assertEqual(Numerics[name], member.value)
+
+                info = numeric_info(member.value)
+                self.assertTrue(name == info.name or name in info.aliases)
+
+    def test_unknown(self):
+        """Ensure unknown numerics and non-numerics are not found."""
+        for numeric in ("000", "PRIVMSG", "01", "0001", "١٢٣", 1000, -1):
+            with self.subTest(numeric=numeric):
+                self.assertIsNone(numeric_info(numeric))
+                self.assertIsNone(numeric_name(numeric))
+
+        self.assertIsNone(numeric_for_name("RPL_NONEXISTENT"))
+
+        with self.assertRaises(ValueError):
+            Numerics("000")
+
+        with self.assertRaises(KeyError):
+            Numerics["RPL_NONEXISTENT"]  # pylint: disable=pointless-statement
+
+    def test_members(self):
+        """Ensure members work like both strings and enum members."""
+        member = Numerics.RPL_WELCOME
+        self.assertIsInstance(member, Numeric)
+        self.assertIn(member, Numerics)
+        self.assertEqual(member, "001")
+        self.assertEqual((member.name, member.value), ("RPL_WELCOME", "001"))
+        self.assertEqual(len(Numerics), len(numerics_enum()))
+        self.assertEqual(len(list(Numerics)), len(Numerics))
+        self.assertEqual(len(Numerics.__members__), len(_table()))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime needs 3.7")
+class TestImportTime(unittest.TestCase):
+    """Guard against the numerics enum slowing down startup again."""
+
+    @staticmethod
+    def import_times(statement):
+        """Run a statement in a new interpreter.
+
+        :returns:
+            A dict mapping each module imported to the time taken to import
+            it, excluding its own imports, in microseconds.
+        """
+        env = dict(os.environ)
+        path = os.path.dirname(os.path.dirname(PyIRC.__file__))
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (path, env.get("PYTHONPATH"))))
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement], env=env,
+            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+        times = dict()
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+
+            own, _, module = line[len("import time:"):].split("|")
+            if own.strip().isdigit():
+                times[module.strip()] = int(own)
+
+        return times
+
+    def test_extensions(self):
+        """Ensure loading every extension doesn't build the enum."""
+        modules = ["PyIRC.extensions." + name for name in
+                   extensions.__all__]
+        times = self.import_times("import " + ", ".join(modules))
+
+        self.assertIn("PyIRC.numerics", times)
+        self.assertNotIn("PyIRC._numerics_enum", times)
+
+    def test_numerics(self):
+        """Ensure looking up a numeric doesn't build the enum."""
+        times = self.import_times("from PyIRC.numerics import Numerics; "
+                                  "Numerics.RPL_WELCOME")
+
+        self.assertIn("PyIRC.numerics", times)
+        self.assertNotIn("PyIRC._numerics_enum", times)
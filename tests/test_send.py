@@ -0,0 +1,117 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test sending lines and line templates."""
+
+
+import unittest
+
+from PyIRC.base import IRCBase
+from PyIRC.extensions.basicrfc import BasicRFC
+from PyIRC.line import Line, LineTemplate
+from test_helpers import new_conn_with_handshake
+
+
+class SendOnly(IRCBase):
+    """A backend implementing send, but not send_bytes."""
+
+    def __init__(self):
+        super().__init__((None, None), "test", "test", "Test", [BasicRFC])
+        self.sent = []
+
+    def send(self, command, params, tags=None):
+        line = super().send(command, params, tags)
+        if line is not None:
+            self.sent.append(line)
+
+    def schedule(self, time, callback):
+        raise NotImplementedError()
+
+    def unschedule(self, sched):
+        raise NotImplementedError()
+
+
+class TestSend(unittest.TestCase):
+    """Test the outbound paths."""
+
+    def setUp(self):
+        self.connection = new_conn_with_handshake()
+        self.connection.sendq.queue.clear()
+        self.seen = []
+
+    def hook(self, event, line):
+        """Record lines passing through commands_out, cancelling some."""
+        self.seen.append(line)
+        if line.params[-1] == 'cancel':
+            event.cancelled = True
+
+    def bind_hook(self):
+        signal = self.connection.signals.get_signal(("commands_out",
+                                                     "PRIVMSG"))
+        signal.add(self.hook)
+
+    def test_send_unhooked(self):
+        """Ensure unhooked commands don't create signals."""
+        self.connection.send("PRIVMSG", ["#PyIRC", "hello there"])
+        line = self.connection.draw_line()
+
+        self.assertEqual(str(line), "PRIVMSG #PyIRC :hello there\r\n")
+        self.assertNotIn(("commands_out", "PRIVMSG"), self.connection.signals)
+
+    def test_send_hooked(self):
+        """Ensure hooks still see and may cancel lines."""
+        self.bind_hook()
+        self.connection.send("PRIVMSG", ["#PyIRC", "cancel"])
+        self.connection.send("PRIVMSG", ["#PyIRC", "ok"])
+
+        self.assertEqual([line.params[-1] for line in self.seen],
+                         ["cancel", "ok"])
+        self.assertEqual(self.connection.draw_line().params, ["#PyIRC", "ok"])
+        self.assertTrue(self.connection.sendq.empty())
+
+    def test_template_unhooked(self):
+        """Ensure templates send the same line as send."""
+        template = LineTemplate("PRIVMSG", ["#PyIRC"],
+                                tags={"+draft/reply": "abc"})
+        self.connection.send_template(template, "hello there")
+        line = self.connection.draw_line()
+
+        self.assertEqual(line.params, ["#PyIRC", "hello there"])
+        self.assertEqual(line.tags.tags, {"+draft/reply": "abc"})
+        self.assertEqual(template.format("hello there"),
+                         bytes(template.line("hello there")))
+
+    def test_template_hooked(self):
+        """Ensure templates go through hooks when there are any."""
+        self.bind_hook()
+        template = LineTemplate("PRIVMSG", ["#PyIRC"])
+        self.connection.send_template(template, "cancel")
+        self.connection.send_template(template, "ok")
+
+        self.assertEqual(len(self.seen), 2)
+        self.assertEqual(self.connection.draw_line().params, ["#PyIRC", "ok"])
+        self.assertTrue(self.connection.sendq.empty())
+
+    def test_template_invalid(self):
+        """Ensure only the last parameter may contain spaces."""
+        for param in ("a b", "", ":a"):
+            with self.assertRaises(ValueError):
+                LineTemplate("PRIVMSG", [param])
+
+    def test_send_bytes_default(self):
+        """Ensure backends without send_bytes send templates through send."""
+        backend = SendOnly()
+        template = LineTemplate("PRIVMSG", ["#PyIRC"],
+                                tags={"+draft/reply": "abc"})
+        backend.send_template(template, "hello there")
+
+        line, = backend.sent
+        self.assertEqual(bytes(line), template.format("hello there"))
+
+    def test_empty_last_param(self):
+        """Ensure an empty last parameter is not lost."""
+        line = Line(command="PRIVMSG", params=["#PyIRC", ""])
+        self.assertEqual(str(line), "PRIVMSG #PyIRC :\r\n")
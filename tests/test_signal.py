@@ -0,0 +1,390 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test the compiled signal dispatch table."""
+
+
+import unittest
+
+from taillight.signal import SignalDefer, SignalStop
+
+from PyIRC.extensions import BaseExtension
+from PyIRC.signal import HandlerStats, class_slots, event
+from PyIRC.line import Line
+from test_helpers import new_connection
+
+
+class Recorder(BaseExtension):
+    """Record the events we see."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seen = []
+
+    @event("test", "order", priority=10)
+    def late(self, _, value):
+        self.seen.append(("late", value))
+        return "late"
+
+    @event("test", "order", priority=-10)
+    def early(self, _, value):
+        self.seen.append(("early", value))
+        return "early"
+
+    @event("test", "stop", priority=-10)
+    def stop(self, _):
+        self.seen.append("stop")
+        raise SignalStop()
+
+    @event("test", "stop")
+    def after_stop(self, _):
+        self.seen.append("after_stop")
+
+    @event("test", "defer", priority=-10)
+    def defer(self, _, value):
+        self.seen.append(("defer", value))
+        if len(self.seen) == 1:
+            raise SignalDefer()
+
+    @event("test", "defer")
+    def after_defer(self, _, value):
+        self.seen.append(("after_defer", value))
+
+
+class TestDispatch(unittest.TestCase):
+    """Ensure compiled dispatch behaves like calling the signals."""
+
+    def setUp(self):
+        self.connection = new_connection(extensions=[Recorder])
+        self.recorder = self.connection.get_extension("Recorder")
+
+    def test_order(self):
+        """Ensure slots are called in priority order."""
+        event, ret = self.connection.call_event("test", "order", 1)
+        self.assertEqual(event.eventname, ("test", "order"))
+        self.assertEqual(ret, ["early", "late"])
+        self.assertEqual(self.recorder.seen, [("early", 1), ("late", 1)])
+
+    def test_stop(self):
+        """Ensure SignalStop stops the call."""
+        self.connection.call_event("test", "stop")
+        self.assertEqual(self.recorder.seen, ["stop"])
+
+        signal = self.connection.signals.get_signal(("test", "stop"))
+        self.assertEqual(signal.last_status, signal.STATUS_STOP)
+
+    def test_defer(self):
+        """Ensure deferred calls resume where they left off."""
+        self.connection.call_event("test", "defer", 1)
+        self.assertEqual(self.recorder.seen, [("defer", 1)])
+
+        self.connection.resume_event("test", "defer")
+        self.assertEqual(self.recorder.seen, [("defer", 1),
+                                              ("after_defer", 1)])
+
+        self.assertIsNone(self.connection.resume_event("test", "defer"))
+
+    def test_unhandled(self):
+        """Ensure unhandled events don't create signals."""
+        event, ret = self.connection.call_event("test", "nothing")
+        self.assertFalse(event.cancelled)
+        self.assertEqual(ret, [])
+        self.assertNotIn(("test", "nothing"), self.connection.signals)
+
+        # Each caller gets its own Event to change
+        event.cancelled = True
+        event, _ = self.connection.call_event("test", "nothing")
+        self.assertFalse(event.cancelled)
+
+    def test_unbind(self):
+        """Ensure the table follows unloading and direct changes."""
+        signals = self.connection.signals
+        self.assertIn(("test", "order"), signals.dispatch)
+
+        self.connection.unload_extension("Recorder")
+        self.assertNotIn(("test", "order"), signals.dispatch)
+        self.assertEqual(self.connection.call_event("test", "order", 1)[1],
+                         [])
+
+        slot = signals.get_signal(("test", "order")).add(lambda _, v: v)
+        self.assertEqual(self.connection.call_event("test", "order", 1)[1],
+                         [1])
+
+        slot.signal.delete(slot)
+        self.assertFalse(signals.has_slots(("test", "order")))
+
+    def test_listener(self):
+        """Ensure slots filtered by listener are still honoured."""
+        signal = self.connection.signals.get_signal(("test", "order"))
+        signal.add(lambda _, v: "never", listener=object())
+        self.assertIsNone(signal.functions)
+
+        ret = self.connection.call_event("test", "order", 1)[1]
+        self.assertEqual(ret, ["early", "late"])
+
+
+class Guarded(Recorder):
+    """A subclass with a property that must not be evaluated on bind."""
+
+    evaluated = False
+
+    @property
+    def guarded(self):
+        Guarded.evaluated = True
+        return None
+
+    @event("test", "order")
+    def early(self, _, value):
+        self.seen.append(("override", value))
+        return "override"
+
+
+class TestClassSlots(unittest.TestCase):
+    """Ensure slot discovery is per class and cached."""
+
+    def test_cached(self):
+        """Ensure classes are only scanned once."""
+        self.assertIs(class_slots(Recorder), class_slots(Recorder))
+        names = [name for name, _ in class_slots(Recorder)]
+        self.assertEqual(names, ["after_defer", "after_stop", "defer",
+                                 "early", "late", "stop"])
+
+    def test_subclass(self):
+        """Ensure overrides and inherited slots are both bound."""
+        connection = new_connection(extensions=[Guarded])
+        self.assertFalse(Guarded.evaluated)
+
+        ret = connection.call_event("test", "order", 1)[1]
+        self.assertEqual(ret, ["override", "late"])
+        self.assertEqual(len(connection.signals.get_bound(
+            connection.get_extension("Guarded"))), 6)
+
+
+class FakeClock:
+    """A clock which advances by a set step the next time it is read."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.step = 0.0
+
+    def __call__(self):
+        self.now += self.step
+        self.step = 0.0
+        return self.now
+
+
+class Slow(BaseExtension):
+    """Handlers which take a given time according to a fake clock."""
+
+    @event("test", "slow")
+    def slow(self, _, clock, elapsed):
+        clock.step = elapsed
+
+    @event("test", "slow", priority=10)
+    def fast(self, _, clock, elapsed):
+        pass
+
+
+class TestHandlerStats(unittest.TestCase):
+    """Ensure handler timing and the watchdog work."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.stats = HandlerStats(budget=0.05, clock=self.clock)
+        self.connection = new_connection(extensions=[Slow],
+                                         handler_stats=self.stats)
+
+    def test_disabled(self):
+        """Ensure handlers aren't wrapped without statistics."""
+        connection = new_connection(extensions=[Slow])
+        slow = connection.get_extension("Slow")
+        signal = connection.signals.get_signal(("test", "slow"))
+        self.assertEqual(signal.functions, (slow.slow, slow.fast))
+
+    def test_snapshot(self):
+        """Ensure calls are counted, timed and ordered."""
+        self.connection.call_event("test", "slow", self.clock, 0.002)
+        self.connection.call_event("test", "slow", self.clock, 0.02)
+
+        timings = self.stats.snapshot()
+        self.assertEqual(len(timings), 2)
+
+        timing = timings[0]
+        self.assertEqual(timing[:4], ("test", "slow", "Slow.slow", 2))
+        self.assertAlmostEqual(timing.total, 0.022)
+        self.assertAlmostEqual(timing.worst, 0.02)
+        self.assertEqual(timing.histogram, (0, 0, 0, 1, 1, 0, 0))
+
+        self.assertEqual(timings[1].slot, "Slow.fast")
+        self.assertEqual(timings[1].histogram, (2, 0, 0, 0, 0, 0, 0))
+        self.assertEqual(len(self.stats.snapshot(top=1)), 1)
+
+        self.stats.reset()
+        self.assertEqual(self.stats.snapshot()[0].calls, 0)
+
+    def test_budget(self):
+        """Ensure slow handlers are warned about."""
+        with self.assertLogs("PyIRC.signal", "WARNING") as logs:
+            self.connection.call_event("test", "slow", self.clock, 0.5)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Slow.slow", logs.output[0])
+
+    def test_set_stats(self):
+        """Ensure timing can be switched off and on."""
+        self.connection.signals.set_stats(None)
+        self.connection.call_event("test", "slow", self.clock, 0.002)
+        self.assertEqual(self.stats.snapshot()[0].calls, 0)
+
+        self.connection.signals.set_stats(self.stats)
+        self.connection.call_event("test", "slow", self.clock, 0.002)
+        self.assertEqual(self.stats.snapshot()[0].calls, 1)
+
+
+class Filtered(BaseExtension):
+    """Handlers with bind-time filters."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seen = []
+
+    @event("commands", "PRIVMSG", target="#Chan[a]")
+    def chan(self, _, line):
+        self.seen.append("chan")
+
+    @event("commands", "PRIVMSG", target=("#other", "#chan[a]"),
+           prefix="!", priority=-10)
+    def command(self, _, line):
+        self.seen.append("command")
+
+    @event("commands", "PRIVMSG", source="*!*@*.example.com", priority=10)
+    def source(self, _, line):
+        self.seen.append("source")
+
+    @event("commands", "PRIVMSG", tags=("account", "time"))
+    def tagged(self, _, line):
+        self.seen.append("tagged")
+
+    @event("commands", "PRIVMSG")
+    def always(self, _, line):
+        self.seen.append("always")
+
+
+class TestFilters(unittest.TestCase):
+    """Ensure handlers are only called for lines matching their filters."""
+
+    def setUp(self):
+        self.connection = new_connection(extensions=[Filtered])
+        self.filtered = self.connection.get_extension("Filtered")
+
+    def seen(self, line):
+        self.filtered.seen = []
+        self.connection.call_event("commands", "PRIVMSG", Line.parse(line))
+        return self.filtered.seen
+
+    def test_target(self):
+        """Ensure targets are matched using the casemapping."""
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #CHAN{A} :hi"),
+                         ["always", "chan"])
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #chan[a] :!cmd"),
+                         ["command", "always", "chan"])
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #other :!cmd"),
+                         ["command", "always"])
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #elsewhere :!cmd"),
+                         ["always"])
+
+    def test_case_change(self):
+        """Ensure targets are refolded when the casemapping changes."""
+        self.connection.isupport = {"CASEMAPPING": "ascii"}
+        self.connection.case_change()
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #CHAN{A} :hi"), ["always"])
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #CHAN[A] :hi"),
+                         ["always", "chan"])
+
+    def test_source_tags(self):
+        """Ensure sources and tags are matched."""
+        self.assertEqual(self.seen(":a!b@host.example.com PRIVMSG x :hi"),
+                         ["always", "source"])
+        self.assertEqual(self.seen("@time=1;account=a :a!b@c PRIVMSG x :hi"),
+                         ["always", "tagged"])
+        self.assertEqual(self.seen("@time=1 :a!b@c PRIVMSG x :hi"),
+                         ["always"])
+
+    def test_not_line(self):
+        """Ensure filtered handlers aren't called without a line."""
+        self.connection.call_event("commands", "PRIVMSG", None)
+        self.assertEqual(self.filtered.seen, ["always"])
+
+    def test_listener(self):
+        """Ensure filters apply when Taillight calls the slots."""
+        signal = self.connection.signals.get_signal(("commands", "PRIVMSG"))
+        signal.add(lambda *_: None, listener=object())
+        self.assertIsNone(signal.functions)
+        self.assertEqual(self.seen(":a!b@c PRIVMSG #chan{a} :!x"),
+                         ["command", "always", "chan"])
+
+    def test_results(self):
+        """Ensure rejected handlers are left out of the results either way."""
+        line = Line.parse(":a!b@c PRIVMSG #elsewhere :hi")
+        compiled = self.connection.call_event("commands", "PRIVMSG", line)[1]
+
+        signal = self.connection.signals.get_signal(("commands", "PRIVMSG"))
+        signal.add(lambda *_: "listener", listener=object())
+        self.assertIsNone(signal.functions)
+        fallback = self.connection.call_event("commands", "PRIVMSG", line)[1]
+
+        self.assertEqual(len(compiled), 1)
+        self.assertEqual(fallback, compiled)
+
+
+class Keeper(BaseExtension):
+    """Keep some of the events we are passed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+        self.kept = []
+
+    @event("test", "pool")
+    def pool(self, caller, keep):
+        self.events.append(id(caller))
+        if keep:
+            self.kept.append(caller)
+
+
+class TestEventPool(unittest.TestCase):
+    """Ensure events are reused only when nothing keeps them."""
+
+    def test_disabled(self):
+        """Ensure events are not pooled by default."""
+        connection = new_connection(extensions=[Keeper])
+        connection.fire_event("test", "pool", False)
+        self.assertEqual(connection.event_pool_size, 0)
+        self.assertEqual(connection._event_pool, [])
+
+    def test_reuse(self):
+        """Ensure events are reused, and kept events are not."""
+        connection = new_connection(extensions=[Keeper], event_pool_size=8)
+        keeper = connection.get_extension("Keeper")
+
+        connection.fire_event("test", "pool", False)
+        connection.fire_event("test", "pool", False)
+        self.assertEqual(keeper.events[0], keeper.events[1])
+
+        connection.fire_event("test", "pool", True)
+        connection.fire_event("test", "pool", False)
+        self.assertEqual(keeper.events[2], keeper.events[1])
+        self.assertNotEqual(keeper.events[3], keeper.events[2])
+        self.assertEqual(keeper.kept[0].eventname, ("test", "pool"))
+
+    def test_debug(self):
+        """Ensure kept events are reported in debug mode."""
+        connection = new_connection(extensions=[Keeper], event_pool_size=8,
+                                    event_pool_debug=True)
+        with self.assertLogs("PyIRC.base", "WARNING") as logs:
+            connection.fire_event("test", "pool", True)
+
+        self.assertIn("('test', 'pool')", logs.output[0])
@@ -0,0 +1,184 @@
+# Copyright © 2019 A. Wilcox and Elizabeth Myers.
+# All rights reserved.
+# This file is part of the PyIRC 3 project. See LICENSE in the root directory
+# for licensing information.
+
+
+"""Test syncing and looking up users with UserTrack."""
+
+
+import unittest
+
+from PyIRC.line import Line
+from PyIRC.numerics import Numerics
+from test_helpers import new_conn_with_handshake, join_line
+
+
+class TestUserTrack(unittest.TestCase):
+    """Test the behaviour of the UserTrack extension."""
+
+    def setUp(self):
+        extensions = ['BasicRFC', 'BaseTrack', 'ChannelTrack', 'UserTrack']
+        self.connection = new_conn_with_handshake(extensions=extensions)
+
+    def test_who_sync(self):
+        """Ensure joined channels are synced one coalesced WHO at a time."""
+        irc = self.connection
+        sync = irc.user_track.who_sync
+        sync.burst = sync.tokens = 2
+        sync.rate = 1
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'TARGMAX=WHO:2,NAMES:1',
+                                     'are supported by this server')))
+        sync.mark_hot('#HOT')
+
+        done = []
+        irc.signals.get_signal(('user', 'who_sync_done')).add(
+            lambda caller: done.append(sync.progress()))
+        irc.sendq.queue.clear()
+        for name in ('#a', '#b', '#c', '#hot'):
+            irc.inject_line(join_line(irc, name))
+            irc.inject_line(Line(hostmask='nonexistent.test.server',
+                                 command=Numerics.RPL_ENDOFNAMES,
+                                 params=(irc.nick, name, 'End of /NAMES')))
+
+        def who_end(mask):
+            irc.inject_line(Line(hostmask='nonexistent.test.server',
+                                 command=Numerics.RPL_ENDOFWHO,
+                                 params=(irc.nick, mask, 'End of /WHO')))
+
+        def sent():
+            return [line.params[0] for line in irc.draw_lines()
+                    if line.command == 'WHO']
+
+        # Only one request is outstanding, and hot channels go first
+        self.assertEqual(sent(), ['#a'])
+        self.assertEqual(sync.progress()[:3], (0, 3, 1))
+        who_end('#a')
+        self.assertEqual(sent(), ['#hot,#b'])
+        who_end('#hot,#b')
+
+        # The burst is used up, so the last waits for the rate
+        self.assertEqual(sent(), [])
+        self.assertIsNotNone(sync.send_timer)
+        progress = sync.progress()
+        self.assertEqual(progress[:3], (3, 1, 0))
+        self.assertGreater(progress.eta, 0)
+
+        sync.tokens = 1
+        sync.send_timer = None
+        sync.pump()
+        self.assertEqual(sent(), ['#c'])
+        who_end('#c')
+        self.assertEqual(done, [(4, 0, 0, 0)])
+
+    def test_whois_queue(self):
+        """Ensure unknown message senders are looked up once each, paced."""
+        irc = self.connection
+        queue = irc.user_track.whois_queue
+        queue.burst = queue.tokens = 1
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'WHOX',
+                                     'are supported by this server')))
+
+        # Not synced yet, so the channel WHO will cover its members
+        irc.inject_line(join_line(irc, '#sync'))
+        irc.sendq.queue.clear()
+
+        def message(mask, target=irc.nick):
+            irc.inject_line(Line(hostmask=mask, command='PRIVMSG',
+                                 params=(target, 'hello')))
+
+        def sent():
+            return [(line.command, line.params[0])
+                    for line in irc.draw_lines()
+                    if line.command in ('WHO', 'WHOIS')]
+
+        message('a!a@a.host')
+        message('b!b@b.host')
+        message('c!c@c.host')
+        message('d!d@d.host', '#sync')
+        self.assertEqual(sent(), [('WHO', 'a')])
+        self.assertEqual(queue.stats()[0], 2)
+        self.assertEqual(queue.stats().merged, 1)
+        self.assertFalse(queue.add('B'))
+        self.assertFalse(queue.add('A'))
+        self.assertEqual(queue.stats().merged, 3)
+        self.assertIsNotNone(queue.send_timer)
+
+        # Users who left are dropped
+        irc.inject_line(Line(hostmask='b!b@b.host', command='QUIT',
+                             params=('bye',)))
+        queue.tokens = 1
+        queue.send_timer = None
+        queue.pump()
+        self.assertEqual(sent(), [('WHO', 'c')])
+        self.assertEqual(queue.stats()[:2], (0, 0))
+        self.assertEqual(queue.stats()[2:4], (2, 1))
+
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ENDOFWHO,
+                             params=(irc.nick, 'c', 'End of /WHO')))
+        self.assertNotIn('c', queue.pending)
+        self.assertEqual(len(irc.user_track.whox_send), 1)
+
+        # Unanswered requests are given up on when the timer fires, so the
+        # user may be looked up again
+        self.assertFalse(queue.add('A'))
+        later = queue.clock() + queue.timeout + 1
+        queue.clock = lambda: later
+        with self.assertLogs('PyIRC.extensions.usertrack', 'WARNING'):
+            queue.expire_timer.action()
+
+        self.assertEqual(queue.requests, {})
+        self.assertIsNone(queue.expire_timer)
+        self.assertTrue(queue.add('A'))
+        self.assertEqual(sent(), [('WHO', 'A')])
+        self.assertIsNotNone(queue.expire_timer)
+        self.assertEqual(list(queue.requests), ['A'])
+        self.assertEqual(len(irc.user_track.whox_send), 1)
+
+    def test_whois_end_per_nick(self):
+        """Ensure WHOX requests end once each of their nicks is answered."""
+        irc = self.connection
+        queue = irc.user_track.whois_queue
+        irc.inject_line(Line(hostmask='nonexistent.test.server',
+                             command=Numerics.RPL_ISUPPORT,
+                             params=(irc.nick, 'WHOX', 'TARGMAX=WHO:2',
+                                     'are supported by this server')))
+        irc.sendq.queue.clear()
+
+        def who_end(mask):
+            irc.inject_line(Line(hostmask='nonexistent.test.server',
+                                 command=Numerics.RPL_ENDOFWHO,
+                                 params=(irc.nick, mask, 'End of /WHO')))
+
+        # The first is sent alone, as the burst only allows one at once
+        queue.burst = queue.tokens = 1
+        for nick in ('a', 'b', 'c'):
+            irc.inject_line(Line(hostmask='{0}!{0}@{0}.host'.format(nick),
+                                 command='PRIVMSG',
+                                 params=(irc.nick, 'hello')))
+
+        queue.tokens = 1
+        queue.send_timer = None
+        queue.pump()
+        masks = [line.params[0] for line in irc.draw_lines()
+                 if line.command == 'WHO']
+        self.assertEqual(masks, ['a', 'b,c'])
+
+        # Ended a nick at a time, in another case
+        who_end('C')
+        self.assertEqual(list(queue.requests), ['a', 'b,c'])
+        self.assertNotIn('c', queue.pending)
+        who_end('B')
+        self.assertEqual(list(queue.requests), ['a'])
+        self.assertIsNotNone(queue.expire_timer)
+
+        who_end('A')
+        self.assertEqual(queue.requests, {})
+        self.assertEqual(len(queue.pending), 0)
+        self.assertEqual(irc.user_track.whox_send, [])
+        self.assertIsNone(queue.expire_timer)